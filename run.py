@@ -0,0 +1,10 @@
+"""Run notitee from the repository root: python run.py --help"""
+
+import sys, os
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "src"))
+
+from cli import main
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,150 @@
+"""Full-history backtest of the built-in signals (hit rate, forward returns, drawdowns)"""
+
+import argparse
+import json
+import sys, os
+import time
+from datetime import datetime, timedelta
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from module import provider
+
+DEFAULT_START = "2000-01-01"
+SIGNALS = ("ma_stage", "sp500", "dollar", "feargreed")
+
+
+def load_closes(tickers, start, end):
+    """{ticker: Close series} through the price cache (only missing bars are downloaded)"""
+    from module.price_cache import download
+
+    frames = download(tickers, start, end)
+    return {
+        ticker: frame["Close"].iloc[:, 0].dropna()
+        for ticker, frame in frames.items()
+        if not frame.empty
+    }
+
+
+def load_fear_greed(path, start, end):
+    """Daily CNN Fear & Greed series from a date,value CSV, else the sentiment history cache"""
+    import pandas as pd
+
+    if path:
+        frame = pd.read_csv(path, parse_dates=["date"], index_col="date")
+        return frame["value"].astype(float).sort_index().loc[start:end]
+
+    from module import sentiment
+
+    series = sentiment.history("cnn")
+    sentiment.save()
+    series = series.loc[start:end]
+    return series if len(series) else None
+
+
+def run(signals, start, end, fear_greed_csv=None):
+    """Backtest each signal; returns {signal: {"asset", "labels", "strategy"}}"""
+    from module import backtest
+
+    closes = load_closes(["^GSPC", "DX=F", "USDKRW=X"], start, end)
+    spx = closes.get("^GSPC")
+
+    jobs = {}
+    if "ma_stage" in signals and spx is not None:
+        jobs["ma_stage"] = ("^GSPC", spx, backtest.ma_stage_signal(spx))
+    if "sp500" in signals and spx is not None:
+        jobs["sp500"] = ("^GSPC", spx, backtest.sp500_ma_signal(spx))
+    if "dollar" in signals and "DX=F" in closes and "USDKRW=X" in closes:
+        krw = closes["USDKRW=X"]
+        jobs["dollar"] = ("USDKRW=X", krw, backtest.dollar_gap_signal(closes["DX=F"], krw))
+    if "feargreed" in signals and spx is not None:
+        index = load_fear_greed(fear_greed_csv, start, end)
+        if index is None:
+            print("♦️ 공포탐욕 이력 없음 (--fear-greed CSV로 지정 가능) → 건너뜀")
+        else:
+            # 지수 거래일에 맞춤 (지수 이력이 없는 날은 신호 없음)
+            index = index.reindex(spx.index)
+            jobs["feargreed"] = ("^GSPC", spx, backtest.fear_greed_signal(index))
+
+    results = {}
+    for name, (asset, close, (labels, directions)) in jobs.items():
+        started = time.perf_counter()
+        table = backtest.evaluate(close, labels, directions)
+        strategy = backtest.equity(close, backtest.position(labels, directions))
+        results[name] = {
+            "asset": asset,
+            "period": [str(labels.index[0].date()), str(labels.index[-1].date())]
+            if len(labels)
+            else None,
+            "elapsed_ms": round((time.perf_counter() - started) * 1000, 2),
+            "labels": table.to_dict(orient="index"),
+            "strategy": strategy,
+        }
+    return results
+
+
+def report(results):
+    for name, result in results.items():
+        period = " ~ ".join(result["period"] or ["-"])
+        print(f"\n📊 {name} ({result['asset']}, {period}, {result['elapsed_ms']:.1f}ms)")
+        for label, row in result["labels"].items():
+            print(
+                f"  {label:<11} {row['direction']:+d} {row['days']:>6}일"
+                f"  20D {_pct(row['ret_20d'])} (적중 {_rate(row['hit_20d'])})"
+                f"  60D {_pct(row['ret_60d'])} (적중 {_rate(row['hit_60d'])})"
+                f"  120D 낙폭 {_pct(row['drawdown_120d'])}"
+            )
+        s = result["strategy"]
+        print(
+            f"  → 전략 CAGR {_pct(s['cagr'])}, MDD {_pct(s['max_drawdown'])},"
+            f" 보유 {s['exposure']:.0%} | 보유 전략 {_pct(s['buy_hold_return'])},"
+            f" MDD {_pct(s['buy_hold_max_drawdown'])}"
+        )
+
+
+def _pct(value):
+    return "   n/a" if value != value else f"{value * 100:+6.1f}%"
+
+
+def _rate(value):
+    return " n/a" if value != value else f"{value:4.0%}"
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--signals", nargs="+", choices=SIGNALS, default=list(SIGNALS))
+    parser.add_argument("--start", default=DEFAULT_START)
+    parser.add_argument("--end", default=None, help="exclusive end date (default: tomorrow)")
+    parser.add_argument("--fear-greed", help="CSV with date,value columns of CNN Fear & Greed")
+    parser.add_argument("--synthetic", type=int, metavar="SEED", help="use generated prices")
+    parser.add_argument("--out", help="also save the results as JSON")
+    args = parser.parse_args(argv)
+
+    if args.synthetic is not None:
+        provider.configure("synthetic", seed=args.synthetic)
+    end = args.end or str(provider.today() + timedelta(days=1))
+
+    started = time.perf_counter()
+    results = run(args.signals, args.start, end, args.fear_greed)
+    report(results)
+    print(f"\n⏱️ 전체 {time.perf_counter() - started:.2f}s")
+
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as f:
+            json.dump(
+                {
+                    "created": datetime.now().isoformat(timespec="seconds"),
+                    "start": args.start,
+                    "end": end,
+                    "results": results,
+                },
+                f,
+                ensure_ascii=False,
+                indent=2,
+                default=float,
+            )
+        print(f"📄 결과 저장: {args.out}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,169 @@
+"""Per-module benchmark (fetch / compute / notify) on a recorded fixture bundle"""
+
+import argparse
+import json
+import platform
+import statistics
+import sys, os
+import time
+from datetime import datetime
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from module import provider, registry, tracing
+from module.slack import set_send_enabled
+
+PHASES = ("fetch", "compute", "notify", "total")
+DEFAULT_THRESHOLD = 10.0  # %
+DEFAULT_MIN_MS = 1.0  # 이보다 짧은 단계는 잡음이 커서 비교하지 않음
+
+
+def measure(analysis, warm=False):
+    """Time one analysis from a cold price panel, split into phases (ms)
+
+    warm: keep the in-memory indicator states and Fear & Greed histories of the previous
+    run (as in daemon ticks); otherwise they are cleared too, as on a fresh start
+    """
+    from module import indicator_state, price_panel, sentiment
+    import fetcher
+
+    price_panel.reset()
+    tracing.reset()
+    if not warm:
+        indicator_state.reset()
+        sentiment.reset()
+    entry = registry.entry_point(analysis)
+
+    # fetch: 패널 prefetch + 모듈 안에서 직접 부른 다운로드/HTTP
+    # notify: Slack 전송, compute: 나머지
+    started = time.perf_counter()
+    fetcher.prefetch_prices([analysis])
+    prefetch_ms = (time.perf_counter() - started) * 1000
+
+    with tracing.span(analysis["label"], kind="module") as record:
+        entry()
+
+    children = [span for span in tracing.spans() if span["parent"] == analysis["label"]]
+    inner_fetch = sum(s["duration_ms"] for s in children if s["kind"] in ("download", "http"))
+    notify = sum(s["duration_ms"] for s in children if s["kind"] == "slack")
+    return {
+        "fetch": prefetch_ms + inner_fetch,
+        "compute": record["duration_ms"] - inner_fetch - notify,
+        "notify": notify,
+        "total": prefetch_ms + record["duration_ms"],
+    }
+
+
+def run(bundle, only=None, repeat=5, warmup=1):
+    """Benchmark every selected module on the bundle, reporting the median of each phase
+
+    results: every repeat starts cold (no indicator state / sentiment cache in memory)
+    warm: repeats that reuse the state left by the previous repeat
+    """
+    provider.configure("replay", bundle)
+    set_send_enabled(True)
+
+    results, warm = {}, {}
+    for analysis in registry.select(only):
+        for _ in range(warmup):
+            measure(analysis)
+        cold_samples = [measure(analysis) for _ in range(repeat)]
+        warm_samples = [measure(analysis, warm=True) for _ in range(repeat)]
+        results[analysis["key"]] = _medians(cold_samples)
+        warm[analysis["key"]] = _medians(warm_samples)
+    return {
+        "created": datetime.now().isoformat(timespec="seconds"),
+        "bundle": os.path.abspath(bundle),
+        "repeat": repeat,
+        "python": platform.python_version(),
+        "results": results,
+        "warm": warm,
+    }
+
+
+def compare(baseline, current, threshold=DEFAULT_THRESHOLD, min_ms=DEFAULT_MIN_MS):
+    """(module, phase, before, after, change %) for every phase slower than the threshold"""
+    regressions = []
+    for section, suffix in (("results", ""), ("warm", " (warm)")):
+        for key, phases in current.get(section, {}).items():
+            before_phases = baseline.get(section, {}).get(key)
+            if before_phases is None:
+                continue
+            for phase in PHASES:
+                before, after = before_phases.get(phase), phases.get(phase)
+                if before is None or after is None or max(before, after) < min_ms:
+                    continue
+                change = (after - before) / max(before, 1e-9) * 100
+                if change > threshold:
+                    regressions.append((key + suffix, phase, before, after, change))
+    return regressions
+
+
+def _medians(samples):
+    return {
+        phase: round(statistics.median(sample[phase] for sample in samples), 3)
+        for phase in PHASES
+    }
+
+
+def report(result):
+    print(f"\n⏱️ 벤치마크 ({result['bundle']}, 중앙값 {result['repeat']}회)")
+    for section, title in (("results", "cold (상태 초기화)"), ("warm", "warm (이전 실행 상태 재사용)")):
+        if section not in result:
+            continue
+        print(f"  [{title}]")
+        print(f"  {'모듈':<12}" + "".join(f"{phase:>12}" for phase in PHASES))
+        for key, phases in result[section].items():
+            print(f"  {key:<12}" + "".join(f"{phases[phase]:>10.1f}ms" for phase in PHASES))
+
+
+def _load(path):
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__)
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = commands.add_parser("run", help="benchmark modules on a fixture bundle")
+    run_parser.add_argument("--bundle", required=True, help="fixture bundle (run.py --record)")
+    run_parser.add_argument("--only", nargs="+", choices=registry.KEYS, metavar="MODULE")
+    run_parser.add_argument("--repeat", type=int, default=5)
+    run_parser.add_argument("--warmup", type=int, default=1)
+    run_parser.add_argument("--out", default="bench.json", help="where to save the results")
+
+    compare_parser = commands.add_parser("compare", help="flag phases slower than a baseline")
+    compare_parser.add_argument("baseline")
+    compare_parser.add_argument("current")
+    compare_parser.add_argument(
+        "--threshold", type=float, default=DEFAULT_THRESHOLD,
+        help="allowed slowdown in percent",
+    )
+    compare_parser.add_argument(
+        "--min-ms", type=float, default=DEFAULT_MIN_MS,
+        help="ignore phases shorter than this in both runs",
+    )
+    args = parser.parse_args(argv)
+
+    if args.command == "run":
+        result = run(args.bundle, args.only, args.repeat, args.warmup)
+        report(result)
+        with open(args.out, "w", encoding="utf-8") as f:
+            json.dump(result, f, ensure_ascii=False, indent=2)
+        print(f"\n📄 결과 저장: {args.out}")
+        return 0
+
+    regressions = compare(
+        _load(args.baseline), _load(args.current), args.threshold, args.min_ms
+    )
+    if not regressions:
+        print(f"✅ 기준 대비 {args.threshold:.0f}% 이상 느려진 단계 없음")
+        return 0
+    for key, phase, before, after, change in regressions:
+        print(f"♦️ {key} {phase}: {before:.1f}ms → {after:.1f}ms (+{change:.0f}%)")
+    return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
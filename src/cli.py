@@ -0,0 +1,116 @@
+"""notitee command line: run the daily market analysis"""
+
+import argparse
+import sys, os
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from module import provider, registry
+import fetcher
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="notitee", description=__doc__)
+    parser.add_argument(
+        "--only", nargs="+", choices=registry.KEYS, metavar="MODULE",
+        help=f"run only these modules ({', '.join(registry.KEYS)})",
+    )
+    parser.add_argument(
+        "--skip", nargs="+", choices=registry.KEYS, metavar="MODULE",
+        help="skip these modules",
+    )
+    parser.add_argument(
+        "--no-send", action="store_true",
+        help="compute and print the reports without posting to Slack",
+    )
+    parser.add_argument(
+        "--force", action="store_true",
+        help="run every module even if no new bar can exist or its inputs are unchanged",
+    )
+    parser.add_argument(
+        "--post-on-change", nargs="+", metavar="CHANNEL",
+        help="only post to these Slack channels when the report changed ('*' = all)",
+    )
+    parser.add_argument(
+        "--charts", action="store_true",
+        help="render price/MA, yield-curve and stage charts and upload the changed ones",
+    )
+    parser.add_argument(
+        "--workers", type=int, default=fetcher.MAX_WORKERS,
+        help="number of modules to run concurrently (1 = sequential)",
+    )
+    fixtures = parser.add_mutually_exclusive_group()
+    fixtures.add_argument(
+        "--record", metavar="DIR",
+        help="save every upstream response (prices, JSON APIs, Slack) to a fixture bundle",
+    )
+    fixtures.add_argument(
+        "--replay", metavar="DIR",
+        help="serve upstream responses from a recorded fixture bundle (no network)",
+    )
+    fixtures.add_argument(
+        "--synthetic", nargs="?", type=int, const=0, metavar="SEED",
+        help="run on generated market data (no network)",
+    )
+    parser.add_argument(
+        "--daemon", action="store_true",
+        help="keep running and refresh each module on its market's cadence",
+    )
+    parser.add_argument(
+        "--profile", choices=["cprofile", "sample"],
+        help="profile the run (cprofile runs modules sequentially)",
+    )
+    parser.add_argument(
+        "--profile-out", default="profile.txt",
+        help="where to write the sorted hot-function report",
+    )
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    if args.record:
+        provider.configure("record", args.record)
+    elif args.replay:
+        provider.configure("replay", args.replay)
+    elif args.synthetic is not None:
+        provider.configure("synthetic", seed=args.synthetic)
+
+    if args.post_on_change:
+        from module import result_cache
+
+        result_cache.set_post_on_change(args.post_on_change)
+
+    run_kwargs = {
+        "only": args.only,
+        "skip": args.skip,
+        "send": not args.no_send,
+        "workers": args.workers,
+        "force": args.force,
+        "charts": args.charts,
+    }
+
+    if args.daemon:
+        import daemon
+
+        if args.record or args.replay:
+            raise SystemExit("--daemon은 --record/--replay와 함께 쓸 수 없습니다")
+        run_kwargs.pop("force")
+        run_kwargs.pop("charts")
+        daemon.serve(**run_kwargs)
+    elif args.profile == "cprofile":
+        from module.profiler import profile_cprofile
+
+        # cProfile은 호출 스레드만 측정하므로 순차 실행
+        run_kwargs["workers"] = 1
+        profile_cprofile(fetcher.main, args.profile_out, **run_kwargs)
+    elif args.profile == "sample":
+        from module.profiler import profile_sampling
+
+        profile_sampling(fetcher.main, args.profile_out, **run_kwargs)
+    else:
+        fetcher.main(**run_kwargs)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,136 @@
+"""Long-running scheduler: run each analysis on its market's cadence in one warm process"""
+
+from datetime import timezone
+import signal
+import threading
+import time
+import sys, os
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from module import deadline, freshness, provider, registry, result_cache, slack_outbox, tracing
+from module.slack import set_send_enabled, slackout_summary
+import fetcher
+
+
+# 캘린더별 실행 주기 (분) - 장중에만 이 주기로 실행, 장 마감 후에는 확정 봉으로 한 번 더 실행
+# 이미 확정 봉을 보고한 시장은 다음 세션이 열릴 때까지 쉰다 (module.freshness)
+CADENCE_MINUTES = {
+    "crypto": int(os.getenv("NOTITEE_CRYPTO_MINUTES", "15")),
+    "us_equity": int(os.getenv("NOTITEE_EQUITY_MINUTES", "30")),
+    "cme": int(os.getenv("NOTITEE_CME_MINUTES", "30")),
+}
+SUMMARY_AT = os.getenv("NOTITEE_SUMMARY_AT", "16:10")  # UTC, 하루 한 번 종합 요약
+TICK_SECONDS = 30  # 스케줄 확인 주기
+
+
+def due(analyses, next_run, now):
+    """Analyses whose cadence has elapsed and that can have a new bar"""
+    return [
+        analysis
+        for analysis in analyses
+        if now >= next_run.get(analysis["key"], 0.0) and not freshness.is_stale(analysis)
+    ]
+
+
+def summary_due(now, sent_on):
+    """True once per UTC day, at or after SUMMARY_AT"""
+    hour, minute = map(int, SUMMARY_AT.split(":"))
+    return sent_on != now.date() and (now.hour, now.minute) >= (hour, minute)
+
+
+def tick(analyses, next_run, summaries, workers):
+    """Refresh prices and run the analyses that are due; returns how many ran"""
+    ready = due(analyses, next_run, time.monotonic())
+    if not ready:
+        return 0
+
+    started = time.perf_counter()
+    # 틱마다 실행 마감을 새로 잡음 (틱 사이의 Slack 발송에는 적용하지 않음)
+    deadline.start_run()
+    try:
+        with tracing.span("daemon.tick", kind="daemon", analyses=len(ready)):
+            # 이미 메모리에 있는 티커는 새 봉만 받고, 처음 보는 티커는 한 번에 다운로드
+            from module import price_panel
+
+            needs = registry.price_needs(ready)
+            if needs:
+                try:
+                    price_panel.refresh([ticker for ticker, _ in needs])
+                except Exception as e:
+                    print(f"♦️ 가격 갱신 오류: {e}")
+            fetcher.prefetch_prices(ready)
+
+            summaries.update(fetcher.run_analyses(ready, workers))
+    finally:
+        deadline.clear_run()
+
+    for analysis in ready:
+        minutes = CADENCE_MINUTES[analysis["calendar"]]
+        next_run[analysis["key"]] = time.monotonic() + minutes * 60
+    fetcher.save_state()
+
+    # 실행마다 span을 내보내고 비움 (메모리 누적 방지)
+    tracing.export_jsonl()
+    tracing.reset()
+    labels = ", ".join(analysis["label"] for analysis in ready)
+    print(f"⏱️ {labels} 갱신 ({time.perf_counter() - started:.2f}s)")
+    return len(ready)
+
+
+def send_summary(analyses, summaries):
+    """Daily summary from each analysis' latest summary line"""
+    lines = [
+        summaries[analysis["key"]] for analysis in analyses if summaries.get(analysis["key"])
+    ]
+    if lines:
+        slackout_summary("\n".join(f"• {line}" for line in lines))
+
+
+def serve(
+    only=None, skip=None, send=True, workers=fetcher.MAX_WORKERS, tick_seconds=TICK_SECONDS
+):
+    """Run until SIGINT/SIGTERM, keeping the interpreter, sessions and price panel warm"""
+    if provider.mode() in ("record", "replay"):
+        raise ValueError("데몬 모드는 live/synthetic 모드에서만 실행할 수 있습니다")
+
+    analyses = registry.select(only, skip)
+    stop = threading.Event()
+    for signum in (signal.SIGINT, signal.SIGTERM):
+        signal.signal(signum, lambda *_: stop.set())
+
+    set_send_enabled(send)
+    if send and not provider.is_offline():
+        slack_outbox.start()
+    # 틱마다 같은 리포트를 다시 올리지 않도록 기본은 모든 채널 "변경 시에만 전송"
+    # (--post-on-change / NOTITEE_POST_ON_CHANGE로 채널을 지정하면 그 채널만)
+    if not result_cache.POST_ON_CHANGE:
+        result_cache.set_post_on_change(["*"])
+
+    # 시작 시점에 이미 확정 봉을 보고한 모듈은 저장된 요약으로 채움
+    _, summaries = fetcher.split_stale(analyses)
+    next_run = {}
+    # 요약 시각 이후에 시작(재시작)했으면 오늘 요약은 이미 보낸 것으로 봄
+    now = provider.now(timezone.utc)
+    summary_sent_on = now.date() if summary_due(now, None) else None
+    print(
+        "🛰️ 데몬 시작 ("
+        + ", ".join(f"{name} {minutes}분" for name, minutes in CADENCE_MINUTES.items())
+        + f", 요약 {SUMMARY_AT} UTC)"
+    )
+
+    try:
+        while not stop.is_set():
+            tick(analyses, next_run, summaries, workers)
+
+            now = provider.now(timezone.utc)
+            if summary_due(now, summary_sent_on):
+                send_summary(analyses, summaries)
+                summary_sent_on = now.date()
+
+            stop.wait(tick_seconds)
+    finally:
+        slack_outbox.flush()
+        fetcher.save_state()
+        tracing.export_jsonl()
+        print("🛑 데몬 종료")
@@ -1,82 +1,250 @@
-from module.dollar_currency import dollar_currency_analysis
-from module.cnn_fear_greed import cnn_fear_greed_main
-from module.snp500_200ma import snp500_200ma_main
-from module.crypto_analysis import crypto_analysis_main
-from module.bond_yields import bond_yields_main
-from module.commodities import commodities_main
-from module.ma_stage_analysis import ma_stage_analysis_main
-from module.slack import slackout_summary
+from module.slack import repost, set_send_enabled, slackout_summary
+from module import (
+    deadline,
+    freshness,
+    provider,
+    registry,
+    result_cache,
+    slack_outbox,
+    tracing,
+)
+import queue
+import threading
+import time
 import sys, os
 
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+# 동시에 실행할 최대 모듈 수
+MAX_WORKERS = int(os.getenv("NOTITEE_WORKERS", len(registry.ANALYSES)))
 
-def main():
-    print("✨ 일일 시장 분석 시작...")
+# 분석 결과 기록(freshness/result_cache)과 상태 저장이 겹치지 않게 함
+# (마감 후에도 돌고 있는 분석 스레드가 저장 도중에 기록하지 않도록)
+_state_lock = threading.Lock()
 
-    # 각 모듈 실행하고 요약 데이터 수집
-    summaries = []
 
-    # 달러/환율 분석
-    try:
-        dollar_summary = dollar_currency_analysis()
-        if dollar_summary:
-            summaries.append(dollar_summary)
-    except Exception as e:
-        summaries.append("달러: 분석 오류")
-        print(f"♦️ 달러 분석 오류: {e}")
+def prefetch_prices(analyses):
+    """Gather the selected modules' price needs and download them in one batch"""
+    needs = registry.price_needs(analyses)
+    if not needs:
+        return
 
-    # CNN 공포탐욕지수
-    try:
-        feargreed_summary = cnn_fear_greed_main()
-        summaries.append(feargreed_summary)
-    except Exception as e:
-        summaries.append("공포탐욕: 분석 오류")
-        print(f"♦️ 공포탐욕 분석 오류: {e}")
+    # 가격 모듈이 선택된 경우에만 pandas/yfinance를 불러옴
+    from module import price_panel
 
-    # S&P 500 분석
+    price_panel.register(needs)
     try:
-        sp500_summary = snp500_200ma_main()
-        summaries.append(sp500_summary)
+        with tracing.span("price_panel.prefetch", kind="panel"):
+            price_panel.prefetch()
     except Exception as e:
-        summaries.append("S&P500: 분석 오류")
-        print(f"♦️ S&P500 분석 오류: {e}")
+        # 실패해도 각 모듈이 필요한 티커를 개별로 다시 조회함
+        print(f"♦️ 가격 패널 다운로드 오류: {e}")
 
-    # 암호화폐 분석
-    try:
-        crypto_summary = crypto_analysis_main()
-        summaries.append(crypto_summary)
-    except Exception as e:
-        summaries.append("암호화폐: 분석 오류")
-        print(f"♦️ 암호화폐 분석 오류: {e}")
 
-    # 채권 분석
-    try:
-        bond_summary = bond_yields_main()
-        summaries.append(bond_summary)
-    except Exception as e:
-        summaries.append("채권: 분석 오류")
-        print(f"♦️ 채권 분석 오류: {e}")
+def timed_out_summary(analysis):
+    """Summary line for a module that missed its time budget"""
+    return f"⏰ {analysis['label']}: 시간 초과"
 
-    # 원자재 분석
-    try:
-        commodity_summary = commodities_main()
-        summaries.append(commodity_summary)
-    except Exception as e:
-        summaries.append("원자재: 분석 오류")
-        print(f"♦️ 원자재 분석 오류: {e}")
 
-    # MA 단계 분석
+def run_analysis(analysis, force=False, abandoned=None):
+    """Import and run one analysis, turning any exception into its error summary line
+
+    abandoned: keys the caller stopped waiting for; their results are not recorded
+    """
+    label = analysis["label"]
+    # 리포트에 표시할 데이터 기준 시각 (이 스레드에서 보내는 Slack 메시지에 적용)
+    bar = freshness.latest_bar(analysis)
+    freshness.set_current(bar, analysis)
     try:
-        ma_summary = ma_stage_analysis_main()
-        summaries.append(ma_summary)
+        budget = analysis.get("budget", deadline.MODULE_SECONDS)
+        with deadline.budget(budget), tracing.span(label, kind="module") as record:
+            # 입력 지문이 같으면 다시 계산하지 않고 저장된 리포트/요약 재사용
+            key = result_cache.fingerprint(analysis)
+            cached = None if force else result_cache.lookup(analysis, key)
+            record["cached"] = cached is not None
+            if cached:
+                print(f"♻️ {label}: 입력 변경 없음 → 저장된 리포트 재사용")
+                repost(cached["messages"])
+                summary = cached["summary"]
+            else:
+                result_cache.start_capture()
+                summary = registry.entry_point(analysis)()
+                messages = result_cache.stop_capture()
+    except deadline.DeadlineExceeded as e:
+        print(f"⏰ {label} 시간 초과: {e}")
+        return timed_out_summary(analysis)
     except Exception as e:
-        summaries.append("MA단계: 분석 오류")
-        print(f"♦️ MA단계 분석 오류: {e}")
+        print(f"♦️ {label} 분석 오류: {e}")
+        return analysis["error_summary"]
+    finally:
+        result_cache.stop_capture()
+        freshness.set_current(None)
+
+    # 오류 요약은 다음 실행에서 다시 시도하도록 기록하지 않음
+    if summary and "오류" not in summary and summary != timed_out_summary(analysis):
+        with _state_lock:
+            # 요약에 "시간 초과"로 나간 분석은 늦게 끝나도 기록하지 않음 (다음 실행에서 다시)
+            if abandoned is not None and analysis["key"] in abandoned:
+                print(f"⏰ {label}: 실행 마감 후 종료 → 결과 기록 생략")
+                return summary
+            freshness.record(analysis, freshness.observed(analysis, bar), summary)
+            if not cached:
+                result_cache.store(analysis, key, messages, summary)
+    return summary
+
+
+def split_stale(analyses, force=False):
+    """(analyses to run, {key: cached summary} for those with no possible new bar)"""
+    if force:
+        return analyses, {}
+    fresh, cached = [], {}
+    for analysis in analyses:
+        if freshness.is_stale(analysis):
+            print(f"💤 {analysis['label']}: 새 봉 없음 → 건너뜀")
+            cached[analysis["key"]] = freshness.cached_summary(analysis)
+        else:
+            fresh.append(analysis)
+    return fresh, cached
+
+
+def run_concurrently(analyses, workers, force=False):
+    """Run analyses on worker threads, slowest first, returning summaries in order
+
+    Modules still running when the summary has to go out are reported as timed out.
+    """
+    # 오래 걸리는 모듈부터 꺼내 실행
+    pending = queue.SimpleQueue()
+    for analysis in sorted(analyses, key=lambda analysis: analysis["weight"], reverse=True):
+        pending.put(analysis)
+    results = {}
+    abandoned = set()
+    finished = threading.Condition()
+
+    def worker():
+        while True:
+            try:
+                analysis = pending.get_nowait()
+            except queue.Empty:
+                return
+            with _state_lock:
+                if analysis["key"] in abandoned:
+                    continue  # 마감까지 시작하지 못한 모듈
+            summary = run_analysis(analysis, force, abandoned)
+            with finished:
+                results[analysis["key"]] = summary
+                finished.notify_all()
+
+    # 데몬 스레드: 마감 후에도 끝나지 않은 모듈이 프로세스 종료를 막지 않음
+    for number in range(min(workers, len(analyses))):
+        threading.Thread(target=worker, name=f"analysis-{number}", daemon=True).start()
+
+    with finished:
+        finished.wait_for(lambda: len(results) == len(analyses), deadline.collect_timeout())
+        late = [analysis for analysis in analyses if analysis["key"] not in results]
+        with _state_lock:
+            abandoned.update(analysis["key"] for analysis in late)
+        done = dict(results)
+
+    summaries = []
+    for analysis in analyses:
+        if analysis["key"] in done:
+            summaries.append(done[analysis["key"]])
+        else:
+            # 시작 전이면 건너뛰고, 실행 중이면 남은 네트워크 호출이 예산 초과로 곧 실패함
+            print(f"⏰ {analysis['label']}: 실행 마감까지 끝나지 않음")
+            summaries.append(timed_out_summary(analysis))
+    return summaries
+
+
+def run_analyses(analyses, workers=MAX_WORKERS, force=False):
+    """{key: summary} for the analyses (workers <= 1 runs them on the calling thread)"""
+    if workers <= 1:
+        # 순차 실행 (호출 스레드에서 실행 - cProfile 측정용)
+        summaries = []
+        for analysis in analyses:
+            left = deadline.collect_timeout()
+            if left is not None and left <= 0:
+                summaries.append(timed_out_summary(analysis))
+            else:
+                summaries.append(run_analysis(analysis, force))
+    else:
+        summaries = run_concurrently(analyses, workers, force)
+    return dict(zip([analysis["key"] for analysis in analyses], summaries))
+
+
+def save_state():
+    """Persist what the next run needs to skip or resume work"""
+    # 분석별 마지막 봉/요약, 입력 지문/리포트 (저장 중에는 분석 스레드가 기록하지 않음)
+    with _state_lock:
+        freshness.save()
+        result_cache.save()
+
+    # 티커별 지표 상태 (다음 실행은 새 봉만 반영)
+    # pandas를 불러오므로 여기서 import (fetcher import 시간 유지)
+    from module import indicator_state
+
+    indicator_state.save()
+
+    # 공포탐욕지수 이력 (다음 실행은 만료 전이면 요청하지 않음)
+    from module import sentiment
+
+    sentiment.save()
+
+
+def main(only=None, skip=None, send=True, workers=MAX_WORKERS, force=False, charts=False):
+    print("✨ 일일 시장 분석 시작...")
+    started = time.perf_counter()
+    # 실행 전체 마감 (NOTITEE_DEADLINE_SECONDS) - 요약은 마감 전에 전송
+    deadline.start_run()
+    selected = registry.select(only, skip)
+
+    # 마지막 실행 이후 새 봉이 생길 수 없는 모듈은 다운로드/전송 없이 이전 요약 사용
+    analyses, cached = split_stale(selected, force)
+
+    # Slack 메시지는 백그라운드로 전송 (이전 실행의 미전송분 포함)
+    # 재생/합성 모드는 스풀을 건드리지 않고 호출 순서대로 바로 기록
+    set_send_enabled(send)
+    if send and not provider.is_offline():
+        slack_outbox.start()
+
+    # 선택된 모듈의 가격 데이터를 한 번에 다운로드
+    prefetch_prices(analyses)
+
+    # 모듈 실행 (요약은 레지스트리 순서대로 수집)
+    summaries = run_analyses(analyses, workers, force)
+    summaries = [
+        summaries.get(analysis["key"], cached.get(analysis["key"])) for analysis in selected
+    ]
 
     # 종합 요약 메시지 전송
-    final_summary = "\n".join([f"• {summary}" for summary in summaries])
-    slackout_summary(final_summary)
+    final_summary = "\n".join([f"• {summary}" for summary in summaries if summary])
+    if tracing.TIMING_FOOTER:
+        final_summary += "\n" + tracing.timing_footer(time.perf_counter() - started)
+    if analyses:
+        slackout_summary(final_summary)
+    else:
+        print("💤 새 데이터 없음 - 요약 전송 생략")
+
+    # 차트: 입력이 바뀐 차트만 다시 그려서 한 번에 업로드 (요약 전송 후, 마감 전까지)
+    left = deadline.collect_timeout()
+    if charts and analyses and (left is None or left > 0):
+        from module import charts as chart_pipeline
+
+        chart_pipeline.publish(analyses)
+
+    # 남은 메시지 전송 대기 (마감까지), 실패분은 스풀에 저장
+    left = deadline.run_remaining()
+    slack_outbox.flush(slack_outbox.FLUSH_TIMEOUT if left is None else max(left, 1.0))
+    deadline.clear_run()
+
+    # 다음 실행용 상태 저장
+    save_state()
+
+    # 단계별 소요시간 기록 (NOTITEE_TRACE_FILE)
+    tracing.export_jsonl()
+
+    # 녹화 모드: 이번 실행의 모든 외부 응답을 fixture 번들로 저장
+    provider.save()
 
     print("✅ 일일 시장 분석 완료!")
 
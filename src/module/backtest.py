@@ -0,0 +1,215 @@
+import numpy as np
+import pandas as pd
+
+from module.crossover import detect_ma_crosses
+from module.indicators import rolling_min, sma
+import sys, os
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+# 내장 매매 신호의 전체 기간 백테스트 (하루씩 함수를 부르지 않고 배열 연산으로 한 번에)
+# 신호 함수는 날짜별 라벨(Series)과 라벨별 방향(+1 매수 / 0 관망 / -1 매도)을 돌려주고,
+# evaluate()가 라벨별 적중률/선행 수익률/선행 낙폭을, equity()가 신호대로 매매한 성과를 계산한다.
+HORIZONS = (5, 20, 60, 120)  # 선행 수익률 기간 (거래일)
+TRADING_DAYS = 252
+
+
+def forward_returns(close, horizons=HORIZONS):
+    """(date x horizon) frame of close[t + h] / close[t] - 1 (NaN past the end)"""
+    values = close.to_numpy(dtype=float)
+    out = {}
+    for h in horizons:
+        ahead = np.full(len(values), np.nan)
+        ahead[:-h] = values[h:]
+        out[h] = ahead / values - 1
+    return pd.DataFrame(out, index=close.index)
+
+
+def forward_drawdown(close, horizon):
+    """Worst close within the next `horizon` bars relative to close[t] (<= 0 when it dips)"""
+    values = close.to_numpy(dtype=float)
+    # t+1..t+h 구간 최저가 = h일 롤링 최저가를 h만큼 앞으로 당긴 값
+    lows = np.full(len(values), np.nan)
+    window_low = rolling_min(values, horizon)
+    lows[:-horizon] = window_low[horizon:]
+    return pd.Series(np.minimum(lows / values - 1, 0.0), index=close.index)
+
+
+def evaluate(close, labels, directions, horizons=HORIZONS):
+    """Per-label count, hit rate and mean forward return per horizon, plus mean drawdown
+
+    hit rate: share of days where the forward return had the label's sign
+    (+1 → up, -1 → down; not defined for 0)
+    """
+    labels = labels.reindex(close.index)
+    fwd = forward_returns(close, horizons)
+    drawdown = forward_drawdown(close, max(horizons))
+
+    rows = {}
+    for label, direction in directions.items():
+        mask = (labels == label).to_numpy()
+        row = {"direction": direction, "days": int(mask.sum())}
+        for h in horizons:
+            ret = fwd[h].to_numpy()[mask]
+            ret = ret[~np.isnan(ret)]
+            row[f"ret_{h}d"] = float(ret.mean()) if len(ret) else np.nan
+            row[f"hit_{h}d"] = (
+                float((np.sign(ret) == direction).mean()) if len(ret) and direction else np.nan
+            )
+        dd = drawdown.to_numpy()[mask]
+        dd = dd[~np.isnan(dd)]
+        row[f"drawdown_{max(horizons)}d"] = float(dd.mean()) if len(dd) else np.nan
+        rows[label] = row
+    return pd.DataFrame.from_dict(rows, orient="index")
+
+
+def equity(close, position):
+    """Performance of holding `position` (+1 long, 0 flat, -1 short) from the next bar"""
+    returns = close.pct_change().fillna(0.0).to_numpy()
+    # 신호가 나온 다음 봉부터 보유 (당일 종가로 매매한다고 가정)
+    held = position.reindex(close.index).shift(1).fillna(0.0).to_numpy()
+    strategy = held * returns
+
+    curve = np.cumprod(1 + strategy)
+    benchmark = np.cumprod(1 + returns)
+    years = max(len(close) / TRADING_DAYS, 1e-9)
+    active = held != 0
+    return {
+        "total_return": float(curve[-1] - 1),
+        "cagr": float(curve[-1] ** (1 / years) - 1),
+        "max_drawdown": _max_drawdown(curve),
+        "exposure": float(active.mean()),
+        "hit_rate": float((strategy[active] > 0).mean()) if active.any() else np.nan,
+        "buy_hold_return": float(benchmark[-1] - 1),
+        "buy_hold_max_drawdown": _max_drawdown(benchmark),
+    }
+
+
+def position(labels, directions):
+    """Daily position implied by the labels' directions"""
+    return labels.map(directions).fillna(0.0).astype(float)
+
+
+# === 신호 (모듈의 판단 규칙을 전체 기간 배열로) ===
+# determine_stage의 배열 순서 → (스테이지, 방향)
+STAGE_DIRECTIONS = {1: 1, 2: 0, 3: -1, 4: -1, 5: 0, 6: 1, 0: 0}
+
+
+def ma_stage_signal(close, windows=(5, 20, 40)):
+    """6-stage MA arrangement (ma_stage_analysis.determine_stage) for every day"""
+    short, mid, long = (sma(close, window) for window in windows)
+    conditions = [
+        (short > mid) & (mid > long),
+        (mid > short) & (short > long),
+        (mid > long) & (long > short),
+        (long > mid) & (mid > short),
+        (long > short) & (short > mid),
+        (short > long) & (long > mid),
+    ]
+    stage = pd.Series(np.select(conditions, [1, 2, 3, 4, 5, 6], 0), index=close.index)
+    return stage[long.notna()], dict(STAGE_DIRECTIONS)
+
+
+def fear_greed_signal(index, buy=35, sell=80):
+    """cnn_fear_greed_main decision (buy below `buy`, sell above `sell`)"""
+    labels = np.select([index > sell, index < buy], ["sell", "buy"], "hold")
+    labels = pd.Series(labels, index=index.index)[index.notna()]
+    return labels, {"buy": 1, "hold": 0, "sell": -1}
+
+
+def dollar_gap_signal(dollar_index, usd_krw, band=5.0, window="365D"):
+    """dollar_currency_analysis fair-value gap: sell USD above +band %, buy below -band %"""
+    frame = pd.concat({"dxy": dollar_index, "krw": usd_krw}, axis=1).dropna()
+    # 1년 중앙값 대비 달러 인덱스로 적정 환율 추정 (시간 기준 롤링 창)
+    dxy_median = frame["dxy"].rolling(window).median()
+    krw_median = frame["krw"].rolling(window).median()
+    fair = krw_median * (frame["dxy"] / dxy_median)
+    gap = (frame["krw"] / fair - 1) * 100
+
+    labels = np.select([gap > band, gap < -band], ["sell", "buy"], "hold")
+    return pd.Series(labels, index=frame.index), {"buy": 1, "hold": 0, "sell": -1}
+
+
+SP500_DIRECTIONS = {
+    "golden": 1,
+    "death": -1,
+    "strong_buy": 1,
+    "buy": 1,
+    "watch": 0,
+    "sell": -1,
+    "bear": -1,
+}
+
+
+def sp500_ma_signal(close, cross_days=5, buckets=(10, 0, -5, -10)):
+    """snp500_200ma_main decision: recent 50/200 cross first, then 200MA distance buckets"""
+    ma200 = sma(close, 200)
+    diff = (close / ma200 - 1) * 100
+
+    # 최근 cross_days 봉 안의 첫 크로스 (전체 기간 이벤트를 날짜 배열로 펼침)
+    events = detect_ma_crosses(close, [(50, 200)]).reset_index()
+    marks = pd.Series(np.nan, index=close.index)
+    marks[events["date"]] = np.where(events["direction"] == "golden", 1.0, -1.0)
+    recent = marks.ffill(limit=cross_days - 1)
+
+    strong, buy, watch, sell = buckets
+    labels = np.select(
+        [
+            recent == 1,
+            recent == -1,
+            diff > strong,
+            diff > buy,
+            diff > watch,
+            diff > sell,
+        ],
+        ["golden", "death", "strong_buy", "buy", "watch", "sell"],
+        "bear",
+    )
+    return pd.Series(labels, index=close.index)[ma200.notna()], dict(SP500_DIRECTIONS)
+
+
+# analyze_inflation_signals의 원자재 가중치 (티커 → 가중치)
+INFLATION_WEIGHTS = {"CL=F": 0.5, "HG=F": 0.3, "ZW=F": 0.2}
+INFLATION_DIRECTIONS = {
+    "strong_inflation": 1,
+    "inflation": 1,
+    "stable": 0,
+    "deflation": -1,
+    "strong_deflation": -1,
+}
+
+
+def commodity_change(closes, weights=INFLATION_WEIGHTS, days=30):
+    """Weighted `days`-calendar-day % change of the commodities (weights of those present)"""
+    changes, present = 0.0, 0.0
+    for ticker, weight in weights.items():
+        close = closes[ticker].dropna()
+        # 기준가 = days일 전 (또는 그 직전 거래일) 종가
+        before = close.shift(freq=f"{days}D").reindex(close.index, method="ffill")
+        change = (close / before - 1) * 100
+        changes = change.mul(weight).add(changes, fill_value=0.0)
+        present = change.notna().mul(weight).add(present, fill_value=0.0)
+    return (changes / present).dropna()
+
+
+def commodity_basket(closes, weights=INFLATION_WEIGHTS):
+    """Weighted geometric index of the commodities (days where all of them traded)"""
+    frame = pd.concat({ticker: closes[ticker] for ticker in weights}, axis=1).dropna()
+    logs = np.log(frame / frame.iloc[0])
+    return np.exp(sum(logs[ticker] * weight for ticker, weight in weights.items()))
+
+
+def inflation_signal(change, strong=8, mild=3):
+    """analyze_inflation_signals decision on the weighted commodity change"""
+    labels = np.select(
+        [change > strong, change > mild, change < -strong, change < -mild],
+        ["strong_inflation", "inflation", "strong_deflation", "deflation"],
+        "stable",
+    )
+    return pd.Series(labels, index=change.index), dict(INFLATION_DIRECTIONS)
+
+
+def _max_drawdown(curve):
+    peaks = np.maximum.accumulate(curve)
+    return float((curve / peaks - 1).min())
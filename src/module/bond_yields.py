@@ -1,41 +1,59 @@
 from datetime import datetime, date, timedelta
 import pandas as pd
-import yfinance as yf
-import time
 
+from module import yield_curve
 from module.slack import slackout_bonds, slackout_summary
 import sys, os
 
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+# 분석할 채권들
+BONDS = [
+    ("^TNX", "미국 10년 국채", "🇺🇸"),
+    ("^FVX", "미국 5년 국채", "🇺🇸"),
+    ("^IRX", "미국 3개월 국채", "🇺🇸"),
+    ("^TYX", "미국 30년 국채", "🇺🇸"),
+]
 
-def analyze_bond_yield(ticker, name, emoji):
+# 스프레드 백분위/역전 이력용 조회기간 (개별 채권 분석은 최근 1년만 사용)
+HISTORY_DAYS = yield_curve.HISTORY_DAYS
+
+# 실행 전 가격 패널에 등록할 (티커, 조회기간) 목록
+PRICE_NEEDS = [(ticker, HISTORY_DAYS) for ticker, _, _ in BONDS]
+
+
+def recent(yields, ticker, days=365):
+    """Last `days` calendar days of one ticker's yields (%) from the aligned matrix"""
+    if ticker not in yields.columns:
+        return pd.Series(dtype=float)
+    series = yields[ticker].dropna()
+    if series.empty:
+        return series
+    return series[series.index >= series.index[-1] - pd.Timedelta(days=days)]
+
+
+def analyze_bond_yield(ticker, name, emoji, yields=None):
     """Analyze bond yield data"""
     try:
-        # 1년간 데이터 다운로드
-        start_date = str(date.today() - timedelta(days=365))
-        end_date = str(date.today() + timedelta(days=1))
-
-        data = yf.download(
-            ticker, start=start_date, end=end_date, progress=False, auto_adjust=True
-        )
+        # 1년간 데이터 (정렬된 수익률 행렬에서 잘라 씀)
+        if yields is None:
+            yields = yield_curve.matrix([ticker], days=365)
+        data = recent(yields, ticker)
 
         if data.empty:
             return f"⚠️ {name} 데이터를 가져올 수 없습니다."
 
-        data = data.dropna()
-
         if len(data) < 10:
             return f"⚠️ {name} 충분한 데이터가 없습니다."
 
-        # 현재 수익률
-        current_yield = float(data.iloc[-1, 3])  # Close price
+        # 현재 수익률 (종가)
+        current_yield = float(data.iloc[-1])
 
         # 과거 수익률들
-        yield_1d = float(data.iloc[-2, 3]) if len(data) >= 2 else current_yield
-        yield_7d = float(data.iloc[-8, 3]) if len(data) >= 8 else current_yield
-        yield_30d = float(data.iloc[-31, 3]) if len(data) >= 31 else current_yield
-        yield_1y_ago = float(data.iloc[0, 3])
+        yield_1d = float(data.iloc[-2]) if len(data) >= 2 else current_yield
+        yield_7d = float(data.iloc[-8]) if len(data) >= 8 else current_yield
+        yield_30d = float(data.iloc[-31]) if len(data) >= 31 else current_yield
+        yield_1y_ago = float(data.iloc[0])
 
         # 변화량 계산 (basis points)
         change_1d = (current_yield - yield_1d) * 100
@@ -44,8 +62,8 @@ def analyze_bond_yield(ticker, name, emoji):
         change_1y = (current_yield - yield_1y_ago) * 100
 
         # 52주 고점/저점
-        high_52w = float(data["Close"].max().item())
-        low_52w = float(data["Close"].min().item())
+        high_52w = float(data.max())
+        low_52w = float(data.min())
 
         # 트렌드 판단
         trend_emoji = "⬆️" if change_7d > 10 else "⬇️" if change_7d < -10 else "➡️"
@@ -74,38 +92,30 @@ def analyze_bond_yield(ticker, name, emoji):
         return f"⚠️ {name} 분석 중 오류 발생: {str(e)}"
 
 
-def calculate_yield_curve_spread():
-    """Calculate yield curve spreads"""
+def calculate_yield_curve_spread(yields=None):
+    """Calculate yield curve spreads with their historical rank and inversion state"""
     try:
-        # 2년, 10년 국채 수익률
-        tickers = ["^TNX", "^FVX"]  # 10년, 5년 (2년 대신)
+        stats = yield_curve.analyze(yields)
+        main = stats.get("10Y-5Y")
 
-        end_date = str(date.today() + timedelta(days=1))
-        start_date = str(date.today() - timedelta(days=30))
+        if main:
+            spread = main["spread_bp"]
 
-        data_10y = yf.download(
-            "^TNX", start=start_date, end=end_date, progress=False, auto_adjust=True
-        )
-        data_5y = yf.download(
-            "^FVX", start=start_date, end=end_date, progress=False, auto_adjust=True
-        )
-
-        if not data_10y.empty and not data_5y.empty:
-            current_10y = float(data_10y.iloc[-1, 3])
-            current_5y = float(data_5y.iloc[-1, 3])
-
-            # 10Y-5Y 스프레드
-            spread = current_10y - current_5y
-
-            # 역전 여부 판단
+            # 역전 여부 판단 (10Y-5Y, bp)
             if spread < 0:
                 spread_status = "🔴 역전 (Inverted)"
-            elif spread < 0.5:
+            elif spread < 50:
                 spread_status = "🟡 평탄화 (Flattening)"
             else:
                 spread_status = "🟢 정상 (Normal)"
 
-            return f"📊 10Y-5Y 스프레드: {spread:.2f}bp {spread_status}"
+            lines = [
+                f"📊 10Y-5Y 스프레드: {spread:+.0f}bp {spread_status}",
+                f"- 만기 쌍별 스프레드 (백분위: {main['history_start']} 이후)",
+            ]
+            for pair, pair_stats in stats.items():
+                lines.append(f"  {pair}: " + _spread_line(pair_stats))
+            return "\n".join(lines)
 
     except Exception as e:
         print(f"수익률 곡선 계산 실패: {e}")
@@ -113,46 +123,45 @@ def calculate_yield_curve_spread():
     return "⚠️ 수익률 곡선 데이터 없음"
 
 
+def _spread_line(stats):
+    parts = [f"{stats['spread_bp']:+.0f}bp", f"백분위 {stats['percentile']:.0f}%"]
+    if stats["inverted"]:
+        parts.append(f"🔴 역전 {stats['days']}일째 ({stats['since']}~)")
+    elif stats["last_end"]:
+        parts.append(f"마지막 역전 종료 {stats['last_end']}")
+    if stats["longest_days"]:
+        parts.append(f"최장 역전 {stats['longest_days']}일 ({stats['longest_start']}~)")
+    return " | ".join(parts)
+
+
 def bond_yields_main():
     """Main function for bond yield analysis"""
 
-    # 분석할 채권들
-    bonds = [
-        ("^TNX", "미국 10년 국채", "🇺🇸"),
-        ("^FVX", "미국 5년 국채", "🇺🇸"),
-        ("^IRX", "미국 3개월 국채", "🇺🇸"),
-        ("^TYX", "미국 30년 국채", "🇺🇸"),
-    ]
-
     messages = []
 
     # 제목 메시지
     title_message = "📊 *채권 수익률 분석* 📊"
     messages.append(title_message)
 
+    # 모든 만기를 날짜로 정렬한 수익률 행렬 (한 번만 조회)
+    yields = yield_curve.matrix([ticker for ticker, _, _ in BONDS], days=HISTORY_DAYS)
+
     # 수익률 곡선 스프레드
-    spread_message = calculate_yield_curve_spread()
+    spread_message = calculate_yield_curve_spread(yields)
     messages.append(spread_message)
 
     # 각 채권 분석
-    for ticker, name, emoji in bonds:
-        analysis = analyze_bond_yield(ticker, name, emoji)
+    for ticker, name, emoji in BONDS:
+        analysis = analyze_bond_yield(ticker, name, emoji, yields)
         messages.append(analysis)
-        time.sleep(1)  # API 호출 제한 고려
 
     # Fed 금리 정책 힌트
     try:
         # 10년 국채 수익률로 정책 힌트
-        data = yf.download(
-            "^TNX",
-            start=str(date.today() - timedelta(days=7)),
-            end=str(date.today() + timedelta(days=1)),
-            progress=False,
-            auto_adjust=True,
-        )
+        data = recent(yields, "^TNX", days=7)
         if not data.empty:
-            current_10y = float(data.iloc[-1, 3])
-            week_ago_10y = float(data.iloc[0, 3]) if len(data) > 1 else current_10y
+            current_10y = float(data.iloc[-1])
+            week_ago_10y = float(data.iloc[0]) if len(data) > 1 else current_10y
             change_week = current_10y - week_ago_10y
 
             if change_week > 0.2:
@@ -173,15 +182,9 @@ def bond_yields_main():
 
     # 요약 정보 반환
     try:
-        data_10y = yf.download(
-            "^TNX",
-            start=str(date.today() - timedelta(days=2)),
-            end=str(date.today() + timedelta(days=1)),
-            progress=False,
-            auto_adjust=True,
-        )
+        data_10y = recent(yields, "^TNX", days=2)
         if not data_10y.empty:
-            current_10y = float(data_10y.iloc[-1, 3])
+            current_10y = float(data_10y.iloc[-1])
             summary_data = f"채권: 10Y {current_10y:.2f}%"
         else:
             summary_data = "채권: 수익률 분석 오류 ♦️"
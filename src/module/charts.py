@@ -0,0 +1,283 @@
+from concurrent.futures import ProcessPoolExecutor
+import hashlib
+import json
+import tempfile
+import time
+import numpy as np
+
+from module import provider, registry
+from module.tracing import span
+import sys, os
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+# 분석별 차트(가격/이동평균, 수익률 곡선, MA 스테이지)를 한 번에 그려 Slack에 올리는 파이프라인
+# - 차트 사양(종류, 제목, 입력 배열)의 해시를 파일 이름으로 써서, 입력이 같은 차트는 다시 그리지 않는다
+# - 새 차트만 워커 프로세스에서 헤드리스(Agg)로 그리고, 한 메시지로 묶어서 업로드한다
+# 캐시 디렉터리는 live 모드에서만 유지하고, 녹화/재생/합성 모드는 실행마다 임시 디렉터리를 쓴다.
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+CACHE_DIR = os.path.join(
+    os.getenv("NOTITEE_CACHE_DIR", os.path.join(ROOT_DIR, ".cache")), "charts"
+)
+KEEP_DAYS = 14  # 이 기간 동안 쓰이지 않은 이미지는 삭제
+CHART_DAYS = 365  # 가격 차트 기간 (가격 패널 조회기간과 같게)
+STAGE_BARS = 120  # 스테이지 차트 봉 수
+
+_run_dir = None  # 녹화/재생/합성 모드의 실행별 임시 디렉터리
+
+# 그리는 코드가 바뀌면 모든 차트를 다시 그림
+with open(__file__, "rb") as _f:
+    RENDER_VERSION = hashlib.sha256(_f.read()).hexdigest()[:12]
+
+STAGE_COLORS = {
+    1: "#2e7d32",
+    2: "#9e9d24",
+    3: "#ef6c00",
+    4: "#c62828",
+    5: "#6a1b9a",
+    6: "#1565c0",
+}
+
+
+def price_ma(ticker, title, windows, days=CHART_DAYS):
+    """Close with moving averages"""
+    from module.indicators import sma
+    from module.price_panel import get_history
+
+    data = get_history(ticker, days=days)
+    if data.empty:
+        return None
+    close = data["Close"].iloc[:, 0].dropna()
+    lines = {"Close": close.to_numpy(dtype=float)}
+    for window in windows:
+        lines[f"MA{window}"] = np.asarray(sma(close, window), dtype=float)
+    return _spec("price_ma", f"{ticker}-ma", title, close.index, lines)
+
+
+def stage(ticker, title, windows=(5, 20, 40), bars=STAGE_BARS):
+    """Close with the three stage MAs, shaded by MA stage"""
+    from module.backtest import ma_stage_signal
+    from module.indicators import sma
+    from module.price_panel import get_history
+
+    data = get_history(ticker, days=CHART_DAYS)
+    if data.empty:
+        return None
+    close = data["Close"].iloc[:, 0].dropna()
+    stages, _ = ma_stage_signal(close, windows)
+    lines = {"Close": close.to_numpy(dtype=float)}
+    for window in windows:
+        lines[f"MA{window}"] = np.asarray(sma(close, window), dtype=float)
+    lines = {name: values[-bars:] for name, values in lines.items()}
+    lines["stage"] = stages.reindex(close.index).fillna(0).to_numpy(dtype=float)[-bars:]
+    return _spec("stage", f"{ticker}-stage", title, close.index[-bars:], lines)
+
+
+def yield_curve(bonds, title):
+    """Treasury yields by maturity: now, 1 month and 1 year ago"""
+    from module.price_panel import get_history
+
+    # (티커, 만기(년)) - 3개월물부터 30년물까지
+    maturities = {"^IRX": 0.25, "^FVX": 5, "^TNX": 10, "^TYX": 30}
+    points = []
+    for ticker, _, _ in bonds:
+        data = get_history(ticker, days=CHART_DAYS)
+        if ticker not in maturities or data.empty:
+            continue
+        close = data["Close"].iloc[:, 0].dropna()
+        if len(close) < 22:
+            continue
+        points.append(
+            (maturities[ticker], close.iloc[-1], close.iloc[-22], close.iloc[0], close.index[-1])
+        )
+    if len(points) < 2:
+        return None
+    points.sort()
+    lines = {
+        "maturity": np.array([point[0] for point in points], dtype=float),
+        "now": np.array([point[1] for point in points], dtype=float),
+        "1M ago": np.array([point[2] for point in points], dtype=float),
+        "1Y ago": np.array([point[3] for point in points], dtype=float),
+    }
+    return _spec("yield_curve", "yield-curve", title, [max(p[4] for p in points)], lines)
+
+
+def _crypto(module):
+    return [
+        price_ma(ticker, f"{name} ({ticker})", (20, 50)) for ticker, name, _ in module.CRYPTOS
+    ]
+
+
+def _commodities(module):
+    return [
+        price_ma(ticker, f"{ticker} / 20·60MA", (20, 60)) for ticker, *_ in module.COMMODITIES
+    ]
+
+
+# 분석 키 → 차트 사양 목록 (각 모듈이 이미 패널에 올린 데이터만 사용)
+# 기본 글꼴에 한글이 없으므로 차트 안의 글자는 영문
+CHARTS = {
+    "dollar": lambda module: [
+        price_ma("DX=F", "Dollar index (DX=F)", (20, 60)),
+        price_ma("USDKRW=X", "USD/KRW (USDKRW=X)", (20, 60)),
+    ],
+    "sp500": lambda module: [price_ma("^GSPC", "S&P 500 / 50·200MA", (50, 200))],
+    "ma_stage": lambda module: [stage("^GSPC", "S&P 500 MA stage (5/20/40)")],
+    "crypto": _crypto,
+    "commodities": _commodities,
+    "bonds": lambda module: [yield_curve(module.BONDS, "US Treasury yield curve")],
+}
+
+
+def collect(analyses):
+    """Chart specs for the analyses that have charts (failures are skipped)"""
+    specs = []
+    for analysis in analyses:
+        build = CHARTS.get(analysis["key"])
+        if build is None:
+            continue
+        try:
+            specs.extend(spec for spec in build(registry.load(analysis)) if spec)
+        except Exception as e:
+            print(f"♦️ {analysis['label']} 차트 데이터 오류: {e}")
+    return specs
+
+
+def render_all(specs, workers=None):
+    """Render every spec whose image is not cached yet → (fresh [(path, title)], cached count)"""
+    directory = _directory()
+    os.makedirs(directory, exist_ok=True)
+    pending, cached = [], 0
+    for spec in specs:
+        path = os.path.join(directory, f"{spec['digest']}.png")
+        if os.path.exists(path):
+            os.utime(path)  # 최근 사용 표시 (오래된 이미지 정리용)
+            cached += 1
+        else:
+            pending.append((spec, path))
+
+    workers = min(workers or os.cpu_count() or 1, len(pending))
+    with span("charts.render", kind="charts", charts=len(pending), workers=workers):
+        if workers <= 1:
+            paths = [render(spec, path) for spec, path in pending]
+        else:
+            # 워커는 matplotlib만 불러서 그림 (사양은 작은 배열이라 그대로 전달)
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                paths = list(executor.map(render, *zip(*pending)))
+    return [(path, spec["title"]) for (spec, _), path in zip(pending, paths)], cached
+
+
+def render(spec, path):
+    """Draw one chart to `path` with the headless Agg canvas (no pyplot state)"""
+    from matplotlib.figure import Figure
+
+    figure = Figure(figsize=(8, 4.5), dpi=110)
+    axes = figure.add_subplot()
+    lines = {name: np.asarray(values, dtype=float) for name, values in spec["lines"].items()}
+    dates = np.asarray(spec["dates"], dtype="datetime64[ns]")
+
+    if spec["kind"] == "yield_curve":
+        maturity = lines.pop("maturity")
+        for (name, values), style in zip(lines.items(), ("-o", "--o", ":o")):
+            axes.plot(maturity, values, style, label=name)
+        axes.set_xscale("log")
+        axes.minorticks_off()
+        axes.set_xticks(maturity, [_maturity_label(m) for m in maturity])
+        axes.set_ylabel("%")
+    else:
+        stages = lines.pop("stage", None)
+        for name, values in lines.items():
+            axes.plot(dates, values, label=name, linewidth=1.6 if name == "Close" else 1.0)
+        if stages is not None:
+            # 같은 스테이지가 이어지는 구간마다 배경색
+            edges = np.flatnonzero(np.diff(stages)) + 1
+            for start, end in zip(np.r_[0, edges], np.r_[edges, len(stages)]):
+                color = STAGE_COLORS.get(int(stages[start]))
+                if color:
+                    right = dates[min(end, len(dates) - 1)]
+                    axes.axvspan(dates[start], right, color=color, alpha=0.12)
+        figure.autofmt_xdate()
+
+    axes.set_title(spec["title"])
+    axes.grid(alpha=0.3)
+    axes.legend(loc="best", fontsize=8)
+    figure.tight_layout()
+
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    figure.savefig(tmp_path, format="png")
+    os.replace(tmp_path, path)
+    return path
+
+
+def publish(analyses, workers=None):
+    """Render the analyses' charts and upload the new ones to Slack in one batch"""
+    from module.slack import slackout_chart_files
+
+    started = time.perf_counter()
+    specs = collect(analyses)
+    if not specs:
+        return
+    fresh, cached = render_all(specs, workers)
+    print(
+        f"🖼️ 차트 {len(specs)}개: 새로 그림 {len(fresh)}, 변경 없음 {cached}"
+        f" ({time.perf_counter() - started:.2f}s)"
+    )
+    if fresh:
+        try:
+            slackout_chart_files(fresh, f"📈 차트 {len(fresh)}개 갱신")
+        except Exception as e:
+            print(f"♦️ 차트 업로드 실패: {e}")
+    prune()
+
+
+def prune(keep_days=KEEP_DAYS):
+    """Delete cached images unused for `keep_days` days"""
+    if provider.mode() != "live" or not os.path.isdir(CACHE_DIR):
+        return
+    cutoff = time.time() - keep_days * 86400
+    for name in os.listdir(CACHE_DIR):
+        path = os.path.join(CACHE_DIR, name)
+        try:
+            if os.path.getmtime(path) < cutoff:
+                os.remove(path)
+        except OSError:
+            pass
+
+
+def _spec(kind, name, title, dates, lines):
+    dates = np.asarray(dates, dtype="datetime64[ns]")
+    lines = {key: np.asarray(values, dtype=float) for key, values in lines.items()}
+    # 입력 배열 바이트 + 종류/제목/그리기 코드 버전의 해시
+    digest = hashlib.sha256(
+        json.dumps([RENDER_VERSION, kind, title, list(lines)], ensure_ascii=False).encode()
+    )
+    digest.update(dates.tobytes())
+    for values in lines.values():
+        digest.update(values.tobytes())
+    return {
+        "kind": kind,
+        "name": name,
+        "title": title,
+        "dates": dates,
+        "lines": lines,
+        "digest": f"{_safe(name)}-{digest.hexdigest()[:20]}",
+    }
+
+
+def _directory():
+    # live: 실행 간 유지, 그 외: 실행마다 새 임시 디렉터리 (재생 결과 고정)
+    global _run_dir
+    if provider.mode() == "live":
+        return CACHE_DIR
+    if _run_dir is None:
+        _run_dir = tempfile.mkdtemp(prefix="notitee-charts-")
+    return _run_dir
+
+
+def _maturity_label(years):
+    return f"{round(years * 12)}M" if years < 1 else f"{years:g}Y"
+
+
+def _safe(name):
+    return "".join(c if c.isalnum() or c in "-_" else "_" for c in name)
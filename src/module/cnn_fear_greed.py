@@ -1,9 +1,6 @@
 from datetime import datetime, date, timedelta
-import math
 
-import pandas as pd
-import fear_and_greed
-import yfinance as yf
+from module import sentiment
 from module.slack import slackout_feargreed
 import sys, os
 
@@ -11,15 +8,25 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 
 def get_fear_and_greed():
-    fg = fear_and_greed.get()
-    fg_score = float(fg[0])
+    fg = sentiment.latest("cnn")
+    fg_score = float(fg["value"])
     fg_score = round(fg_score, 2)
-    fg_status = fg[1]
-    fg_date = fg[2]
+    fg_status = fg["classification"]
+    fg_date = fg["timestamp"]
     fg_date = fg_date.strftime("%Y-%m-%d %H:%M:%S")
     return (fg_score, fg_status, fg_date)
 
 
+def history_context(fg_score):
+    """Percentile / 30-day change line from the cached history (empty without history)"""
+    rank = sentiment.percentile("cnn", fg_score)
+    change = sentiment.trend("cnn", days=30)
+    if rank is None or change is None:
+        return ""
+    since = sentiment.history("cnn").index[0].strftime("%Y-%m")
+    return f"\n    - 이력 위치: 하위 {rank:.0f}% ({since} 이후) | 30일 변화 {change:+.0f}"
+
+
 def buy_stock(ticker):
     slackout_feargreed("🟢 Buy signal - Fear & Greed below 35")
     # slackout("🟢 #feargreed Buy signal - Fear & Greed below 35")
@@ -64,7 +71,7 @@ def cnn_fear_greed_main():
 🍅 *CNN Fear & Greed 분석 리포트*
     - 업데이트: {fg_date} UTC
     - 현재 지수: {fg_score} {emoji}
-    - 상태: *{fg_status}*
+    - 상태: *{fg_status}*{history_context(fg_score)}
     - *매수* 기준: {buy_score} 이하
     - *매도* 기준: {sell_score} 이상
 {decision_color} *투자 결정*: {decision}"""
@@ -1,24 +1,40 @@
 from datetime import datetime, date, timedelta
 import pandas as pd
-import yfinance as yf
-import time
 
+from module import indicator_state
+from module.price_panel import get_history
 from module.slack import slackout_commodities, slackout_summary
 import sys, os
 
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+# 분석할 원자재들
+COMMODITIES = [
+    ("GC=F", "금 (Gold)", "🥇", "$"),
+    ("CL=F", "원유 (WTI Crude)", "🛢️", "$"),
+    ("HG=F", "구리 (Copper)", "🔶", "$"),
+    ("ZW=F", "밀 (Wheat)", "🌾", "$"),
+]
+
+# 실행 전 가격 패널에 등록할 (티커, 조회기간) 목록
+PRICE_NEEDS = [(ticker, 365) for ticker, _, _, _ in COMMODITIES] + [
+    ("DJP", 30),
+    ("DX=F", 7),
+]
+
+# 실행 간 이어서 갱신하는 지표 상태 (module.indicator_state)
+INDICATORS = {
+    "ma20": ("sma", 20, "Close"),
+    "high_52w": ("max", 365, "Close"),
+    "low_52w": ("min", 365, "Close"),
+}
+
 
 def analyze_commodity(ticker, name, emoji, unit="$"):
     """Analyze individual commodity"""
     try:
-        # 1년간 데이터 다운로드
-        start_date = str(date.today() - timedelta(days=365))
-        end_date = str(date.today() + timedelta(days=1))
-
-        data = yf.download(
-            ticker, start=start_date, end=end_date, progress=False, auto_adjust=True
-        )
+        # 1년간 데이터 조회 (가격 패널)
+        data = get_history(ticker, days=365)
 
         if data.empty:
             return f"⚠️ {name} 데이터를 가져올 수 없습니다."
@@ -28,6 +44,9 @@ def analyze_commodity(ticker, name, emoji, unit="$"):
         if len(data) < 10:
             return f"⚠️ {name} 충분한 데이터가 없습니다."
 
+        # 20MA/52주 범위 (지난 실행 이후 새 봉만 반영)
+        state = indicator_state.latest("commodities", ticker, data, INDICATORS)
+
         # 현재 가격
         current_price = float(data.iloc[-1, 3])  # Close price
 
@@ -44,8 +63,8 @@ def analyze_commodity(ticker, name, emoji, unit="$"):
         change_1y = ((current_price - price_1y_ago) / price_1y_ago) * 100
 
         # 52주 고점/저점
-        high_52w = float(data["Close"].max().item())
-        low_52w = float(data["Close"].min().item())
+        high_52w = state["high_52w"].value
+        low_52w = state["low_52w"].value
 
         # 현재 위치 (52주 고점 대비)
         position_from_high = ((current_price - high_52w) / high_52w) * 100
@@ -60,13 +79,8 @@ def analyze_commodity(ticker, name, emoji, unit="$"):
         else:
             trend_emoji = "📉"  # 하락
 
-        # 20일 이동평균 계산
-        ma_20_series = data["Close"].rolling(window=20).mean()
-        ma_20 = (
-            float(ma_20_series.iloc[-1].item())
-            if not ma_20_series.empty
-            else current_price
-        )
+        # 20일 이동평균
+        ma_20 = state["ma20"].value
 
         # NaN 체크 후 비교
         if pd.isna(ma_20):
@@ -96,13 +110,7 @@ def get_commodity_sentiment():
     """Analyze overall commodity market sentiment"""
     try:
         # DJP (원자재 ETF)를 통한 전체 원자재 시장 분석
-        djp_data = yf.download(
-            "DJP",
-            start=str(date.today() - timedelta(days=30)),
-            end=str(date.today() + timedelta(days=1)),
-            progress=False,
-            auto_adjust=True,
-        )
+        djp_data = get_history("DJP", days=30)
 
         if not djp_data.empty:
             current = float(djp_data.iloc[-1, 3])
@@ -130,13 +138,7 @@ def analyze_dxy_impact():
     """Analyze DXY (Dollar Index) impact on commodities"""
     try:
         # 달러 인덱스 (DXY) 분석
-        dxy_data = yf.download(
-            "DX=F",
-            start=str(date.today() - timedelta(days=7)),
-            end=str(date.today() + timedelta(days=1)),
-            progress=False,
-            auto_adjust=True,
-        )
+        dxy_data = get_history("DX=F", days=7)
 
         if not dxy_data.empty:
             current_dxy = float(dxy_data.iloc[-1, 3])
@@ -170,23 +172,15 @@ def analyze_inflation_signals():
     try:
         # 핵심 인플레이션 지표 원자재들 (30일 변화율)
         period_days = 30
-        start_date = str(date.today() - timedelta(days=period_days))
-        end_date = str(date.today() + timedelta(days=1))
 
         # 에너지: 원유 (가장 중요한 인플레이션 지표)
-        oil_data = yf.download(
-            "CL=F", start=start_date, end=end_date, progress=False, auto_adjust=True
-        )
+        oil_data = get_history("CL=F", days=period_days)
 
         # 산업금속: 구리 (경기 선행지표 "Dr. Copper")
-        copper_data = yf.download(
-            "HG=F", start=start_date, end=end_date, progress=False, auto_adjust=True
-        )
+        copper_data = get_history("HG=F", days=period_days)
 
         # 농산물: 밀 (식품 인플레이션 대표)
-        wheat_data = yf.download(
-            "ZW=F", start=start_date, end=end_date, progress=False, auto_adjust=True
-        )
+        wheat_data = get_history("ZW=F", days=period_days)
 
         signals = []
         weight_total = 0
@@ -261,14 +255,6 @@ def analyze_inflation_signals():
 def commodities_main():
     """Main function for commodities analysis"""
 
-    # 분석할 원자재들
-    commodities = [
-        ("GC=F", "금 (Gold)", "🥇", "$"),
-        ("CL=F", "원유 (WTI Crude)", "🛢️", "$"),
-        ("HG=F", "구리 (Copper)", "🔶", "$"),
-        ("ZW=F", "밀 (Wheat)", "🌾", "$"),
-    ]
-
     messages = []
 
     # 제목 메시지
@@ -284,10 +270,9 @@ def commodities_main():
     messages.append(dxy_impact)
 
     # 각 원자재 분석
-    for ticker, name, emoji, unit in commodities:
+    for ticker, name, emoji, unit in COMMODITIES:
         analysis = analyze_commodity(ticker, name, emoji, unit)
         messages.append(analysis)
-        time.sleep(1)  # API 호출 제한 고려
 
     # 핵심 인플레이션 지표 분석 (CRB 지수 기반)
     inflation_analysis = analyze_inflation_signals()
@@ -301,13 +286,7 @@ def commodities_main():
     # 요약 정보 반환
     try:
         # 금 가격으로 대표 요약 (1주일 변화율 포함)
-        gold_data = yf.download(
-            "GC=F",
-            start=str(date.today() - timedelta(days=10)),  # 1주일 + 여유분
-            end=str(date.today() + timedelta(days=1)),
-            progress=False,
-            auto_adjust=True,
-        )
+        gold_data = get_history("GC=F", days=10)  # 1주일 + 여유분
         if not gold_data.empty and len(gold_data) >= 2:
             current_gold = float(gold_data.iloc[-1, 3])
             # 1주일 전 가격 (7영업일 전, 최소 2일 전)
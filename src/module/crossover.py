@@ -0,0 +1,98 @@
+import numpy as np
+import pandas as pd
+
+from module.indicators import sma
+import sys, os
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+# 이동평균 차이의 부호 변화로 전체 기간의 크로스를 한 번에 찾는 엔진
+# 결과는 (ticker, date) 인덱스의 이벤트 테이블 (pair, direction 컬럼)
+EVENT_COLUMNS = ["ticker", "date", "pair", "direction"]
+
+
+def detect_crosses(fast, slow, pair):
+    """Find every cross of fast over/under slow for all columns at once"""
+    fast = _as_frame(fast)
+    slow = _as_frame(slow).reindex(index=fast.index, columns=fast.columns)
+
+    golden, death = cross_masks(fast.to_numpy(dtype=float), slow.to_numpy(dtype=float))
+    rows, cols = np.nonzero(golden | death)
+    events = pd.DataFrame(
+        {
+            "ticker": fast.columns[cols],
+            "date": fast.index[rows + 1],
+            "pair": pair,
+            "direction": np.where(golden[rows, cols], "golden", "death"),
+        },
+        columns=EVENT_COLUMNS,
+    )
+    return _indexed(events)
+
+
+def cross_masks(fast, slow):
+    """Golden/death masks for bars 1..n-1 of fast and slow value arrays"""
+    diff = np.asarray(fast, dtype=float) - np.asarray(slow, dtype=float)
+    prev, curr = diff[:-1], diff[1:]
+    valid = ~np.isnan(prev) & ~np.isnan(curr)
+
+    # 골든: 이전 fast <= slow → 현재 fast > slow / 데스: 이전 fast >= slow → 현재 fast < slow
+    golden = valid & (prev <= 0) & (curr > 0)
+    death = valid & (prev >= 0) & (curr < 0)
+    return golden, death
+
+
+def detect_ma_crosses(closes, pairs):
+    """Cross events for every (fast, slow) MA window pair over a close-price panel"""
+    closes = _as_frame(closes)
+    windows = sorted({window for pair in pairs for window in pair})
+    averages = {window: sma(closes, window) for window in windows}
+
+    tables = [
+        detect_crosses(averages[fast], averages[slow], f"{fast}/{slow}")
+        for fast, slow in pairs
+    ]
+    return combine(tables)
+
+
+def combine(tables):
+    """Concatenate event tables and keep them sorted by (ticker, date)"""
+    tables = [table.reset_index() for table in tables]
+    if not tables:
+        return _indexed(pd.DataFrame(columns=EVENT_COLUMNS))
+    return _indexed(pd.concat(tables, ignore_index=True))
+
+
+def recent_crosses(events, index, days):
+    """Events that happened within the last `days` bars of the given date index"""
+    if events.empty or len(index) < days:
+        return events
+    since = index[-days]
+    return events[events.index.get_level_values("date") >= since]
+
+
+def cross_summary(events):
+    """Last cross date/direction and cross count per (ticker, pair)"""
+    if events.empty:
+        return pd.DataFrame(columns=["last_date", "last_direction", "count"])
+    flat = events.reset_index()
+    grouped = flat.groupby(["ticker", "pair"], sort=True)
+    return pd.DataFrame(
+        {
+            "last_date": grouped["date"].max(),
+            "last_direction": grouped["direction"].last(),
+            "count": grouped.size(),
+        }
+    )
+
+
+def _indexed(events):
+    events = events.sort_values(["ticker", "date"], kind="stable")
+    return events.set_index(["ticker", "date"])
+
+
+def _as_frame(values):
+    if isinstance(values, pd.Series):
+        return values.to_frame(name=values.name if values.name is not None else 0)
+    return values
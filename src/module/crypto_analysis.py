@@ -1,24 +1,41 @@
 from datetime import datetime, date, timedelta
 import pandas as pd
-import yfinance as yf
-import time
 
+from module import indicator_state
+from module.price_panel import get_history
+from module import sentiment
 from module.slack import slackout_crypto, slackout_summary
 import sys, os
 
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+# 분석할 암호화폐들
+CRYPTOS = [
+    ("BTC-USD", "Bitcoin", "₿"),
+    ("ETH-USD", "Ethereum", "⟠"),
+    ("SOL-USD", "Solana", "◎"),
+]
+
+# 실행 전 가격 패널에 등록할 (티커, 조회기간) 목록
+PRICE_NEEDS = [(ticker, 365) for ticker, _, _ in CRYPTOS]
+
+# 실행 간 이어서 갱신하는 지표 상태 (module.indicator_state)
+# 52주 범위는 현재가와 같은 열(iloc[:, 3])로 계산
+INDICATORS = {
+    "rsi": ("rsi", 14, "Close"),
+    "high_52w": ("max", 365, "Open"),
+    "low_52w": ("min", 365, "Open"),
+}
+
+# 공포탐욕지수(alternative.me)는 가격 데이터가 아니므로 결과 캐시 대상에서 제외
+CACHEABLE = False
+
 
 def analyze_crypto_asset(ticker, name, emoji):
     """Analyze individual crypto asset"""
     try:
-        # 1년간 데이터 다운로드
-        start_date = str(date.today() - timedelta(days=365))
-        end_date = str(date.today() + timedelta(days=1))
-
-        data = yf.download(
-            ticker, start=start_date, end=end_date, progress=False, auto_adjust=True
-        )
+        # 1년간 데이터 조회 (가격 패널)
+        data = get_history(ticker, days=365)
 
         if data.empty:
             return f"⚠️ {name} 데이터를 가져올 수 없습니다."
@@ -28,6 +45,9 @@ def analyze_crypto_asset(ticker, name, emoji):
         if len(data) < 10:
             return f"⚠️ {name} 충분한 데이터가 없습니다."
 
+        # RSI/52주 범위 (지난 실행 이후 새 봉만 반영)
+        state = indicator_state.latest("crypto", ticker, data, INDICATORS)
+
         # 현재 가격
         current_price = float(data.iloc[-1, 3])  # Close price
 
@@ -42,14 +62,16 @@ def analyze_crypto_asset(ticker, name, emoji):
         change_30d = ((current_price - price_30d) / price_30d) * 100
 
         # 52주 고점/저점
-        high_52w = float(data.iloc[:, 3].max())
-        low_52w = float(data.iloc[:, 3].min())
+        high_52w = state["high_52w"].value
+        low_52w = state["low_52w"].value
 
         # 현재 위치 (52주 고점 대비)
         position_from_high = ((current_price - high_52w) / high_52w) * 100
 
-        # RSI 계산 (14일)
-        rsi = calculate_rsi(data["Close"], 14)
+        # RSI(14) (데이터가 부족하면 중립값)
+        rsi = state["rsi"].value
+        if pd.isna(rsi):
+            rsi = 50.0
 
         # 이모지 선택
         trend_emoji = "🟢" if change_7d > 0 else "🔴"
@@ -78,55 +100,17 @@ def analyze_crypto_asset(ticker, name, emoji):
         return f"⚠️ {name} 분석 중 오류 발생: {str(e)}"
 
 
-def calculate_rsi(prices, period=14):
-    """Calculate RSI (Relative Strength Index)"""
-    try:
-        delta = prices.diff()
-        gain = (delta.where(delta > 0, 0)).rolling(window=period).mean()
-        loss = (-delta.where(delta < 0, 0)).rolling(window=period).mean()
-
-        # RSI 계산을 위한 시리즈 생성
-        rsi = pd.Series(index=prices.index, dtype=float)
-        for i in range(len(prices)):
-            avg_gain = gain.iloc[i]
-            avg_loss = loss.iloc[i]
-            if pd.isna(avg_gain) or pd.isna(avg_loss):
-                rsi.iloc[i] = float('nan')
-            elif avg_loss == 0 and avg_gain == 0:
-                rsi.iloc[i] = 50.0
-            elif avg_loss == 0:
-                rsi.iloc[i] = 100.0
-            elif avg_gain == 0:
-                rsi.iloc[i] = 0.0
-            else:
-                rs = avg_gain / avg_loss
-                rsi.iloc[i] = 100 - (100 / (1 + rs))
-
-        # 마지막 값을 float로 변환, NaN이면 50 반환
-        rsi_value = float(rsi.iloc[-1])
-        return rsi_value if not pd.isna(rsi_value) else 50.0
-
-    except Exception:
-        return 50.0  # 계산 실패시 중립값 반환
-
-
 def get_crypto_fear_greed():
     """Get crypto fear & greed index from alternative.me API"""
-    import requests
-
     try:
-        url = "https://api.alternative.me/fng/"
-        response = requests.get(url, timeout=10)
-
-        if response.status_code == 200:
-            data = response.json()
-            if data["data"]:
-                fng_data = data["data"][0]
-                return {
-                    "value": int(fng_data["value"]),
-                    "classification": fng_data["value_classification"],
-                    "timestamp": fng_data["timestamp"],
-                }
+        # 이력 캐시에서 (만료 전이면 요청 없음)
+        fng_data = sentiment.latest("crypto")
+        if fng_data:
+            return {
+                "value": int(fng_data["value"]),
+                "classification": fng_data["classification"],
+                "timestamp": str(int(fng_data["timestamp"].timestamp())),
+            }
     except Exception as e:
         print(f"암호화폐 공포탐욕지수 가져오기 실패: {e}")
 
@@ -136,13 +120,6 @@ def get_crypto_fear_greed():
 def crypto_analysis_main():
     """Main function for crypto analysis"""
 
-    # 분석할 암호화폐들
-    cryptos = [
-        ("BTC-USD", "Bitcoin", "₿"),
-        ("ETH-USD", "Ethereum", "⟠"),
-        ("SOL-USD", "Solana", "◎"),
-    ]
-
     messages = []
 
     # 암호화폐 공포탐욕지수
@@ -162,11 +139,10 @@ def crypto_analysis_main():
         """.strip()
         messages.append(fng_message)
 
-    # 각 암호화폐 분석
-    for ticker, name, emoji in cryptos:
+    # 각 암호화폐 분석 (RSI는 티커별 지표 상태에서)
+    for ticker, name, emoji in CRYPTOS:
         analysis = analyze_crypto_asset(ticker, name, emoji)
         messages.append(analysis)
-        time.sleep(1)  # API 호출 제한 고려
 
     # 종합 메시지 전송
     final_message = "\n\n".join(messages)
@@ -0,0 +1,84 @@
+from contextlib import contextmanager
+import threading
+import time
+import sys, os
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+# 실행 전체 마감 시각 + 모듈별 시간 예산
+# - 네트워크 호출(rate_limit.call)은 남은 시간으로 timeout을 줄이고, 마감이 지나면 시작하지 않는다
+# - fetcher는 마감 전에 요약을 보낼 시간(SUMMARY_RESERVE)을 남기고, 늦은 모듈은 "시간 초과"로 표시
+# 모듈 예산은 모듈을 실행하는 스레드에만 적용되고, 실행 마감은 모든 스레드(Slack 발송 포함)에 적용된다.
+RUN_SECONDS = float(os.getenv("NOTITEE_DEADLINE_SECONDS", "300"))  # 0 = 마감 없음
+MODULE_SECONDS = 120.0  # 레지스트리에 budget이 없는 모듈의 기본 예산
+SUMMARY_RESERVE = 20.0  # 요약 전송/상태 저장용으로 남겨두는 시간 (초)
+
+
+class DeadlineExceeded(TimeoutError):
+    """Raised when a call would start (or retry) after its deadline"""
+
+
+_run_deadline = None  # time.monotonic() 기준
+_local = threading.local()
+
+
+def start_run(seconds=RUN_SECONDS):
+    """Start the run-wide deadline (0/None: no deadline)"""
+    global _run_deadline
+    _run_deadline = time.monotonic() + seconds if seconds else None
+
+
+def clear_run():
+    global _run_deadline
+    _run_deadline = None
+
+
+def run_remaining():
+    """Seconds left in the run (None without a deadline)"""
+    if _run_deadline is None:
+        return None
+    return _run_deadline - time.monotonic()
+
+
+def collect_timeout():
+    """How long to wait for modules before the summary has to go out (None: no limit)"""
+    left = run_remaining()
+    if left is None:
+        return None
+    return max(left - SUMMARY_RESERVE, 0.0)
+
+
+@contextmanager
+def budget(seconds):
+    """Limit the calls made on this thread to `seconds` (and the run deadline)"""
+    previous = getattr(_local, "deadline", None)
+    _local.deadline = time.monotonic() + seconds
+    try:
+        yield
+    finally:
+        _local.deadline = previous
+
+
+def remaining():
+    """Seconds left for the current thread (None without any deadline)"""
+    limits = [
+        limit for limit in (_run_deadline, getattr(_local, "deadline", None)) if limit is not None
+    ]
+    if not limits:
+        return None
+    return min(limits) - time.monotonic()
+
+
+def check(what="call"):
+    """Raise DeadlineExceeded once the current thread's deadline has passed"""
+    left = remaining()
+    if left is not None and left <= 0:
+        raise DeadlineExceeded(f"{what}: 시간 예산 초과")
+
+
+def timeout(default, what="call"):
+    """`default` clamped to the time left (raises if none is left)"""
+    check(what)
+    left = remaining()
+    return default if left is None else min(default, left)
@@ -1,27 +1,22 @@
 from datetime import datetime, date, timedelta
 import pandas as pd
-import yfinance as yf
-import time
 
+from module.price_panel import get_history
 from module.slack import slackout_dollar
 import sys, os
 
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+# 실행 전 가격 패널에 등록할 (티커, 조회기간) 목록
+PRICE_NEEDS = [("DX=F", 365), ("USDKRW=X", 365)]
+
 
 def dollar_currency_analysis():
     """Analyze dollar index and USD/KRW exchange rate"""
 
-    start2 = str(date.today() - timedelta(days=365))
-    end = str(date.today() + timedelta(days=1))
-
-    # 데이터 다운로드
-    usd_index_data = yf.download(
-        ["DX=F"], start=start2, end=end, progress=False, auto_adjust=True
-    )
-    usd_krw_data = yf.download(
-        ["USDKRW=X"], start=start2, end=end, progress=False, auto_adjust=True
-    )
+    # 데이터 조회 (가격 패널)
+    usd_index_data = get_history("DX=F", days=365)
+    usd_krw_data = get_history("USDKRW=X", days=365)
 
     # 데이터 유효성 검사
     if usd_index_data.empty or usd_krw_data.empty:
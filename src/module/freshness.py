@@ -0,0 +1,128 @@
+import json
+import threading
+from datetime import timezone
+
+from module import market_calendar, provider
+import sys, os
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+# 데이터 신선도 추적
+# 분석별로 마지막 실행에서 본 일봉(날짜, 확정 여부)과 요약을 저장해 두고,
+# 이번 실행에서 새 봉이 생길 수 없으면 (이미 확정 봉을 보고함) 네트워크 호출 없이 건너뛴다.
+# 리포트에는 실행 시각이 아니라 데이터의 실제 기준 시각을 표시한다.
+# (캘린더상 최신 봉이 데이터에 없으면 데이터의 마지막 봉 기준으로 표시하고, 다음 실행에서 다시 받는다)
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+STATE_FILE = os.path.join(
+    os.getenv("NOTITEE_CACHE_DIR", os.path.join(ROOT_DIR, ".cache")), "freshness.json"
+)
+
+_lock = threading.Lock()
+_local = threading.local()
+_state = None  # analysis key -> {"bar", "final", "as_of", "summary"}
+
+
+def latest_bar(analysis):
+    """Latest bar that can exist now for the analysis' calendar"""
+    return market_calendar.latest_bar(analysis["calendar"], provider.now(timezone.utc))
+
+
+def observed(analysis, bar):
+    """`bar`, or the older bar the analysis' price data actually ends at (then not final)"""
+    # 가격 패널을 쓰지 않는 분석(공포탐욕 등)은 캘린더 기준
+    if "module.price_panel" not in sys.modules:
+        return bar
+    from module import price_panel, registry
+
+    days = [
+        price_panel.last_day(ticker) for ticker, _ in registry.price_needs([analysis])
+    ]
+    days = [day for day in days if day is not None]
+    if not days or min(days) >= bar.day:
+        return bar
+    # 가장 늦은 입력의 마지막 봉 (확정 아님 → 다음 실행에서 최신 봉을 다시 받음)
+    day = min(days)
+    session = market_calendar.session(analysis["calendar"], day)
+    as_of = session.close if session else bar.as_of
+    return market_calendar.Bar(day, as_of, False)
+
+
+def label():
+    """Data-time label for the analysis running on this thread (None outside analyses)"""
+    bar = getattr(_local, "bar", None)
+    if bar is None:
+        return None
+    analysis = getattr(_local, "analysis", None)
+    data = observed(analysis, bar) if analysis else bar
+    text = data.as_of.astimezone(market_calendar.KST).strftime("%Y-%m-%d %H:%M:%S KST")
+    if data.day < bar.day:
+        return f"{text} 기준 (최신 봉 {bar.day} 없음)"
+    return f"{text} 기준" if bar.final else f"{text} 기준 (장중)"
+
+
+def is_stale(analysis):
+    """True if the last run already reported this analysis' final latest bar"""
+    # 녹화/재생/합성 모드는 항상 실행 (결과 고정)
+    if provider.mode() != "live":
+        return False
+    bar = latest_bar(analysis)
+    if not bar.final:
+        return False
+    previous = _load().get(analysis["key"])
+    return bool(
+        previous
+        and previous.get("final")
+        and previous.get("bar") == bar.day.isoformat()
+        and previous.get("summary")
+    )
+
+
+def cached_summary(analysis):
+    """Previous summary line, labeled with the bar it was computed from"""
+    previous = _load()[analysis["key"]]
+    return f"{previous['summary']} (변동 없음, {previous['bar']} 기준)"
+
+
+def record(analysis, bar, summary):
+    """Remember the bar and summary reported for an analysis in this run"""
+    if provider.mode() != "live":
+        return
+    with _lock:
+        _load()[analysis["key"]] = {
+            "bar": bar.day.isoformat(),
+            "final": bar.final,
+            "as_of": bar.as_of.isoformat(timespec="seconds"),
+            "summary": summary,
+        }
+
+
+def save():
+    """Persist the state for the next run"""
+    if provider.mode() != "live" or _state is None:
+        return
+    try:
+        os.makedirs(os.path.dirname(STATE_FILE), exist_ok=True)
+        tmp_path = f"{STATE_FILE}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(_state, f, ensure_ascii=False, indent=2, sort_keys=True)
+        os.replace(tmp_path, STATE_FILE)
+    except OSError as e:
+        print(f"♦️ 신선도 상태 저장 실패: {e}")
+
+
+def set_current(bar, analysis=None):
+    """Bar (and analysis) running on this thread (None to clear)"""
+    _local.bar = bar
+    _local.analysis = analysis
+
+
+def _load():
+    global _state
+    if _state is None:
+        try:
+            with open(STATE_FILE, encoding="utf-8") as f:
+                _state = json.load(f)
+        except (OSError, ValueError):
+            _state = {}
+    return _state
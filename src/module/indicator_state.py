@@ -0,0 +1,468 @@
+from collections import deque
+from datetime import timedelta
+import json
+import math
+import threading
+import numpy as np
+import pandas as pd
+
+from module import provider
+from module.price_cache import REVISION_TOLERANCE
+import sys, os
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+# 봉 하나당 O(1)로 갱신되는 지표 상태 (실행 간 디스크에 저장)
+# 모듈은 {이름: (종류, 파라미터, 입력)} 사양을 넘기고, 지난 실행 이후 새로 확정된 봉만 반영한다.
+# - 마지막 봉은 장중 값일 수 있으므로 저장된 상태에는 넣지 않고 복사본에만 적용
+# - 저장된 마지막 봉의 값이 바뀌었거나(수정 주가) 사양이 바뀌면 가격 패널 구간으로 다시 만든다
+#   (처음/다시 만들 때는 module.indicators, module.crossover 배열 커널로 한 번에 계산해 상태를 채우고,
+#    봉 단위 갱신은 그 이후 새로 생긴 봉에만 쓴다)
+# - 입력은 OHLCV 열 이름, 앞서 정의된 지표 이름, 또는 "date"(봉 날짜)
+# 결과 재현성을 위해 디스크 저장/로드는 live 모드에서만 한다.
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+STATE_FILE = os.path.join(
+    os.getenv("NOTITEE_CACHE_DIR", os.path.join(ROOT_DIR, ".cache")), "indicators.json"
+)
+
+_lock = threading.Lock()
+_entries = None  # "namespace:ticker" -> {"specs", "last", "check", "states"}
+
+
+class _State:
+    __slots__ = ()
+
+    def _fields(self):
+        return [name for cls in type(self).__mro__ for name in getattr(cls, "__slots__", ())]
+
+    def to_dict(self):
+        return {
+            name: list(value) if isinstance(value, deque) else value
+            for name in self._fields()
+            for value in [getattr(self, name)]
+        }
+
+    def load(self, data):
+        for name in self._fields():
+            current = getattr(self, name)
+            if isinstance(current, deque):
+                current.extend(data[name])
+            else:
+                setattr(self, name, data[name])
+        return self
+
+    def copy(self):
+        return type(self)(self.param).load(self.to_dict())
+
+
+class SMA(_State):
+    """Simple moving average over the last `param` bars"""
+
+    __slots__ = ("param", "values", "total")
+
+    def __init__(self, param):
+        self.param = param
+        self.values = deque(maxlen=param)
+        self.total = 0.0
+
+    def update(self, x, day):
+        if len(self.values) == self.param:
+            self.total -= self.values[0]
+        self.values.append(x)
+        self.total += x
+
+    def load(self, data):
+        super().load(data)
+        self.total = math.fsum(self.values)  # 누적 합 오차 제거
+        return self
+
+    def seed(self, values, days, index, series=False):
+        from module.indicators import sma
+
+        self.values.extend(values[-self.param :].tolist())
+        self.total = math.fsum(self.values)
+        return sma(values, self.param) if series else None
+
+    @property
+    def value(self):
+        return self.total / self.param if len(self.values) == self.param else math.nan
+
+
+class EMA(_State):
+    """Exponential moving average (alpha = 2 / (span + 1)), seeded at the first value"""
+
+    __slots__ = ("param", "current")
+
+    def __init__(self, param):
+        self.param = param
+        self.current = math.nan
+
+    def update(self, x, day):
+        if math.isnan(self.current):
+            self.current = x
+        else:
+            self.current += 2.0 / (self.param + 1.0) * (x - self.current)
+
+    def seed(self, values, days, index, series=False):
+        from module.indicators import ema
+
+        out = ema(values, self.param)
+        self.current = float(out[-1])
+        return out if series else None
+
+    @property
+    def value(self):
+        return self.current
+
+
+class WilderRSI(_State):
+    """Wilder-smoothed RSI; the first value appears after `param` changes"""
+
+    __slots__ = ("param", "avg_gain", "avg_loss", "seen", "last")
+
+    def __init__(self, param):
+        self.param = param
+        self.avg_gain = 0.0
+        self.avg_loss = 0.0
+        self.seen = 0
+        self.last = math.nan
+
+    def update(self, x, day):
+        if not math.isnan(self.last):
+            delta = x - self.last
+            gain, loss = max(delta, 0.0), max(-delta, 0.0)
+            self.seen += 1
+            # 처음 param개는 단순 평균으로 시드, 이후 Wilder 평활
+            if self.seen <= self.param:
+                self.avg_gain += gain / self.param
+                self.avg_loss += loss / self.param
+            else:
+                self.avg_gain = (self.avg_gain * (self.param - 1) + gain) / self.param
+                self.avg_loss = (self.avg_loss * (self.param - 1) + loss) / self.param
+        self.last = x
+
+    def seed(self, values, days, index, series=False):
+        from module.indicators import last_valid, wilder_averages, wilder_rsi
+
+        avg_gain, avg_loss, seen = wilder_averages(values, self.param)
+        self.avg_gain = float(avg_gain[-1, 0])
+        self.avg_loss = float(avg_loss[-1, 0])
+        self.seen = int(seen[-1, 0])
+        self.last = float(last_valid(values)[0])
+        return wilder_rsi(values, self.param) if series else None
+
+    @property
+    def value(self):
+        if self.seen < self.param:
+            return math.nan
+        if self.avg_loss == 0:
+            return 50.0 if self.avg_gain == 0 else 100.0
+        return 100.0 - 100.0 / (1.0 + self.avg_gain / self.avg_loss)
+
+
+class RollingMax(_State):
+    """Maximum over the last `param` calendar days (monotonic deque of [day, value])"""
+
+    __slots__ = ("param", "entries")
+
+    def __init__(self, param):
+        self.param = param
+        self.entries = deque()
+
+    def update(self, x, day):
+        while self.entries and not self._keeps(self.entries[-1][1], x):
+            self.entries.pop()
+        self.entries.append([day, x])
+        self.expire(day - self.param)
+
+    def expire(self, cutoff):
+        """Drop entries older than the `cutoff` day ordinal"""
+        while self.entries and self.entries[0][0] < cutoff:
+            self.entries.popleft()
+
+    def seed(self, values, days, index, series=False):
+        # 창 안에서 뒤쪽 어떤 값보다도 큰(작은) 값만 남음 = 봉마다 갱신한 단조 덱과 같은 결과
+        window = days >= days[-1] - self.param
+        tail, tail_days = values[window], days[window]
+        reducer = np.fmax if self._keeps(1.0, 0.0) else np.fmin
+        later = np.append(reducer.accumulate(tail[::-1])[::-1][1:], np.nan)
+        kept = np.isnan(later) | self._keeps(tail, later)
+        self.entries.extend(
+            [day, x] for day, x in zip(tail_days[kept].tolist(), tail[kept].tolist())
+        )
+        if not series:
+            return None
+        rolling = pd.Series(values, index=index).rolling(f"{self.param}D", closed="both")
+        return (rolling.max() if reducer is np.fmax else rolling.min()).to_numpy()
+
+    @staticmethod
+    def _keeps(older, x):
+        return older > x
+
+    @property
+    def value(self):
+        return self.entries[0][1] if self.entries else math.nan
+
+
+class RollingMin(RollingMax):
+    """Minimum over the last `param` calendar days"""
+
+    __slots__ = ()
+
+    @staticmethod
+    def _keeps(older, x):
+        return older < x
+
+
+class Cross(_State):
+    """Golden/death crosses of two inputs, kept for the last `param` calendar days"""
+
+    __slots__ = ("param", "prev", "events")
+
+    def __init__(self, param):
+        self.param = param
+        self.prev = math.nan
+        self.events = deque()  # [day, "golden" | "death"]
+
+    def update(self, x, day):
+        fast, slow = x
+        diff = fast - slow
+        # crossover.detect_crosses와 같은 규칙 (연속된 두 봉 모두 유효할 때만)
+        if not math.isnan(self.prev) and not math.isnan(diff):
+            if self.prev <= 0 < diff:
+                self.events.append([day, "golden"])
+            elif self.prev >= 0 > diff:
+                self.events.append([day, "death"])
+        self.prev = diff
+        self.expire(day - self.param)
+
+    def expire(self, cutoff):
+        while self.events and self.events[0][0] < cutoff:
+            self.events.popleft()
+
+    def seed(self, values, days, index, series=False):
+        from module.crossover import cross_masks
+
+        fast, slow = values
+        self.prev = float(fast[-1] - slow[-1])
+        golden, death = cross_masks(fast, slow)
+        # 보관 기간 안의 이벤트만 (이벤트 날짜는 두 번째 봉부터)
+        recent = (golden | death) & (days[1:] >= days[-1] - self.param)
+        for day, is_golden in zip(days[1:][recent].tolist(), golden[recent].tolist()):
+            self.events.append([day, "golden" if is_golden else "death"])
+        return None
+
+    @property
+    def value(self):
+        return self.events[-1][1] if self.events else None
+
+
+class Recent(_State):
+    """The last `param` input values (NaN included)"""
+
+    __slots__ = ("param", "values")
+
+    def __init__(self, param):
+        self.param = param
+        self.values = deque(maxlen=param)
+
+    def update(self, x, day):
+        self.values.append(x)
+
+    def seed(self, values, days, index, series=False):
+        self.values.extend(values[-self.param :].tolist())
+        return values if series else None
+
+    @property
+    def value(self):
+        return self.values[-1] if self.values else math.nan
+
+
+KINDS = {
+    "sma": SMA,
+    "ema": EMA,
+    "rsi": WilderRSI,
+    "max": RollingMax,
+    "min": RollingMin,
+    "cross": Cross,
+    "recent": Recent,
+}
+
+
+def latest(namespace, ticker, data, specs):
+    """Indicator states for a ticker after its latest bar, updated incrementally
+
+    data: the OHLCV frame the module already loaded (rows with NaN inputs are skipped)
+    specs: {name: (kind, param, source)}; a cross takes a (fast, slow) pair of names
+    """
+    specs = json.loads(json.dumps(specs))  # 저장된 사양과 비교할 수 있게 정규화
+    if isinstance(data.columns, pd.MultiIndex):
+        data = data.droplevel(-1, axis=1)
+    columns = sorted(
+        {
+            source
+            for _, _, source in specs.values()
+            if isinstance(source, str) and source != "date" and source not in specs
+        }
+    )
+    frame = data[columns].dropna()
+    if frame.empty:
+        return {}
+
+    # 확정된 봉(마지막 봉 제외)만 저장된 상태에 반영
+    key = f"{namespace}:{ticker}"
+    committed = frame.iloc[:-1]
+    with _lock:
+        entry = _load().get(key)
+        usable = _usable(entry, specs, committed)
+        if usable:
+            states = {
+                name: KINDS[kind](param).load(entry["states"][name])
+                for name, (kind, param, _) in specs.items()
+            }
+            committed = committed.loc[committed.index > pd.Timestamp(entry["last"])]
+        elif len(committed):
+            # 처음/다시 만들 때는 전체 구간을 배열 커널로 한 번에
+            states = _build(specs, columns, committed)
+            committed = committed.iloc[:0]
+        else:
+            states = {name: KINDS[kind](param) for name, (kind, param, _) in specs.items()}
+
+        # 저장된 상태 이후에 새로 확정된 봉만 봉 단위로 반영
+        for day, row in zip(committed.index, committed.to_numpy(dtype=float)):
+            _feed(states, specs, dict(zip(columns, row)), day.toordinal())
+        if len(committed) or not usable:
+            has_last = len(frame) > 1
+            _entries[key] = {
+                "specs": specs,
+                "last": str(frame.index[-2].date()) if has_last else None,
+                "check": frame.iloc[-2].tolist() if has_last else None,
+                "states": {name: state.to_dict() for name, state in states.items()},
+            }
+
+    # 마지막(장중일 수 있는) 봉은 복사본에만 적용
+    current = {name: state.copy() for name, state in states.items()}
+    day = frame.index[-1]
+    _feed(current, specs, dict(zip(columns, frame.iloc[-1].to_numpy(dtype=float))), day.toordinal())
+
+    # 기간(일) 기준 상태는 가격 패널과 같이 오늘 기준으로 자름
+    for state in current.values():
+        if hasattr(state, "expire"):
+            state.expire((provider.today() - timedelta(days=state.param)).toordinal())
+    return current
+
+
+def cross_table(current, names, ticker):
+    """crossover-style event table from Cross states (pair = spec name)"""
+    from module.crossover import EVENT_COLUMNS
+
+    # crossover.combine과 같은 순서 (날짜순, 같은 날은 names 순서)
+    rows = sorted(
+        ((day, name, direction) for name in names for day, direction in current[name].events),
+        key=lambda row: row[0],
+    )
+    events = pd.DataFrame(
+        {
+            "ticker": [ticker] * len(rows),
+            "date": pd.DatetimeIndex([pd.Timestamp.fromordinal(row[0]) for row in rows]),
+            "pair": [row[1] for row in rows],
+            "direction": [row[2] for row in rows],
+        },
+        columns=EVENT_COLUMNS,
+    )
+    return events.set_index(["ticker", "date"])
+
+
+def dates(state):
+    """DatetimeIndex from a Recent state fed with "date" """
+    return pd.DatetimeIndex([pd.Timestamp.fromordinal(day) for day in state.values])
+
+
+def save():
+    """Persist every ticker's committed state for the next run"""
+    if provider.mode() != "live" or _entries is None:
+        return
+    with _lock:
+        try:
+            os.makedirs(os.path.dirname(STATE_FILE), exist_ok=True)
+            tmp_path = f"{STATE_FILE}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(_entries, f, ensure_ascii=False)
+            os.replace(tmp_path, STATE_FILE)
+        except OSError as e:
+            print(f"♦️ 지표 상태 저장 실패: {e}")
+
+
+def reset():
+    """Forget every state (in memory only)"""
+    global _entries
+    with _lock:
+        _entries = None
+
+
+def _build(specs, columns, committed):
+    """States after every committed bar, computed in one pass with the array kernels"""
+    days = _ordinals(committed.index)
+    series = {column: committed[column].to_numpy(dtype=float) for column in columns}
+    series["date"] = days
+    # 다른 지표의 입력으로 쓰이는 지표만 전체 시계열을 만든다
+    sources = {
+        name
+        for _, _, source in specs.values()
+        for name in (source if isinstance(source, list) else [source])
+    }
+    states = {}
+    for name, (kind, param, source) in specs.items():
+        if kind == "cross":
+            values = (series[source[0]], series[source[1]])
+        else:
+            values = series[source]
+        states[name] = KINDS[kind](param)
+        series[name] = states[name].seed(values, days, committed.index, name in sources)
+    return states
+
+
+def _ordinals(dates):
+    # 날짜 → date.toordinal() (배열 연산)
+    values = pd.DatetimeIndex(dates).to_numpy(dtype="datetime64[D]").astype(np.int64)
+    return values + pd.Timestamp("1970-01-01").toordinal()
+
+
+def _feed(states, specs, row, day):
+    for name, (kind, _, source) in specs.items():
+        if kind == "cross":
+            x = (states[source[0]].value, states[source[1]].value)
+        elif source == "date":
+            x = day
+        elif source in states:
+            x = states[source].value
+        else:
+            x = row[source]
+        states[name].update(x, day)
+
+
+def _usable(entry, specs, committed):
+    # 사양이 같고, 저장된 마지막 봉이 현재 데이터에 같은 값으로 남아 있어야 이어서 갱신
+    if not entry or entry["specs"] != specs or entry["last"] is None:
+        return False
+    last = pd.Timestamp(entry["last"])
+    if last not in committed.index:
+        return False
+    for before, after in zip(entry["check"], committed.loc[last].tolist()):
+        if abs(after - before) > REVISION_TOLERANCE * abs(before):
+            return False
+    return True
+
+
+def _load():
+    global _entries
+    if _entries is None:
+        _entries = {}
+        if provider.mode() == "live":
+            try:
+                with open(STATE_FILE, encoding="utf-8") as f:
+                    _entries = json.load(f)
+            except (OSError, ValueError):
+                pass
+    return _entries
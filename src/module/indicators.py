@@ -0,0 +1,166 @@
+import numpy as np
+import pandas as pd
+import sys, os
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+# 2D (시간 × 티커) 배열을 한 번에 계산하는 NumPy 지표 커널
+# pandas Series/DataFrame을 넣으면 같은 인덱스/컬럼의 pandas 객체로 돌려준다.
+# NaN은 결측 봉으로 취급: 이동평균은 창 안에 NaN이 있으면 NaN, 극값은 NaN을 건너뛰고,
+# EMA/RSI는 직전 값을 유지한다.
+# EMA/RSI의 재귀식도 시간 축으로 블록 단위 배열 연산 (봉마다 파이썬 반복 없음)
+LINEAR_FLOOR = 1e-4  # 블록 안 누적곱의 하한
+
+
+def sma(values, window):
+    """Simple moving average over the time axis"""
+    data, wrap = _as_2d(values)
+    valid = ~np.isnan(data)
+    sums = np.cumsum(np.where(valid, data, 0.0), axis=0)
+    counts = np.cumsum(valid, axis=0)
+
+    out = np.full(data.shape, np.nan)
+    if len(data) >= window:
+        window_sum = sums[window - 1 :].copy()
+        window_sum[1:] -= sums[:-window]
+        window_count = counts[window - 1 :].copy()
+        window_count[1:] -= counts[:-window]
+        out[window - 1 :] = np.where(
+            window_count == window, window_sum / window, np.nan
+        )
+    return wrap(out)
+
+
+def ema(values, span):
+    """Exponential moving average (alpha = 2 / (span + 1)), seeded at the first value"""
+    data, wrap = _as_2d(values)
+    alpha = 2.0 / (span + 1.0)
+    valid = ~np.isnan(data)
+    if alpha >= 1.0:
+        return wrap(_ffill(data))  # span 1: 마지막 유효값
+    started = np.cumsum(valid, axis=0) > 0
+
+    # 첫 유효값: 0에 값을 더해 시작, 이후 유효값은 평활, NaN이면 이전 값 유지
+    first = valid & (np.cumsum(valid, axis=0) == 1)
+    keep = np.where(valid & ~first, 1.0 - alpha, 1.0)
+    shock = np.where(first, data, np.where(valid, alpha * data, 0.0))
+    return wrap(np.where(started, _linear(keep, shock), np.nan))
+
+
+def wilder_averages(values, period=14):
+    """Wilder average gain/loss and the number of changes seen, for every bar
+
+    Returns (avg_gain, avg_loss, seen) as 2D arrays (time x column)
+    """
+    data, _ = _as_2d(values)
+    # 직전 유효값과의 차이 (NaN 봉은 건너뜀)
+    last = _ffill(data)
+    previous = np.vstack([np.full((1, data.shape[1]), np.nan), last[:-1]])
+    delta = data - previous
+    has_delta = ~np.isnan(delta)
+    gain = np.where(has_delta, np.maximum(delta, 0.0), 0.0)
+    loss = np.where(has_delta, np.maximum(-delta, 0.0), 0.0)
+
+    # 처음 period개는 단순 평균으로 시드, 이후 Wilder 평활
+    seen = np.cumsum(has_delta, axis=0)
+    smoothing = has_delta & (seen > period)
+    keep = np.where(smoothing, (period - 1.0) / period, 1.0)
+    avg_gain = _linear(keep, gain / period)
+    avg_loss = _linear(keep, loss / period)
+    return avg_gain, avg_loss, seen
+
+
+def wilder_rsi(values, period=14):
+    """Wilder-smoothed RSI; the first value appears after `period` valid changes"""
+    _, wrap = _as_2d(values)
+    avg_gain, avg_loss, seen = wilder_averages(values, period)
+    return wrap(np.where(seen >= period, _rsi_from_averages(avg_gain, avg_loss), np.nan))
+
+
+def rolling_max(values, window):
+    """Rolling maximum over the time axis (NaNs inside the window are ignored)"""
+    return _rolling_extreme(values, window, np.fmax)
+
+
+def rolling_min(values, window):
+    """Rolling minimum over the time axis (NaNs inside the window are ignored)"""
+    return _rolling_extreme(values, window, np.fmin)
+
+
+def last_valid(values):
+    """Last non-NaN value of every column (NaN if a column has none)"""
+    data, _ = _as_2d(values)
+    valid = ~np.isnan(data)
+    has_any = valid.any(axis=0)
+    idx = len(data) - 1 - np.argmax(valid[::-1], axis=0)
+    out = np.where(has_any, data[idx, np.arange(data.shape[1])], np.nan)
+    if isinstance(values, pd.DataFrame):
+        return pd.Series(out, index=values.columns)
+    return out
+
+
+def _rolling_extreme(values, window, reducer):
+    data, wrap = _as_2d(values)
+    out = np.full(data.shape, np.nan)
+    if len(data) >= window:
+        view = np.lib.stride_tricks.sliding_window_view(data, window, axis=0)
+        out[window - 1 :] = reducer.reduce(view, axis=-1)
+    return wrap(out)
+
+
+def _linear(keep, shock):
+    """x_t = keep_t * x_(t-1) + shock_t along the time axis (x_(-1) = 0), 0 <= keep <= 1"""
+    out = np.empty(shock.shape)
+    carry = np.zeros(shock.shape[1])
+    if keep.size and keep.min() <= 0.0:
+        # 0이 섞이면 누적곱으로 나눌 수 없으므로 행 단위 (예: RSI(1))
+        for i in range(len(keep)):
+            carry = out[i] = keep[i] * carry + shock[i]
+        return out
+    # 블록 안에서는 누적곱으로 한 번에: x_t = P_t * (carry + sum(shock_i / P_i))
+    # 블록 길이는 누적곱이 LINEAR_FLOOR 아래로 내려가지 않게 (정밀도 유지)
+    smallest = keep.min() if keep.size else 1.0
+    if smallest >= 1.0:
+        block = max(len(keep), 1)
+    else:
+        block = max(1, int(np.log(LINEAR_FLOOR) / np.log(smallest)))
+    for i in range(0, len(keep), block):
+        powers = np.cumprod(keep[i : i + block], axis=0)
+        out[i : i + block] = powers * (carry + np.cumsum(shock[i : i + block] / powers, axis=0))
+        carry = out[i + len(powers) - 1]
+    return out
+
+
+def _ffill(data):
+    # 열마다 마지막 유효값으로 채움 (처음 유효값 이전은 NaN)
+    rows = np.where(~np.isnan(data), np.arange(len(data))[:, None], 0)
+    np.maximum.accumulate(rows, axis=0, out=rows)
+    return data[rows, np.arange(data.shape[1])]
+
+
+def _rsi_from_averages(avg_gain, avg_loss):
+    with np.errstate(divide="ignore", invalid="ignore"):
+        rsi = 100.0 - 100.0 / (1.0 + avg_gain / avg_loss)
+    rsi = np.where(avg_loss == 0, 100.0, rsi)
+    rsi = np.where((avg_loss == 0) & (avg_gain == 0), 50.0, rsi)
+    return rsi
+
+
+def _as_2d(values):
+    """Return (float 2D array, function that restores the input's type)"""
+    if isinstance(values, pd.DataFrame):
+        data = values.to_numpy(dtype=float)
+        return data, lambda out: pd.DataFrame(
+            out, index=values.index, columns=values.columns
+        )
+    if isinstance(values, pd.Series):
+        data = values.to_numpy(dtype=float).reshape(-1, 1)
+        return data, lambda out: pd.Series(
+            out[:, 0], index=values.index, name=values.name
+        )
+
+    data = np.asarray(values, dtype=float)
+    if data.ndim == 1:
+        return data.reshape(-1, 1), lambda out: out[:, 0]
+    return data, lambda out: out
@@ -1,44 +1,61 @@
-import yfinance as yf
+from module import indicator_state
+from module.crossover import combine, cross_summary, detect_crosses, recent_crosses
+from module.price_panel import get_history
 from module.slack import slackout_ma_stage
 import sys, os
 
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+# 크로스 이벤트 보관 기간 (일, 가격 패널 조회기간과 같음 → 1년간 이력)
+CROSS_DAYS = 365
 
-def analyze_ma_stage():
+# 실행 전 가격 패널에 등록할 (티커, 조회기간) 목록
+PRICE_NEEDS = [("^GSPC", CROSS_DAYS)]
+
+# 실행 간 이어서 갱신하는 지표 상태 (module.indicator_state)
+INDICATORS = {
+    "ma5": ("sma", 5, "Close"),
+    "ma20": ("sma", 20, "Close"),
+    "ma40": ("sma", 40, "Close"),
+    "5/20": ("cross", CROSS_DAYS, ["ma5", "ma20"]),
+    "5/40": ("cross", CROSS_DAYS, ["ma5", "ma40"]),
+    "20/40": ("cross", CROSS_DAYS, ["ma20", "ma40"]),
+    "dates": ("recent", 3, "date"),
+}
+
+
+def analyze_ma_stage(ticker="^GSPC"):
     """
     이동평균선 투자법 - 6단계 스테이지 분석
     단기(5일), 중기(20일), 장기(40일) 이동평균선 배열로 시장 국면 판단
     """
     try:
-        # 1년간 데이터 다운로드 (40MA + 여유분)
-        data = yf.download(
-            "^GSPC", period="1y", interval="1d", progress=False, auto_adjust=True
-        )
+        # 1년간 데이터 조회 (40MA + 여유분, 가격 패널)
+        data = get_history(ticker, days=CROSS_DAYS)
 
         if data.empty or len(data) < 40:
             return None
 
         close_prices = data["Close"].dropna()
 
-        # 이동평균선 계산
-        ma_5 = close_prices.rolling(window=5).mean()
-        ma_20 = close_prices.rolling(window=20).mean()
-        ma_40 = close_prices.rolling(window=40).mean()
+        # 이동평균선/크로스 (지난 실행 이후 새 봉만 반영)
+        state = indicator_state.latest("ma_stage", ticker, data, INDICATORS)
 
         # 현재 값들
         current_price = float(close_prices.iloc[-1].item())
-        current_ma5 = float(ma_5.iloc[-1].item())
-        current_ma20 = float(ma_20.iloc[-1].item())
-        current_ma40 = float(ma_40.iloc[-1].item())
+        current_ma5 = state["ma5"].value
+        current_ma20 = state["ma20"].value
+        current_ma40 = state["ma40"].value
 
         # 스테이지 판단
         stage, stage_name, trend_direction, market_psychology, strategy = (
             determine_stage(current_ma5, current_ma20, current_ma40)
         )
 
-        # 크로스 신호 확인 (최근 3일 내)
-        cross_events = check_recent_crosses(ma_5, ma_20, ma_40)
+        # 최근 CROSS_DAYS일 크로스 이벤트 → 최근 3일 내 신호와 20/40 크로스 이력
+        events = indicator_state.cross_table(state, ["5/20", "5/40", "20/40"], ticker)
+        cross_events = recent_cross_messages(events, indicator_state.dates(state["dates"]))
+        cross_history = cross_summary(events)
 
         return {
             "current_price": current_price,
@@ -51,6 +68,7 @@ def analyze_ma_stage():
             "market_psychology": market_psychology,
             "strategy": strategy,
             "cross_events": cross_events,
+            "cross_history": cross_history,
         }
 
     except Exception as e:
@@ -132,41 +150,36 @@ def determine_stage(ma5, ma20, ma40):
         )
 
 
-def check_recent_crosses(ma5, ma20, ma40, days=3):
+# (pair, direction) -> 크로스 메시지
+CROSS_MESSAGES = {
+    ("5/20", "golden"): "🌟 5MA↗20MA 골든크로스 (단기 반등)",
+    ("5/20", "death"): "💀 5MA↘20MA 데드크로스 (단기 조정)",
+    ("5/40", "golden"): "⭐ 5MA↗40MA 돌파 (중요한 상승 신호)",
+    ("5/40", "death"): "🔥 5MA↘40MA 하락 (중요한 하락 신호)",
+    ("20/40", "golden"): "🚀 20MA↗40MA 돌파 - 스테이지 전환!",
+    ("20/40", "death"): "💥 20MA↘40MA 하락 - 스테이지 전환!",
+}
+
+
+def detect_stage_crosses(ma5, ma20, ma40):
+    """전체 기간의 5/20, 5/40, 20/40 크로스 이벤트 테이블"""
+    return combine(
+        [
+            detect_crosses(ma5, ma20, "5/20"),
+            detect_crosses(ma5, ma40, "5/40"),
+            detect_crosses(ma20, ma40, "20/40"),
+        ]
+    )
+
+
+def check_recent_crosses(ma5, ma20, ma40, days=3, events=None):
     """최근 크로스 이벤트 확인"""
     cross_events = []
 
     try:
-        # 최근 며칠간의 크로스 확인
-        for i in range(-days, 0):
-            if len(ma5) > abs(i) and len(ma20) > abs(i):
-                # 5MA vs 20MA 크로스
-                prev_5 = float(ma5.iloc[i - 1].item())
-                prev_20 = float(ma20.iloc[i - 1].item())
-                curr_5 = float(ma5.iloc[i].item())
-                curr_20 = float(ma20.iloc[i].item())
-
-                if prev_5 <= prev_20 and curr_5 > curr_20:
-                    cross_events.append("🌟 5MA↗20MA 골든크로스 (단기 반등)")
-                elif prev_5 >= prev_20 and curr_5 < curr_20:
-                    cross_events.append("💀 5MA↘20MA 데드크로스 (단기 조정)")
-
-                # 5MA vs 40MA 크로스
-                if len(ma40) > abs(i):
-                    prev_40 = float(ma40.iloc[i - 1].item())
-                    curr_40 = float(ma40.iloc[i].item())
-
-                    if prev_5 <= prev_40 and curr_5 > curr_40:
-                        cross_events.append("⭐ 5MA↗40MA 돌파 (중요한 상승 신호)")
-                    elif prev_5 >= prev_40 and curr_5 < curr_40:
-                        cross_events.append("🔥 5MA↘40MA 하락 (중요한 하락 신호)")
-
-                # 20MA vs 40MA 크로스 (가장 중요)
-                if len(ma40) > abs(i):
-                    if prev_20 <= prev_40 and curr_20 > curr_40:
-                        cross_events.append("🚀 20MA↗40MA 돌파 - 스테이지 전환!")
-                    elif prev_20 >= prev_40 and curr_20 < curr_40:
-                        cross_events.append("💥 20MA↘40MA 하락 - 스테이지 전환!")
+        if events is None:
+            events = detect_stage_crosses(ma5, ma20, ma40)
+        cross_events = recent_cross_messages(events, ma5.index, days)
 
     except Exception as e:
         print(f"크로스 이벤트 확인 실패: {e}")
@@ -174,6 +187,17 @@ def check_recent_crosses(ma5, ma20, ma40, days=3):
     return cross_events
 
 
+def recent_cross_messages(events, index, days=3):
+    """Messages for the events within the last `days` bars of the date index"""
+    # 최근 며칠간의 크로스 (날짜순, 같은 날은 5/20 → 5/40 → 20/40 순)
+    recent = recent_crosses(events, index, days).reset_index()
+    recent["order"] = recent["pair"].map({"5/20": 0, "5/40": 1, "20/40": 2})
+    return [
+        CROSS_MESSAGES[(event["pair"], event["direction"])]
+        for _, event in recent.sort_values(["date", "order"]).iterrows()
+    ]
+
+
 def ma_stage_analysis_main():
     """이동평균선 스테이지 분석 메인 함수"""
     try:
@@ -190,6 +214,17 @@ def ma_stage_analysis_main():
         if analysis["cross_events"]:
             cross_msg = "\n📊 *최근 크로스*: " + " | ".join(analysis["cross_events"])
 
+        # 20/40 크로스 이력 (마지막 날짜, 1년간 횟수)
+        history = analysis["cross_history"]
+        stage_cross = history[history.index.get_level_values("pair") == "20/40"]
+        if not stage_cross.empty:
+            last = stage_cross.iloc[-1]
+            direction = "상향" if last["last_direction"] == "golden" else "하향"
+            cross_msg += (
+                f"\n🗓️ *20/40 마지막 크로스*: {last['last_date']:%Y-%m-%d} ({direction})"
+                f" | 1년간 {int(last['count'])}회"
+            )
+
         # 종합 리포트 생성
         report = f"""
 📈 *이동평균선 스테이지 분석* 📈
@@ -0,0 +1,152 @@
+from datetime import date, datetime, time, timedelta, timezone
+from functools import lru_cache
+from typing import NamedTuple
+from zoneinfo import ZoneInfo
+import sys, os
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+# 거래소 캘린더 (일봉 기준)
+# - us_equity: NYSE 정규장 09:30-16:00 ET, 휴장일/조기폐장(13:00) 규칙 계산
+# - cme: CME Globex 선물/외환, 거래일 D = 전일 18:00 ET ~ D 17:00 ET (일~금)
+# - crypto: 24/7, 일봉 = UTC 자정 ~ 다음 자정
+# 시각은 모두 America/New_York 기준이라 서머타임은 zoneinfo가 처리한다.
+NEW_YORK = ZoneInfo("America/New_York")
+KST = timezone(timedelta(hours=9))
+CALENDARS = ("us_equity", "cme", "crypto")
+LOOKBACK_DAYS = 14  # 최근 세션을 찾을 때 거슬러 올라가는 최대 일수
+
+
+class Session(NamedTuple):
+    day: date  # 일봉 날짜 (거래일)
+    open: datetime
+    close: datetime
+
+
+class Bar(NamedTuple):
+    day: date  # 존재할 수 있는 가장 최근 일봉 날짜
+    as_of: datetime  # 그 봉에 반영된 마지막 시각 (장중이면 현재 시각)
+    final: bool  # 세션이 끝나 더 이상 바뀌지 않는 봉인지
+
+
+def session(calendar, day):
+    """Trading session for `day`, or None if there is no bar for that day"""
+    if calendar == "crypto":
+        start = datetime.combine(day, time(0), timezone.utc)
+        return Session(day, start, start + timedelta(days=1))
+
+    if calendar == "us_equity":
+        closed, early = us_equity_holidays(day.year)
+        if day.weekday() >= 5 or day in closed:
+            return None
+        close = time(13) if day in early else time(16)
+        return Session(
+            day,
+            datetime.combine(day, time(9, 30), NEW_YORK),
+            datetime.combine(day, close, NEW_YORK),
+        )
+
+    if calendar == "cme":
+        if day.weekday() >= 5 or day in cme_holidays(day.year):
+            return None
+        return Session(
+            day,
+            datetime.combine(day - timedelta(days=1), time(18), NEW_YORK),
+            datetime.combine(day, time(17), NEW_YORK),
+        )
+
+    raise ValueError(f"알 수 없는 캘린더: {calendar} (가능: {', '.join(CALENDARS)})")
+
+
+def latest_session(calendar, at):
+    """Most recent session that has opened by `at`"""
+    # CME 세션은 전날 저녁에 열리므로 하루 뒤부터 확인
+    day = at.astimezone(NEW_YORK).date() + timedelta(days=1)
+    for _ in range(LOOKBACK_DAYS):
+        current = session(calendar, day)
+        if current is not None and current.open <= at:
+            return current
+        day -= timedelta(days=1)
+    raise RuntimeError(f"{calendar}: 최근 {LOOKBACK_DAYS}일 내 거래 세션 없음")
+
+
+def latest_bar(calendar, at=None):
+    """Latest daily bar that can exist at `at` (aware datetime, default: now)"""
+    at = at or datetime.now(timezone.utc)
+    current = latest_session(calendar, at)
+    final = at >= current.close
+    return Bar(current.day, current.close if final else at, final)
+
+
+@lru_cache(maxsize=32)
+def us_equity_holidays(year):
+    """(full closures, 13:00 early closes) for NYSE in `year`"""
+    closed = {
+        _nth_weekday(year, 1, 0, 3),  # Martin Luther King Jr. Day
+        _nth_weekday(year, 2, 0, 3),  # Presidents' Day
+        _easter(year) - timedelta(days=2),  # Good Friday
+        _last_weekday(year, 5, 0),  # Memorial Day
+        _observed(date(year, 7, 4)),  # Independence Day
+        _nth_weekday(year, 9, 0, 1),  # Labor Day
+        _nth_weekday(year, 11, 3, 4),  # Thanksgiving
+        _observed(date(year, 12, 25)),  # Christmas
+    }
+    if year >= 2022:
+        closed.add(_observed(date(year, 6, 19)))  # Juneteenth
+    # 1월 1일이 토요일이면 전년도 12월 31일은 휴장하지 않음
+    new_year = _observed(date(year, 1, 1))
+    if new_year.year == year:
+        closed.add(new_year)
+
+    early = {
+        _nth_weekday(year, 11, 3, 4) + timedelta(days=1),  # 추수감사절 다음날
+        date(year, 7, 3),
+        date(year, 12, 24),
+    }
+    early = {d for d in early if d.weekday() < 5 and d not in closed}
+    return frozenset(closed), frozenset(early)
+
+
+@lru_cache(maxsize=32)
+def cme_holidays(year):
+    """Days with no CME trade date (other US holidays only shorten the session)"""
+    closed = {_observed(date(year, 12, 25)), _easter(year) - timedelta(days=2)}
+    new_year = _observed(date(year, 1, 1))
+    if new_year.year == year:
+        closed.add(new_year)
+    return frozenset(closed)
+
+
+def _observed(day):
+    # 토요일 → 금요일, 일요일 → 월요일
+    if day.weekday() == 5:
+        return day - timedelta(days=1)
+    if day.weekday() == 6:
+        return day + timedelta(days=1)
+    return day
+
+
+def _nth_weekday(year, month, weekday, n):
+    first = date(year, month, 1)
+    return first + timedelta(days=(weekday - first.weekday()) % 7 + 7 * (n - 1))
+
+
+def _last_weekday(year, month, weekday):
+    last = date(year, month + 1, 1) - timedelta(days=1)
+    return last - timedelta(days=(last.weekday() - weekday) % 7)
+
+
+def _easter(year):
+    # 그레고리력 부활절 (Anonymous Gregorian algorithm)
+    a = year % 19
+    b, c = divmod(year, 100)
+    d, e = divmod(b, 4)
+    f = (b + 8) // 25
+    g = (b - f + 1) // 3
+    h = (19 * a + b - d - g + 15) % 30
+    i, k = divmod(c, 4)
+    l = (32 + 2 * e + 2 * i - h - k) % 7
+    m = (a + 11 * h + 22 * l) // 451
+    month, day = divmod(h + l - 7 * m + 114, 31)
+    return date(year, month, day + 1)
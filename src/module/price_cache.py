@@ -0,0 +1,195 @@
+from datetime import datetime, timedelta
+import json
+import threading
+import pandas as pd
+
+from module import provider
+from module.tracing import span
+import sys, os
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+# 티커별 OHLCV 디스크 캐시 (Parquet 파일 + index.json 메타데이터)
+# 마지막으로 저장된 날짜 이후의 봉만 받아서 병합하고, 과거 데이터가 수정되었으면 전체를 다시 받는다.
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+CACHE_DIR = os.path.join(
+    os.getenv("NOTITEE_CACHE_DIR", os.path.join(ROOT_DIR, ".cache")), "prices"
+)
+INDEX_FILE = os.path.join(CACHE_DIR, "index.json")
+
+OVERLAP_DAYS = 5  # 수정 여부 확인을 위해 겹쳐서 받는 기간
+REVISION_TOLERANCE = 1e-4  # 상대 오차 (분할/배당 조정 감지용)
+PRICE_COLUMNS = ["Close", "High", "Low", "Open", "Volume"]
+
+_lock = threading.Lock()
+
+
+def download(tickers, start, end):
+    """Return {ticker: OHLCV frame} for [start, end), fetching only uncached bars"""
+    start = pd.Timestamp(start)
+    end = pd.Timestamp(end)
+
+    # 녹화/재생 중에는 디스크 캐시를 거치지 않음 (fixture에 전체 구간을 담고 재생 결과를 고정)
+    if provider.mode() != "live":
+        fresh = _fetch(list(tickers), start, end)
+        return {
+            ticker: _with_ticker_level(fresh.get(ticker, pd.DataFrame()), ticker)
+            for ticker in tickers
+        }
+
+    with _lock:
+        index = _load_index()
+        cached = {}
+        full = []
+
+        for ticker in tickers:
+            meta = index.get(ticker)
+            frame = _read(ticker) if meta else None
+            if frame is None or frame.empty or pd.Timestamp(meta["start"]) > start:
+                full.append(ticker)
+            else:
+                cached[ticker] = frame
+
+        # 캐시가 있는 티커: 마지막 저장일 이후만 받기
+        if cached:
+            since = min(pd.Timestamp(index[t]["last"]) for t in cached)
+            fresh = _fetch(list(cached), since - timedelta(days=OVERLAP_DAYS), end)
+            for ticker, old in cached.items():
+                merged = _merge(old, fresh.get(ticker))
+                if merged is None:
+                    print(f"♦️ {ticker} 과거 데이터 수정 감지 → 전체 재다운로드")
+                    full.append(ticker)
+                    continue
+                if merged is old:
+                    continue
+                cached[ticker] = merged
+                _write(ticker, merged, index, pd.Timestamp(index[ticker]["start"]))
+
+        # 캐시가 없거나 수정된 티커: 요청 구간 전체 받기
+        if full:
+            fresh = _fetch(full, start, end)
+            for ticker in full:
+                frame = fresh.get(ticker)
+                if frame is None or frame.empty:
+                    cached[ticker] = pd.DataFrame()
+                    continue
+                cached[ticker] = frame
+                _write(ticker, frame, index, start)
+
+        _save_index(index)
+
+    result = {}
+    for ticker in tickers:
+        frame = cached[ticker]
+        if not frame.empty:
+            frame = frame.loc[(frame.index >= start) & (frame.index < end)]
+        result[ticker] = _with_ticker_level(frame, ticker)
+    return result
+
+
+def clear():
+    """Delete every cached file"""
+    with _lock:
+        if not os.path.isdir(CACHE_DIR):
+            return
+        for name in os.listdir(CACHE_DIR):
+            os.remove(os.path.join(CACHE_DIR, name))
+
+
+def _fetch(tickers, start, end):
+    with span(
+        "yf.download", kind="download", tickers=len(tickers), start_date=str(start.date())
+    ) as record:
+        data = provider.download_prices(tickers, start, end)
+        record["rows"] = len(data)
+        record["bytes"] = int(data.memory_usage(deep=True).sum())
+
+    frames = {}
+    for ticker in tickers:
+        if data.empty or ticker not in data.columns.get_level_values(1):
+            continue
+        frame = data.xs(ticker, axis=1, level=1).dropna(how="all")
+        if frame.index.tz is not None:
+            frame.index = frame.index.tz_localize(None)
+        frames[ticker] = frame[[c for c in PRICE_COLUMNS if c in frame.columns]]
+    return frames
+
+
+def _merge(old, new):
+    """Append new bars to the cached frame, or return None if history was revised"""
+    if new is None or new.empty:
+        return old
+
+    # 겹치는 구간 비교 (캐시의 마지막 봉은 장중 값일 수 있으므로 제외)
+    overlap = old.index[:-1].intersection(new.index)
+    if len(overlap) > 0:
+        before = old.loc[overlap, "Close"].astype(float)
+        after = new.loc[overlap, "Close"].astype(float)
+        drift = ((after - before).abs() / before.abs()).max()
+        if pd.isna(drift) or drift > REVISION_TOLERANCE:
+            return None
+
+    merged = pd.concat([old.loc[old.index < new.index[0]], new])
+    return merged[~merged.index.duplicated(keep="last")].sort_index()
+
+
+def _with_ticker_level(frame, ticker):
+    # yf.download 단일 티커와 같은 (Price, Ticker) 컬럼 구조로 복원
+    if frame.empty:
+        return pd.DataFrame()
+    frame = frame.copy()
+    frame.columns = pd.MultiIndex.from_product(
+        [frame.columns, [ticker]], names=["Price", "Ticker"]
+    )
+    return frame
+
+
+def _path(ticker):
+    safe = "".join(c if c.isalnum() or c in "-_" else "_" for c in ticker)
+    return os.path.join(CACHE_DIR, f"{safe}.parquet")
+
+
+def _read(ticker):
+    try:
+        return pd.read_parquet(_path(ticker))
+    except Exception:
+        return None
+
+
+def _write(ticker, frame, index, start):
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        path = _path(ticker)
+        tmp_path = f"{path}.tmp"
+        frame.to_parquet(tmp_path)
+        os.replace(tmp_path, path)  # 원자적 교체
+    except Exception as e:
+        print(f"♦️ {ticker} 캐시 저장 실패: {e}")
+        return
+
+    index[ticker] = {
+        "start": str(min(start, frame.index[0]).date()),
+        "last": str(frame.index[-1].date()),
+        "rows": len(frame),
+        "updated": datetime.now().isoformat(timespec="seconds"),
+    }
+
+
+def _load_index():
+    try:
+        with open(INDEX_FILE, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_index(index):
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        tmp_path = f"{INDEX_FILE}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(index, f, indent=2, sort_keys=True)
+        os.replace(tmp_path, INDEX_FILE)
+    except OSError as e:
+        print(f"♦️ 가격 캐시 인덱스 저장 실패: {e}")
@@ -0,0 +1,114 @@
+from datetime import timedelta
+import threading
+import pandas as pd
+
+from module.price_cache import download
+from module.provider import today
+import sys, os
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+# 실행 단위(run-scoped) 가격 패널
+# 각 모듈의 (티커, 조회기간) 요구사항을 먼저 모은 뒤 가장 넓은 기간으로 한 번에 다운로드하고,
+# 분석 함수들은 메모리에서 필요한 구간만 잘라서 사용한다.
+# 실제 다운로드는 price_cache를 거치므로 이전 실행 이후 새로 생긴 봉만 받는다.
+_lock = threading.Lock()
+_needs = {}  # ticker -> lookback days
+_frames = {}  # ticker -> OHLCV DataFrame (yf.download 단일 티커와 동일한 컬럼 구조)
+_loaded_days = {}  # ticker -> 메모리에 올라와 있는 조회기간(일)
+
+
+def register(needs):
+    """Register (ticker, lookback_days) needs before prefetch"""
+    with _lock:
+        for ticker, days in needs:
+            _needs[ticker] = max(days, _needs.get(ticker, 0))
+
+
+def prefetch():
+    """Load every registered ticker with one batched (cache-backed) download per lookback"""
+    with _lock:
+        pending = {
+            ticker: days
+            for ticker, days in _needs.items()
+            if _loaded_days.get(ticker, 0) < days
+        }
+        # 조회기간이 같은 티커끼리 묶어 다운로드 (30년 채권 기간을 다른 티커에 쓰지 않게)
+        for days, tickers in _by_days(pending).items():
+            _download(tickers, days)
+
+
+def refresh(tickers=None):
+    """Fetch bars that appeared since the tickers were loaded (default: every loaded ticker)"""
+    with _lock:
+        tickers = sorted(_frames if tickers is None else set(tickers) & set(_frames))
+        if not tickers:
+            return
+        # 캐시를 거치므로 마지막 저장일 이후의 봉만 다시 받음
+        for days, group in _by_days({ticker: _loaded_days[ticker] for ticker in tickers}).items():
+            _download(group, days)
+
+
+def get_history(ticker, days=365):
+    """Return the last `days` calendar days of OHLCV data for a ticker"""
+    with _lock:
+        # 패널에 없거나 기간이 부족하면 해당 티커만 추가로 다운로드
+        if _loaded_days.get(ticker, 0) < days:
+            _download([ticker], max(days, _needs.get(ticker, 0)))
+        frame = _frames[ticker]
+
+    if frame.empty:
+        return frame.copy()
+
+    start = pd.Timestamp(today() - timedelta(days=days))
+    if frame.index.tz is not None:
+        start = start.tz_localize(frame.index.tz)
+    return frame.loc[frame.index >= start].copy()
+
+
+def last_day(ticker):
+    """Date of the last bar loaded for a ticker (None if not loaded; never downloads)"""
+    with _lock:
+        frame = _frames.get(ticker)
+    if frame is None or frame.empty:
+        return None
+    return frame.index[-1].date()
+
+
+def get_closes(tickers, days=365):
+    """Return a date-aligned (date x ticker) frame of Close prices"""
+    closes = {}
+    for ticker in tickers:
+        frame = get_history(ticker, days)
+        if not frame.empty:
+            closes[ticker] = frame["Close"].iloc[:, 0]
+    return pd.DataFrame(closes, columns=list(tickers)).sort_index()
+
+
+def reset():
+    """Drop everything loaded in this run"""
+    with _lock:
+        _needs.clear()
+        _frames.clear()
+        _loaded_days.clear()
+
+
+def _by_days(days_by_ticker):
+    # 조회기간 → 정렬된 티커 목록
+    groups = {}
+    for ticker, days in sorted(days_by_ticker.items()):
+        groups.setdefault(days, []).append(ticker)
+    return groups
+
+
+def _download(tickers, days):
+    start_date = str(today() - timedelta(days=days))
+    end_date = str(today() + timedelta(days=1))
+
+    # 디스크 캐시를 거쳐 새로 생긴 봉만 다운로드
+    frames = download(tickers, start_date, end_date)
+
+    for ticker in tickers:
+        _frames[ticker] = frames[ticker]
+        _loaded_days[ticker] = days
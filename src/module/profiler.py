@@ -0,0 +1,94 @@
+import cProfile
+import io
+import pstats
+import sys, os
+import threading
+import time
+from collections import Counter
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+# 실행 프로파일링
+# - cprofile: 결정적 프로파일러 (호출 스레드만 측정하므로 모듈을 순차 실행할 때 사용)
+# - sample: 모든 스레드의 스택을 주기적으로 샘플링 (동시 실행 그대로 측정)
+SAMPLE_INTERVAL = 0.005  # 초
+REPORT_LIMIT = 40
+
+
+def profile_cprofile(func, out_path, *args, **kwargs):
+    """Run func under cProfile and write a cumulative/self-time sorted report"""
+    profiler = cProfile.Profile()
+    try:
+        return profiler.runcall(func, *args, **kwargs)
+    finally:
+        buffer = io.StringIO()
+        stats = pstats.Stats(profiler, stream=buffer).strip_dirs()
+        buffer.write("=== 누적 시간 기준 ===\n")
+        stats.sort_stats("cumulative").print_stats(REPORT_LIMIT)
+        buffer.write("=== 자체 시간 기준 ===\n")
+        stats.sort_stats("tottime").print_stats(REPORT_LIMIT)
+        _write(out_path, buffer.getvalue())
+        stats.dump_stats(f"{out_path}.prof")
+
+
+def profile_sampling(func, out_path, *args, **kwargs):
+    """Run func while sampling every thread's stack, then write a hot-function report"""
+    self_counts = Counter()
+    total_counts = Counter()
+    samples = 0
+    stop = threading.Event()
+
+    def sampler():
+        nonlocal samples
+        # 샘플러 자신만 제외 (func를 실행하는 호출 스레드도 샘플링 대상)
+        me = threading.get_ident()
+        while not stop.wait(SAMPLE_INTERVAL):
+            for ident, frame in sys._current_frames().items():
+                if ident == me or frame is None:
+                    continue
+                samples += 1
+                self_counts[_describe(frame)] += 1
+                seen = set()
+                while frame is not None:
+                    name = _describe(frame)
+                    if name not in seen:
+                        total_counts[name] += 1
+                        seen.add(name)
+                    frame = frame.f_back
+
+    thread = threading.Thread(target=sampler, name="profiler", daemon=True)
+    started = time.perf_counter()
+    thread.start()
+    try:
+        return func(*args, **kwargs)
+    finally:
+        stop.set()
+        thread.join()
+        elapsed = time.perf_counter() - started
+        _write(out_path, _sampling_report(self_counts, total_counts, samples, elapsed))
+
+
+def _sampling_report(self_counts, total_counts, samples, elapsed):
+    lines = [
+        f"샘플링 프로파일: {samples} 샘플 / {elapsed:.2f}s (간격 {SAMPLE_INTERVAL * 1000:.0f}ms)",
+        "",
+        "=== 자체 시간 기준 (스택 최상단) ===",
+    ]
+    for name, count in self_counts.most_common(REPORT_LIMIT):
+        lines.append(f"{count / max(samples, 1) * 100:6.1f}%  {count:6d}  {name}")
+    lines += ["", "=== 누적 시간 기준 (스택 어딘가) ==="]
+    for name, count in total_counts.most_common(REPORT_LIMIT):
+        lines.append(f"{count / max(samples, 1) * 100:6.1f}%  {count:6d}  {name}")
+    return "\n".join(lines) + "\n"
+
+
+def _describe(frame):
+    code = frame.f_code
+    return f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+
+
+def _write(path, text):
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(text)
+    print(f"📄 프로파일 리포트 저장: {path}")
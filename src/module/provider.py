@@ -0,0 +1,416 @@
+from datetime import date, datetime, timedelta, timezone
+import json
+import threading
+import sys, os
+
+from module.rate_limit import call
+from module.tracing import span
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+# 외부 데이터 공급 계층 (yfinance / JSON API (CNN·alternative.me 공포탐욕) / Slack)
+# - live: 실제 네트워크 호출
+# - record: 실제로 호출하면서 모든 응답을 fixture 번들에 저장
+# - replay: 네트워크 없이 번들에 저장된 응답만 메모리에서 반환 (녹화 시점의 시계 사용)
+# - synthetic: 네트워크 없이 합성 데이터 반환 (module.synthetic, 규모 테스트용)
+#
+# 번들 구조
+#   manifest.json   녹화 시각, 티커/응답 목록
+#   prices/*.parquet 티커별 OHLCV
+#   responses.json  요청 키 -> JSON 응답
+#   slack.jsonl     Slack 요청/응답
+MODES = ("live", "record", "replay", "synthetic")
+OFFLINE_MODES = ("replay", "synthetic")  # Slack은 보내지 않고 요청만 기록
+SYNTHETIC_CRYPTO_START = date(2018, 2, 1)  # alternative.me 이력 시작일
+YAHOO_TIMEOUT = 30  # 초 (요청당, 남은 시간 예산으로 줄어듦 - module.deadline)
+
+
+class ReplayMissError(KeyError):
+    """Raised when a replayed run asks for a response that was never recorded"""
+
+
+class IncompleteDownload(RuntimeError):
+    """Raised when yf.download returns no rows for some tickers (it does not raise itself)"""
+
+    def __init__(self, missing, data):
+        super().__init__(f"yahoo: 데이터 없는 티커 {len(missing)}개 ({', '.join(missing[:5])})")
+        self.missing = missing
+        self.data = data  # 지금까지 받은 티커들 (재시도 후에도 빠지면 이것만 사용)
+
+
+_lock = threading.Lock()
+_mode = "live"
+_bundle_dir = None
+_seed = 0
+_clock = None  # 녹화 시각 (replay에서 now/today 기준)
+_prices = {}  # ticker -> OHLCV DataFrame (단일 레벨 컬럼)
+_responses = {}  # 요청 키 -> JSON으로 저장 가능한 응답
+_slack = []  # Slack 요청/응답 기록
+_session = None  # JSON API용 requests.Session (처음 요청할 때 생성)
+
+
+def configure(mode="live", bundle_dir=None, seed=0):
+    """Switch provider mode; replay loads the whole bundle into memory"""
+    global _mode, _bundle_dir, _clock, _seed
+    if mode not in MODES:
+        raise ValueError(f"알 수 없는 provider 모드: {mode} (가능: {', '.join(MODES)})")
+    if mode in ("record", "replay") and not bundle_dir:
+        raise ValueError(f"{mode} 모드에는 fixture 번들 경로가 필요합니다")
+
+    with _lock:
+        _mode = mode
+        _bundle_dir = bundle_dir
+        _seed = seed
+        _prices.clear()
+        _responses.clear()
+        _slack.clear()
+        _clock = datetime.now().astimezone() if mode == "record" else None
+        if mode == "replay":
+            _load_bundle(bundle_dir)
+
+
+def mode():
+    return _mode
+
+
+def is_offline():
+    return _mode in OFFLINE_MODES
+
+
+def seed():
+    """Seed of the synthetic mode"""
+    return _seed
+
+
+def now(tz=None):
+    """Current time, or the recording time when replaying"""
+    if _mode == "replay" and _clock is not None:
+        return _clock.astimezone(tz) if tz else _clock.replace(tzinfo=None)
+    return datetime.now(tz)
+
+
+def today():
+    return now().date()
+
+
+def download_prices(tickers, start, end):
+    """yf.download-shaped frame ((Price, Ticker) columns) for [start, end)"""
+    if _mode == "replay":
+        return _replay_prices(tickers, start, end)
+    if _mode == "synthetic":
+        from module import synthetic
+
+        return synthetic.download(tickers, start, end, _seed)
+
+    try:
+        data = call(
+            "yahoo",
+            _yahoo_download(tickers),
+            start=str(start.date()),
+            end=str(end.date()),
+            timeout=YAHOO_TIMEOUT,
+        )
+    except IncompleteDownload as e:
+        # 재시도 후에도 빠진 티커는 빈 데이터로 처리 (받은 티커는 그대로 사용)
+        print(f"♦️ {e}")
+        data = e.data
+    if _mode == "record":
+        _record_prices(data)
+    return data
+
+
+def _yahoo_download(tickers):
+    """yf.download that raises IncompleteDownload while tickers are missing"""
+    # yf.download은 실패해도 빈/일부 프레임을 돌려주므로 예외로 바꿔서
+    # rate_limit.call이 재시도(빠진 티커만)하고 회로 차단기에 실패로 기록하게 함
+    # yfinance는 실제 다운로드가 필요할 때만 불러옴 (시작 시간 단축)
+    import pandas as pd
+    import yfinance as yf
+
+    received = []
+    pending = list(tickers)
+
+    def download(**kwargs):
+        nonlocal pending
+        data = yf.download(
+            pending, progress=False, auto_adjust=True, group_by="column", **kwargs
+        )
+        if not data.empty:
+            received.append(data.dropna(axis=1, how="all"))
+        got = {
+            ticker for frame in received for ticker in frame.columns.get_level_values(1)
+        }
+        pending = [ticker for ticker in pending if ticker not in got]
+        merged = pd.concat(received, axis=1) if received else data
+        if pending:
+            raise IncompleteDownload(pending, merged)
+        return merged
+
+    return download
+
+
+def get_json(host, url, params=None, timeout=10, headers=None):
+    """GET a JSON API under the host's rate limit"""
+    key = f"{host} {url}"
+    if params:
+        key += "?" + "&".join(f"{k}={params[k]}" for k in sorted(params))
+    if _mode == "replay":
+        with span(f"http.{host}", kind="http", host=host, replay=True):
+            return _replay_response(key)
+    if _mode == "synthetic":
+        return _synthetic_fear_greed(host, url, params, key)
+
+    response = call(host, _http().get, url, params=params, headers=headers, timeout=timeout)
+    response.raise_for_status()
+    payload = response.json()
+    if _mode == "record":
+        _record_response(key, payload)
+    return payload
+
+
+def get_json_if_changed(host, url, validators=None, params=None, timeout=10, headers=None):
+    """Conditional GET → (payload, or None if unchanged since `validators`; new validators)
+
+    validators: {"etag", "modified"} from the previous response (live mode only)
+    """
+    if _mode != "live":
+        return get_json(host, url, params, timeout, headers), {}
+
+    headers = dict(headers or {})
+    validators = validators or {}
+    if validators.get("etag"):
+        headers["If-None-Match"] = validators["etag"]
+    if validators.get("modified"):
+        headers["If-Modified-Since"] = validators["modified"]
+    response = call(host, _http().get, url, params=params, headers=headers, timeout=timeout)
+    if response.status_code == 304:
+        return None, validators
+    response.raise_for_status()
+    fresh = {
+        name: response.headers[header]
+        for name, header in (("etag", "ETag"), ("modified", "Last-Modified"))
+        if response.headers.get(header)
+    }
+    return response.json(), fresh
+
+
+def slack_post(session, url, payload, token, timeout=10, form=False):
+    """POST a Slack Web API call and return its JSON body
+
+    form: send the payload form-encoded (methods that do not accept JSON, e.g. file uploads)
+    """
+    if _mode in OFFLINE_MODES:
+        # 전송하지 않고 요청만 기록 (회귀 비교용)
+        data = {"ok": True, "replayed": True}
+        with _lock:
+            _slack.append({"url": _method(url), "request": payload, "response": data})
+        return data
+
+    response = call(
+        "slack",
+        session.post,
+        url,
+        **{"data" if form else "json": payload},
+        headers={"Authorization": f"Bearer {token}"},
+        timeout=timeout,
+    )
+    response.raise_for_status()
+    data = response.json()
+    if _mode == "record":
+        with _lock:
+            _slack.append({"url": _method(url), "request": payload, "response": data})
+    return data
+
+
+def slack_upload(session, url, content, timeout=30):
+    """POST file bytes to an upload URL returned by files.getUploadURLExternal"""
+    record = {"url": "upload", "request": {"bytes": len(content)}, "response": {"ok": True}}
+    if _mode in OFFLINE_MODES:
+        with _lock:
+            _slack.append(record)
+        return
+
+    response = call("slack", session.post, url, data=content, timeout=timeout)
+    response.raise_for_status()
+    if _mode == "record":
+        with _lock:
+            _slack.append(record)
+
+
+def slack_requests():
+    """Slack requests seen in this run (record/replay)"""
+    with _lock:
+        return list(_slack)
+
+
+def save():
+    """Write the recorded responses to the bundle directory"""
+    if _mode != "record":
+        return
+    with _lock:
+        prices_dir = os.path.join(_bundle_dir, "prices")
+        os.makedirs(prices_dir, exist_ok=True)
+        files = {}
+        for ticker, frame in sorted(_prices.items()):
+            name = "".join(c if c.isalnum() or c in "-_" else "_" for c in ticker)
+            frame.to_parquet(os.path.join(prices_dir, f"{name}.parquet"))
+            files[ticker] = f"prices/{name}.parquet"
+
+        _write_json("responses.json", _responses)
+        with open(os.path.join(_bundle_dir, "slack.jsonl"), "w", encoding="utf-8") as f:
+            for item in _slack:
+                f.write(json.dumps(item, ensure_ascii=False) + "\n")
+
+        manifest = {
+            "recorded_at": _clock.isoformat(),
+            "prices": files,
+            "responses": sorted(_responses),
+            "slack_requests": len(_slack),
+        }
+        _write_json("manifest.json", manifest)
+    print(
+        f"💾 fixture 저장: {_bundle_dir} "
+        f"(티커 {len(files)}개, 응답 {len(_responses)}개, Slack {len(_slack)}건)"
+    )
+
+
+def _record_prices(data):
+    if data.empty:
+        return
+    for ticker in data.columns.get_level_values(1).unique():
+        frame = data.xs(ticker, axis=1, level=1).dropna(how="all")
+        with _lock:
+            old = _prices.get(ticker)
+            _prices[ticker] = frame if old is None else frame.combine_first(old)
+
+
+def _replay_prices(tickers, start, end):
+    import pandas as pd
+
+    parts = []
+    for ticker in tickers:
+        frame = _prices.get(ticker)
+        if frame is None:
+            print(f"♦️ fixture에 없는 티커: {ticker}")
+            continue
+        index = frame.index.tz_localize(None) if frame.index.tz is not None else frame.index
+        frame = frame.loc[(index >= start) & (index < end)].copy()
+        frame.columns = pd.MultiIndex.from_product(
+            [frame.columns, [ticker]], names=["Price", "Ticker"]
+        )
+        parts.append(frame)
+    if not parts:
+        return pd.DataFrame()
+    return pd.concat(parts, axis=1).sort_index()
+
+
+def _record_response(key, payload):
+    with _lock:
+        _responses[key] = payload
+
+
+def _replay_response(key):
+    try:
+        return _responses[key]
+    except KeyError:
+        raise ReplayMissError(f"fixture에 없는 요청: {key}") from None
+
+
+def _http():
+    # JSON API용 keep-alive 세션 (데몬에서 연결 재사용)
+    global _session
+    with _lock:
+        if _session is None:
+            import requests
+
+            _session = requests.Session()
+        return _session
+
+
+def _synthetic_fear_greed(host, url, params, key):
+    # CNN graphdata / alternative.me fng 응답과 같은 형태의 합성 이력 (날짜별로 고정된 값)
+    from module import synthetic
+
+    end = today()
+    if host == "cnn":
+        since = url.rstrip("/").rsplit("/", 1)[-1]
+        try:
+            start = date.fromisoformat(since)
+        except ValueError:
+            start = end - timedelta(days=365)  # 시작일 없는 요청은 최근 1년
+        days = [
+            start + timedelta(days=offset)
+            for offset in range((end - start).days + 1)
+            if (start + timedelta(days=offset)).weekday() < 5
+        ]
+        points = [(day, synthetic.fear_greed_value("cnn", day, _seed)) for day in days]
+        value = synthetic.fear_greed_value("cnn", end, _seed)
+        return {
+            "fear_and_greed": {
+                "score": float(value),
+                "rating": _classify(value).lower(),
+                "timestamp": now(timezone.utc).isoformat(),
+            },
+            "fear_and_greed_historical": {
+                "data": [{"x": _epoch(day) * 1000, "y": float(value)} for day, value in points]
+            },
+        }
+    if host == "alternative.me":
+        # limit=0 → 전체 이력 (합성 시작일부터), 최신 값이 먼저
+        limit = int((params or {}).get("limit", 1))
+        count = limit if limit > 0 else (end - SYNTHETIC_CRYPTO_START).days + 1
+        days = [end - timedelta(days=offset) for offset in range(count)]
+        return {
+            "data": [
+                {
+                    "value": str(value),
+                    "value_classification": _classify(value),
+                    "timestamp": str(_epoch(day)),
+                }
+                for day in days
+                for value in [synthetic.fear_greed_value("crypto", day, _seed)]
+            ]
+        }
+    raise ReplayMissError(f"합성 데이터가 없는 요청: {key}")
+
+
+def _epoch(day):
+    return int(datetime(day.year, day.month, day.day, tzinfo=timezone.utc).timestamp())
+
+
+def _classify(value):
+    # alternative.me / CNN 구간 이름
+    for limit, name in ((24, "Extreme Fear"), (44, "Fear"), (55, "Neutral"), (75, "Greed")):
+        if value <= limit:
+            return name
+    return "Extreme Greed"
+
+
+def _method(url):
+    return url.rstrip("/").rsplit("/", 1)[-1]
+
+
+def _write_json(name, data):
+    os.makedirs(_bundle_dir, exist_ok=True)
+    path = os.path.join(_bundle_dir, name)
+    with open(f"{path}.tmp", "w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False, indent=2, sort_keys=True)
+    os.replace(f"{path}.tmp", path)
+
+
+def _load_bundle(bundle_dir):
+    global _clock
+    import pandas as pd
+
+    try:
+        with open(os.path.join(bundle_dir, "manifest.json"), encoding="utf-8") as f:
+            manifest = json.load(f)
+        with open(os.path.join(bundle_dir, "responses.json"), encoding="utf-8") as f:
+            _responses.update(json.load(f))
+    except (OSError, ValueError) as e:
+        raise ValueError(f"fixture 번들을 읽을 수 없습니다: {bundle_dir} ({e})") from e
+
+    _clock = datetime.fromisoformat(manifest["recorded_at"])
+    for ticker, relpath in manifest["prices"].items():
+        _prices[ticker] = pd.read_parquet(os.path.join(bundle_dir, relpath))
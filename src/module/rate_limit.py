@@ -0,0 +1,182 @@
+import random
+import threading
+import time
+
+from module import deadline
+from module.tracing import span
+import sys, os
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+# 업스트림 호스트별 (초당 요청 수, 버스트 허용량)
+HOST_LIMITS = {
+    "yahoo": (2.0, 5),
+    "cnn": (1.0, 2),
+    "alternative.me": (1.0, 2),
+    "slack": (1.0, 3),  # chat.postMessage는 채널당 초당 1건 수준
+}
+DEFAULT_LIMIT = (1.0, 2)
+
+MAX_RETRIES = 4
+BACKOFF_BASE = 0.5  # 초
+BACKOFF_MAX = 30.0  # 초
+BREAKER_THRESHOLD = 5  # 연속 실패 횟수
+BREAKER_COOLDOWN = 60.0  # 초
+RETRY_STATUS = {429, 500, 502, 503, 504}
+
+
+class CircuitOpenError(RuntimeError):
+    """Raised when a host's circuit breaker is open"""
+
+
+class TokenBucket:
+    """Thread-safe token bucket that can also be paused (Retry-After)"""
+
+    def __init__(self, rate, capacity):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = float(capacity)
+        self.updated = time.monotonic()
+        self.paused_until = 0.0
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                if now < self.paused_until:
+                    wait = self.paused_until - now
+                else:
+                    self.tokens = min(
+                        self.capacity, self.tokens + (now - self.updated) * self.rate
+                    )
+                    self.updated = now
+                    if self.tokens >= 1:
+                        self.tokens -= 1
+                        return
+                    wait = (1 - self.tokens) / self.rate
+            time.sleep(wait)
+
+    def pause(self, seconds):
+        with self._lock:
+            self.paused_until = max(self.paused_until, time.monotonic() + seconds)
+
+
+class CircuitBreaker:
+    """Opens after consecutive failures and lets one trial call through after cooldown"""
+
+    def __init__(self, threshold=BREAKER_THRESHOLD, cooldown=BREAKER_COOLDOWN):
+        self.threshold = threshold
+        self.cooldown = cooldown
+        self.failures = 0
+        self.opened_at = None
+        self._lock = threading.Lock()
+
+    def allow(self):
+        with self._lock:
+            if self.opened_at is None:
+                return True
+            if time.monotonic() - self.opened_at >= self.cooldown:
+                # half-open: 한 번만 시도 허용
+                self.opened_at = time.monotonic()
+                return True
+            return False
+
+    def record_success(self):
+        with self._lock:
+            self.failures = 0
+            self.opened_at = None
+
+    def record_failure(self):
+        with self._lock:
+            self.failures += 1
+            if self.failures >= self.threshold:
+                self.opened_at = time.monotonic()
+
+
+_lock = threading.Lock()
+_buckets = {}
+_breakers = {}
+
+
+def call(host, func, *args, **kwargs):
+    """Call func under the host's rate limit with retries, backoff and a circuit breaker"""
+    bucket, breaker = _get_host(host)
+    if not breaker.allow():
+        raise CircuitOpenError(f"{host} 회로 차단기 열림 - 호출 생략")
+
+    base_timeout = kwargs.get("timeout")
+    with span(f"http.{host}", kind="http", host=host) as record:
+        waited = 0.0
+        for attempt in range(MAX_RETRIES + 1):
+            record["attempts"] = attempt + 1
+            started = time.perf_counter()
+            bucket.acquire()
+            waited += time.perf_counter() - started
+            record["waited_ms"] = round(waited * 1000, 2)
+            # 실행/모듈 마감이 지났으면 시작하지 않고, 남은 시간보다 오래 기다리지 않음
+            if base_timeout is not None:
+                kwargs["timeout"] = deadline.timeout(base_timeout, host)
+            else:
+                deadline.check(host)
+            try:
+                result = func(*args, **kwargs)
+            except Exception as e:
+                error, retry_after = e, _retry_after(getattr(e, "response", None))
+            else:
+                status = getattr(result, "status_code", None)
+                record["status"] = status
+                if status not in RETRY_STATUS:
+                    breaker.record_success()
+                    if hasattr(result, "content"):
+                        record["bytes"] = len(result.content)
+                    return result
+                error, retry_after = None, _retry_after(result)
+
+            breaker.record_failure()
+            if attempt == MAX_RETRIES or not breaker.allow():
+                if error is not None:
+                    raise error
+                return result
+
+            delay = retry_after if retry_after is not None else _backoff(attempt)
+            left = deadline.remaining()
+            if left is not None and delay >= left:
+                # 재시도 전에 마감이 지나므로 지금 실패 처리
+                record["deadline"] = True
+                if error is not None:
+                    raise error
+                return result
+            print(f"♦️ {host} 호출 재시도 {attempt + 1}/{MAX_RETRIES} ({delay:.1f}초 후)")
+            if retry_after is not None:
+                # Retry-After는 같은 호스트를 쓰는 모든 스레드에 적용 (다음 acquire에서 대기)
+                bucket.pause(retry_after)
+            else:
+                time.sleep(delay)
+                waited += delay
+
+
+def _get_host(host):
+    with _lock:
+        if host not in _buckets:
+            rate, capacity = HOST_LIMITS.get(host, DEFAULT_LIMIT)
+            _buckets[host] = TokenBucket(rate, capacity)
+            _breakers[host] = CircuitBreaker()
+        return _buckets[host], _breakers[host]
+
+
+def _backoff(attempt):
+    # 지수 백오프 + full jitter
+    return random.uniform(0, min(BACKOFF_MAX, BACKOFF_BASE * 2**attempt))
+
+
+def _retry_after(response):
+    headers = getattr(response, "headers", None)
+    if not headers:
+        return None
+    value = headers.get("Retry-After") or headers.get("retry-after")
+    try:
+        return min(float(value), BACKOFF_MAX)
+    except (TypeError, ValueError):
+        return None
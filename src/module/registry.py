@@ -0,0 +1,118 @@
+import importlib
+import sys, os
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+# 분석 모듈 레지스트리 - 선택된 모듈(과 그 무거운 의존성)만 실행 시점에 import
+# 순서 = 요약 메시지 순서, weight = 예상 소요시간 (큰 것부터 먼저 실행)
+# calendar = 데이터가 따르는 거래소 캘린더 (module.market_calendar)
+# budget = 모듈 시간 예산 (초) - 넘기면 남은 네트워크 호출을 취소하고 "시간 초과"로 요약 (module.deadline)
+ANALYSES = [
+    {
+        "key": "dollar",
+        "label": "달러",
+        "module": "module.dollar_currency",
+        "entry": "dollar_currency_analysis",
+        "error_summary": "달러: 분석 오류",
+        "weight": 1,
+        "calendar": "cme",
+        "budget": 45,
+    },
+    {
+        "key": "feargreed",
+        "label": "공포탐욕",
+        "module": "module.cnn_fear_greed",
+        "entry": "cnn_fear_greed_main",
+        "error_summary": "공포탐욕: 분석 오류",
+        "weight": 2,
+        "calendar": "us_equity",
+        "budget": 30,
+    },
+    {
+        "key": "sp500",
+        "label": "S&P500",
+        "module": "module.snp500_200ma",
+        "entry": "snp500_200ma_main",
+        "error_summary": "S&P500: 분석 오류",
+        "weight": 1,
+        "calendar": "us_equity",
+        "budget": 45,
+    },
+    {
+        "key": "crypto",
+        "label": "암호화폐",
+        "module": "module.crypto_analysis",
+        "entry": "crypto_analysis_main",
+        "error_summary": "암호화폐: 분석 오류",
+        "weight": 3,
+        "calendar": "crypto",
+        "budget": 60,
+    },
+    {
+        "key": "bonds",
+        "label": "채권",
+        "module": "module.bond_yields",
+        "entry": "bond_yields_main",
+        "error_summary": "채권: 분석 오류",
+        "weight": 4,
+        "calendar": "us_equity",
+        "budget": 60,
+    },
+    {
+        "key": "commodities",
+        "label": "원자재",
+        "module": "module.commodities",
+        "entry": "commodities_main",
+        "error_summary": "원자재: 분석 오류",
+        "weight": 5,
+        "calendar": "cme",
+        "budget": 90,
+    },
+    {
+        "key": "ma_stage",
+        "label": "MA단계",
+        "module": "module.ma_stage_analysis",
+        "entry": "ma_stage_analysis_main",
+        "error_summary": "MA단계: 분석 오류",
+        "weight": 1,
+        "calendar": "us_equity",
+        "budget": 45,
+    },
+]
+
+KEYS = [analysis["key"] for analysis in ANALYSES]
+
+
+def select(only=None, skip=None):
+    """Registry entries filtered by key, keeping the registry order"""
+    unknown = set(only or []) | set(skip or [])
+    unknown -= set(KEYS)
+    if unknown:
+        raise ValueError(
+            f"알 수 없는 모듈: {', '.join(sorted(unknown))} (가능: {', '.join(KEYS)})"
+        )
+    return [
+        analysis
+        for analysis in ANALYSES
+        if (not only or analysis["key"] in only)
+        and not (skip and analysis["key"] in skip)
+    ]
+
+
+def load(analysis):
+    """Import the analysis module on first use"""
+    return importlib.import_module(analysis["module"])
+
+
+def entry_point(analysis):
+    """The analysis main function (imports its module)"""
+    return getattr(load(analysis), analysis["entry"])
+
+
+def price_needs(analyses):
+    """(ticker, lookback) needs declared by the selected modules"""
+    needs = []
+    for analysis in analyses:
+        needs.extend(getattr(load(analysis), "PRICE_NEEDS", []))
+    return needs
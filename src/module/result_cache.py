@@ -0,0 +1,164 @@
+import hashlib
+import inspect
+import json
+import threading
+
+from module import provider, registry
+import sys, os
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+# 입력 지문(fingerprint) 기반 결과 캐시
+# 지문 = 모듈(과 모듈이 쓰는 module.* 헬퍼)의 소스 + 기준 날짜 + PRICE_NEEDS 봉 데이터.
+# 지문이 같으면 분석을 다시 계산하지 않고 저장된 리포트(Slack 메시지)와 요약을 재사용한다.
+# 가격 외의 외부 입력(API 응답)을 쓰는 모듈은 CACHEABLE = False로 제외한다.
+#
+# 채널별 "변경 시에만 전송": NOTITEE_POST_ON_CHANGE=0-snp,0-bonds (또는 *)
+# 지정된 채널은 본문이 마지막으로 보낸 것과 같으면 전송하지 않는다.
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+STATE_FILE = os.path.join(
+    os.getenv("NOTITEE_CACHE_DIR", os.path.join(ROOT_DIR, ".cache")), "results.json"
+)
+POST_ON_CHANGE = {
+    channel.strip()
+    for channel in os.getenv("NOTITEE_POST_ON_CHANGE", "").split(",")
+    if channel.strip()
+}
+
+_lock = threading.RLock()
+_local = threading.local()
+_state = None  # {"results": {key: {...}}, "channels": {channel: 본문 해시}}
+
+
+def fingerprint(analysis):
+    """Hex digest of everything the analysis reads, or None if it can't be cached"""
+    if provider.mode() != "live":
+        return None
+    module = registry.load(analysis)
+    needs = getattr(module, "PRICE_NEEDS", [])
+    if not getattr(module, "CACHEABLE", True) or not needs:
+        return None
+
+    from module.price_panel import get_history
+    import pandas as pd
+
+    digest = hashlib.sha256()
+    for source in _sources(module):
+        digest.update(source.encode())
+    # 조회 구간이 오늘 날짜 기준이므로 날짜가 바뀌면 다시 계산
+    digest.update(str(provider.today()).encode())
+    for ticker, days in sorted(set(needs)):
+        frame = get_history(ticker, days)
+        digest.update(f"{ticker}:{days}:{list(frame.columns)}".encode())
+        if not frame.empty:
+            digest.update(pd.util.hash_pandas_object(frame, index=True).values.tobytes())
+    return digest.hexdigest()
+
+
+def lookup(analysis, key):
+    """Cached {"messages", "summary"} for a matching fingerprint"""
+    if key is None:
+        return None
+    entry = _load()["results"].get(analysis["key"])
+    if entry and entry.get("fingerprint") == key:
+        return entry
+    return None
+
+
+def store(analysis, key, messages, summary):
+    if key is None:
+        return
+    with _lock:
+        _load()["results"][analysis["key"]] = {
+            "fingerprint": key,
+            "messages": messages,
+            "summary": summary,
+        }
+
+
+def start_capture():
+    """Collect the Slack reports sent by the analysis running on this thread"""
+    _local.messages = []
+
+
+def stop_capture():
+    messages = getattr(_local, "messages", None) or []
+    _local.messages = None
+    return messages
+
+
+def captured(channel_tag, channel, message):
+    """Called by slack.slackout for every report message"""
+    messages = getattr(_local, "messages", None)
+    if messages is not None:
+        messages.append({"channel_tag": channel_tag, "channel": channel, "message": message})
+
+
+def set_post_on_change(channels):
+    """Post only on change to these channels ("*" = every channel)"""
+    POST_ON_CHANGE.update(channels)
+
+
+def is_unchanged(channel, message):
+    """True if the channel posts only on change and `message` was already sent"""
+    if provider.mode() != "live":
+        return False
+    if channel not in POST_ON_CHANGE and "*" not in POST_ON_CHANGE:
+        return False
+    with _lock:
+        return _load()["channels"].get(channel) == _hash(message)
+
+
+def remember_post(channel, message):
+    with _lock:
+        _load()["channels"][channel] = _hash(message)
+
+
+def save():
+    """Persist fingerprints and last-posted hashes for the next run"""
+    if provider.mode() != "live" or _state is None:
+        return
+    try:
+        os.makedirs(os.path.dirname(STATE_FILE), exist_ok=True)
+        tmp_path = f"{STATE_FILE}.tmp"
+        # Slack 발송 스레드가 전송 기록을 남기는 중일 수 있음
+        with _lock, open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(_state, f, ensure_ascii=False, indent=2, sort_keys=True)
+        os.replace(tmp_path, STATE_FILE)
+    except OSError as e:
+        print(f"♦️ 결과 캐시 저장 실패: {e}")
+
+
+def _sources(module):
+    # 분석 모듈 + 모듈이 import한 module.* 헬퍼 (임계값/로직 변경 시 지문이 바뀜)
+    names = {module.__name__}
+    for value in vars(module).values():
+        name = getattr(value, "__module__", None) or getattr(value, "__name__", "")
+        if isinstance(name, str) and name.startswith("module."):
+            names.add(name)
+    sources = []
+    for name in sorted(names):
+        try:
+            sources.append(inspect.getsource(sys.modules[name]))
+        except (KeyError, OSError, TypeError):
+            sources.append(name)
+    return sources
+
+
+def _hash(message):
+    return hashlib.sha256(message.encode()).hexdigest()
+
+
+def _load():
+    global _state
+    with _lock:
+        if _state is None:
+            try:
+                with open(STATE_FILE, encoding="utf-8") as f:
+                    _state = json.load(f)
+            except (OSError, ValueError):
+                _state = {}
+            _state.setdefault("results", {})
+            _state.setdefault("channels", {})
+        return _state
@@ -0,0 +1,247 @@
+from datetime import datetime, timedelta, timezone
+import json
+import threading
+import pandas as pd
+
+from module import market_calendar, provider
+import sys, os
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+# 공포탐욕지수 이력 캐시 (CNN / alternative.me 암호화폐)
+# 처음 한 번 전체 이력을 받아 저장하고, 이후에는 마지막 저장일 이후 값만 받아 덧붙인다.
+# 만료 시각(TTL)은 각 지수가 실제로 갱신되는 주기에 맞춘다.
+# - cnn: 미국 장중에는 몇 분마다 갱신, 장 마감 후에는 다음 세션까지 값이 고정
+# - crypto: 하루 한 번 (응답의 time_until_update 사용)
+# 요청은 provider의 keep-alive 세션으로 보내고, ETag/Last-Modified가 있으면 조건부로 요청한다.
+# 녹화/재생/합성 모드도 같은 이력 요청을 쓰고 (fixture 번들에 이력 응답이 녹화됨), 디스크 저장은 live 모드에서만 한다.
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+STATE_FILE = os.path.join(
+    os.getenv("NOTITEE_CACHE_DIR", os.path.join(ROOT_DIR, ".cache")), "sentiment.json"
+)
+
+CNN_URL = "https://production.dataviz.cnn.io/index/fearandgreed/graphdata"
+CNN_HISTORY_START = "2020-07-15"  # 전체 이력 요청 시작일 (CNN이 제공하는 가장 이른 구간)
+CNN_HEADERS = {
+    # 브라우저가 아닌 요청은 CNN이 거부함
+    "User-Agent": "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 "
+    "(KHTML, like Gecko) Chrome/124.0 Safari/537.36",
+}
+CNN_TTL_MINUTES = int(os.getenv("NOTITEE_CNN_TTL_MINUTES", "10"))  # 장중 재조회 간격
+CRYPTO_URL = "https://api.alternative.me/fng/"
+SOURCES = ("cnn", "crypto")
+
+_lock = threading.Lock()
+_entries = None  # source -> {"points", "current", "fetched", "expires", "validators"}
+_dirty = False
+
+
+def latest(source):
+    """Current value of a source as {"value", "classification", "timestamp"} (None on failure)
+
+    timestamp: aware UTC datetime of the provider's last update
+    """
+    entry = _refresh(source)
+    current = entry.get("current") if entry else None
+    if not current:
+        return None
+    return {
+        "value": current["value"],
+        "classification": current["classification"],
+        "timestamp": datetime.fromisoformat(current["timestamp"]),
+    }
+
+
+def history(source):
+    """Daily history of a source as a float Series (empty when unavailable)"""
+    entry = _refresh(source)
+    points = entry.get("points", []) if entry else []
+    return pd.Series(
+        [value for _, value in points],
+        index=pd.DatetimeIndex([day for day, _ in points]),
+        dtype=float,
+    )
+
+
+def percentile(source, value, days=None):
+    """Share (%) of the history at or below `value` (last `days` days only, if given)"""
+    series = history(source)
+    if days:
+        series = series[series.index > series.index.max() - pd.Timedelta(days=days)]
+    if series.empty:
+        return None
+    return float((series <= value).mean() * 100)
+
+
+def trend(source, days=30):
+    """Change of the index over the last `days` calendar days (None without history)"""
+    series = history(source)
+    if series.empty:
+        return None
+    before = series[series.index <= series.index[-1] - pd.Timedelta(days=days)]
+    if before.empty:
+        return None
+    return float(series.iloc[-1] - before.iloc[-1])
+
+
+def save():
+    """Persist the histories for the next run"""
+    if provider.mode() != "live" or not _dirty:
+        return
+    with _lock:
+        try:
+            os.makedirs(os.path.dirname(STATE_FILE), exist_ok=True)
+            tmp_path = f"{STATE_FILE}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(_entries, f, ensure_ascii=False)
+            os.replace(tmp_path, STATE_FILE)
+        except OSError as e:
+            print(f"♦️ 공포탐욕 이력 저장 실패: {e}")
+
+
+def reset():
+    """Forget the cached histories (in memory only)"""
+    global _entries, _dirty
+    with _lock:
+        _entries = None
+        _dirty = False
+
+
+def _refresh(source):
+    # 만료되지 않았으면 저장된 값 그대로 (HTTP 요청 없음)
+    global _dirty
+    with _lock:
+        entry = _load().get(source)
+        now = provider.now(timezone.utc)  # 재생 시 녹화 시각
+        if entry and entry.get("expires") and now < datetime.fromisoformat(entry["expires"]):
+            return entry
+
+        fetch = _fetch_cnn if source == "cnn" else _fetch_crypto
+        try:
+            entry = fetch(dict(entry or {}), now)
+        except Exception as e:
+            print(f"♦️ {source} 공포탐욕 조회 실패: {e}")
+            return entry  # 실패하면 저장된 값 사용 (다음 호출에서 다시 시도)
+        entry["fetched"] = now.isoformat()
+        _entries[source] = entry
+        _dirty = True
+        return entry
+
+
+def _fetch_cnn(entry, now):
+    points = entry.get("points", [])
+    # 저장된 이력이 있으면 마지막 날짜부터만 요청
+    since = points[-1][0] if points else CNN_HISTORY_START
+    try:
+        payload, validators = provider.get_json_if_changed(
+            "cnn", f"{CNN_URL}/{since}", entry.get("validators"), headers=CNN_HEADERS
+        )
+    except Exception:
+        if points:
+            raise
+        # 시작일을 거부하면 기본 구간(최근 1년)만 받음
+        payload, validators = provider.get_json_if_changed("cnn", CNN_URL, headers=CNN_HEADERS)
+    if payload is not None:
+        current = payload["fear_and_greed"]
+        entry["current"] = {
+            "value": float(current["score"]),
+            "classification": current["rating"],
+            "timestamp": _utc(datetime.fromisoformat(current["timestamp"])).isoformat(),
+        }
+        fresh = [
+            (_day(point["x"] / 1000), float(point["y"]))
+            for point in payload.get("fear_and_greed_historical", {}).get("data", [])
+        ]
+        # 오늘 값은 장중에 계속 바뀌므로 현재 값으로 덮어씀
+        fresh.append((entry["current"]["timestamp"][:10], entry["current"]["value"]))
+        entry["points"] = _merge(points, fresh)
+        entry["validators"] = validators
+
+    # 장중이면 짧게, 장 마감 후 최종 값을 받은 뒤에는 다음 세션 시작까지 재조회하지 않음
+    bar = market_calendar.latest_bar("us_equity", now)
+    if bar.final and now >= bar.as_of + timedelta(minutes=CNN_TTL_MINUTES):
+        expires = _next_open(now)
+    else:
+        expires = now + timedelta(minutes=CNN_TTL_MINUTES)
+    entry["expires"] = expires.isoformat()
+    return entry
+
+
+def _fetch_crypto(entry, now):
+    points = entry.get("points", [])
+    # limit=0 → 전체 이력, 이후에는 마지막 저장일 이후 일수만큼
+    if points:
+        missing = (now.date() - datetime.fromisoformat(points[-1][0]).date()).days
+        limit = max(missing + 1, 2)
+    else:
+        limit = 0
+    payload, validators = provider.get_json_if_changed(
+        "alternative.me", CRYPTO_URL, entry.get("validators"), params={"limit": limit}
+    )
+    seconds = None
+    if payload is not None:
+        data = payload.get("data", [])
+        if data:
+            latest_point = data[0]
+            entry["current"] = {
+                "value": int(latest_point["value"]),
+                "classification": latest_point["value_classification"],
+                "timestamp": datetime.fromtimestamp(
+                    int(latest_point["timestamp"]), timezone.utc
+                ).isoformat(),
+            }
+            if latest_point.get("time_until_update"):
+                seconds = int(latest_point["time_until_update"])
+        fresh = [(_day(int(point["timestamp"])), int(point["value"])) for point in data]
+        entry["points"] = _merge(points, fresh)
+        entry["validators"] = validators
+
+    # 다음 갱신 시각까지 (없으면 다음 UTC 자정 직후)
+    if seconds is None:
+        midnight = datetime.combine(now.date() + timedelta(days=1), datetime.min.time())
+        expires = midnight.replace(tzinfo=timezone.utc) + timedelta(minutes=5)
+    else:
+        expires = now + timedelta(seconds=max(seconds, 300))
+    entry["expires"] = expires.isoformat()
+    return entry
+
+
+def _next_open(now):
+    # 다음 미국 정규장 시작 시각 (휴장일 건너뜀)
+    day = now.astimezone(market_calendar.NEW_YORK).date()
+    for offset in range(market_calendar.LOOKBACK_DAYS):
+        session = market_calendar.session("us_equity", day + timedelta(days=offset))
+        if session and session.open > now:
+            return session.open
+    return now + timedelta(hours=1)
+
+
+def _merge(points, fresh):
+    # 날짜별 마지막 값 (새 값 우선), 날짜순
+    merged = dict(points)
+    merged.update(fresh)
+    return sorted([day, value] for day, value in merged.items())
+
+
+def _day(timestamp):
+    return datetime.fromtimestamp(timestamp, timezone.utc).date().isoformat()
+
+
+def _utc(moment):
+    if moment.tzinfo is None:
+        return moment.replace(tzinfo=timezone.utc)
+    return moment.astimezone(timezone.utc)
+
+
+def _load():
+    global _entries
+    if _entries is None:
+        _entries = {}
+        if provider.mode() == "live":
+            try:
+                with open(STATE_FILE, encoding="utf-8") as f:
+                    _entries = json.load(f)
+            except (OSError, ValueError):
+                pass
+    return _entries
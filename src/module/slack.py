@@ -1,66 +1,196 @@
-import slack_sdk
+import json
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import sys, os
+import threading
 from datetime import datetime
 
+from module import provider, slack_outbox
+from module.tracing import span
+
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+# Slack Web API 주소 (로컬 테스트 서버로 바꿔서 검증 가능)
+SLACK_API_URL = os.getenv("SLACK_API_URL", "https://slack.com/api/")
+SLACK_TIMEOUT = 10  # 초
+# 차트 업로드 채널 ID (files.completeUploadExternal은 채널 이름이 아닌 ID만 받음, 없으면 업로드 생략)
+CHARTS_CHANNEL_ID = os.getenv("NOTITEE_CHARTS_CHANNEL_ID")
 
-def slackout_summary(message: str):
-    """Send summary message to main summary channel only (no individual channel)"""
+_client_lock = threading.Lock()
+_client = None
+_send_enabled = True
+
+
+class SlackError(RuntimeError):
+    """Raised when Slack answers with ok=false"""
+
+
+def get_client():
+    """Shared keep-alive HTTP session for every Slack call (created lazily)"""
+    global _client
+    with _client_lock:
+        if _client is None:
+            session = requests.Session()
+            # 연결 오류만 전송 계층에서 재시도, 429/5xx는 rate_limit.call에서 Retry-After 처리
+            retry = Retry(total=3, connect=3, read=0, status=0, backoff_factor=0.5)
+            adapter = HTTPAdapter(pool_connections=1, pool_maxsize=8, max_retries=retry)
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            _client = session
+        return _client
+
+
+def post_message(channel: str, text: str):
+    """Post one message through the shared client (None if Slack is not configured)"""
     # Get environment variables
     slack_token = os.getenv("SLACK_TOKEN")
     slack_user_id = os.getenv("SLACK_USER_ID")
 
-    if not slack_token:
+    # 재생/합성 모드는 실제로 보내지 않으므로 토큰 없이도 진행
+    offline = provider.is_offline()
+    if not slack_token and not offline:
         print("Error: SLACK_TOKEN environment variable not set")
         return None
-    if not slack_user_id:
+    if not slack_user_id and not offline:
         print("Error: SLACK_USER_ID environment variable not set")
         return None
 
+    with span("slack.post", kind="slack", channel=channel, bytes=len(text.encode())):
+        data = provider.slack_post(
+            get_client(),
+            SLACK_API_URL.rstrip("/") + "/chat.postMessage",
+            {"channel": channel, "text": text},
+            slack_token,
+            timeout=SLACK_TIMEOUT,
+        )
+
+    if not data.get("ok"):
+        raise SlackError(f"Slack chat.postMessage 실패: {data.get('error')}")
+    return data
+
+
+def upload_files(channel_id: str, files, comment: str = None):
+    """Upload [(path, title)] to a channel as one message (None if Slack is not configured)
+
+    files.getUploadURLExternal + upload per file, then one files.completeUploadExternal
+    """
+    slack_token = os.getenv("SLACK_TOKEN")
+    offline = provider.is_offline()
+    if not slack_token and not offline:
+        print("Error: SLACK_TOKEN environment variable not set")
+        return None
+
+    base_url = SLACK_API_URL.rstrip("/")
+    uploaded = []
+    with span("slack.upload", kind="slack", channel=channel_id, files=len(files)):
+        for path, title in files:
+            with open(path, "rb") as f:
+                content = f.read()
+            name = os.path.basename(path)
+            ticket = provider.slack_post(
+                get_client(),
+                base_url + "/files.getUploadURLExternal",
+                {"filename": name, "length": len(content)},
+                slack_token,
+                timeout=SLACK_TIMEOUT,
+                form=True,
+            )
+            if not ticket.get("ok"):
+                raise SlackError(f"Slack files.getUploadURLExternal 실패: {ticket.get('error')}")
+            provider.slack_upload(get_client(), ticket.get("upload_url"), content)
+            uploaded.append({"id": ticket.get("file_id", name), "title": title})
+
+        payload = {"files": json.dumps(uploaded), "channel_id": channel_id}
+        if comment:
+            payload["initial_comment"] = comment
+        data = provider.slack_post(
+            get_client(),
+            base_url + "/files.completeUploadExternal",
+            payload,
+            slack_token,
+            timeout=SLACK_TIMEOUT,
+            form=True,
+        )
+
+    if not data.get("ok"):
+        raise SlackError(f"Slack files.completeUploadExternal 실패: {data.get('error')}")
+    return data
+
+
+def set_send_enabled(enabled: bool):
+    """Turn Slack posting on/off (off: messages are only printed, e.g. --no-send)"""
+    global _send_enabled
+    _send_enabled = enabled
+
+
+def deliver(channel: str, text: str, report: str = None):
+    """Queue the message when the outbox is running, otherwise post it right away
+
+    report: body recorded with result_cache.remember_post once Slack accepted the post
+    """
+    if not _send_enabled:
+        print(f"[no-send] #{channel}\n{text}\n")
+        return None
+    if slack_outbox.is_running():
+        slack_outbox.enqueue(channel, text, report)
+        return None
+    data = post_message(channel, text)
+    if data and report is not None:
+        remember_delivered(channel, report)
+    return data
+
+
+def remember_delivered(channel: str, report: str):
+    """Mark `report` as posted to the channel (post-on-change compares against it)"""
+    from module import result_cache
+
+    result_cache.remember_post(channel, report)
+
+
+def slackout_summary(message: str):
+    """Send summary message to main summary channel only (no individual channel)"""
     current_time = get_data_freshness()
-    client = slack_sdk.WebClient(token=slack_token)
 
     # 요약 채널에만 보냄 (개별 채널 전송 없음)
     summary_msg = f"📊 *일일 시장 요약* {current_time}\n{message}"
     summary_channel = "summary"
-    response = client.chat_postMessage(channel=summary_channel, text=summary_msg)
-    return response
+    return deliver(summary_channel, summary_msg)
 
 
 def slackout(message: str, channel_tag: str, channel: str):
     """Send message to Slack with optional channel selection"""
-    # Get environment variables
-    slack_token = os.getenv("SLACK_TOKEN")
-    slack_user_id = os.getenv("SLACK_USER_ID")
+    from module import result_cache
 
-    if not slack_token:
-        print("Error: SLACK_TOKEN environment variable not set")
-        return None
-    if not slack_user_id:
-        print("Error: SLACK_USER_ID environment variable not set")
+    # 결과 캐시용으로 리포트 본문 기록, 변경 시에만 전송하는 채널은 같은 본문이면 생략
+    result_cache.captured(channel_tag, channel, message)
+    if result_cache.is_unchanged(channel, message):
+        print(f"♻️ #{channel}: 이전과 같은 리포트 → 전송 생략")
         return None
 
     current_time = get_data_freshness()
-    client = slack_sdk.WebClient(token=slack_token)
 
     # 공통 포맷
     slack_msg = f"<{channel_tag}> {current_time} \n{message}"
 
     # 개별 채널에 보냄 (알림 음소거 상태)
+    # 전송이 성공한 뒤에만 "보낸 리포트"로 기록 (실패하면 다음 실행에서 다시 보냄)
     extra_channel = channel
-    response = client.chat_postMessage(channel=extra_channel, text=slack_msg)
-    return response
+    return deliver(extra_channel, slack_msg, report=message)
+
+
+def repost(messages):
+    """Send reports captured by module.result_cache again (cache hit)"""
+    for item in messages:
+        slackout(item["message"], channel_tag=item["channel_tag"], channel=item["channel"])
 
 
-# 각 스크립트에 마지막 업데이트 시간 표시 추가
+# 각 스크립트에 데이터 기준 시각 표시 (분석 스레드 밖에서는 현재 시각)
 def get_data_freshness():
-    from datetime import timezone, timedelta
+    from module import freshness
+    from module.market_calendar import KST
 
-    # KST는 UTC+9
-    kst = timezone(timedelta(hours=9))
-    current_time = datetime.now(kst)
-    return current_time.strftime("%Y-%m-%d %H:%M:%S KST")
+    return freshness.label() or provider.now(KST).strftime("%Y-%m-%d %H:%M:%S KST")
 
 
 # === 0번 시리즈: 기본 지표/데이터 ===
@@ -105,6 +235,17 @@ def slackout_charts(message: str):
     return slackout(message, channel_tag="#C01CHARTS01", channel="1-charts")
 
 
+def slackout_chart_files(files, comment: str = None):
+    """Upload [(path, title)] chart images to the charts channel in one message"""
+    if not _send_enabled:
+        print(f"[no-send] #1-charts 차트 {len(files)}개\n" + "\n".join(path for path, _ in files))
+        return None
+    if not CHARTS_CHANNEL_ID:
+        print(f"♦️ NOTITEE_CHARTS_CHANNEL_ID 미설정 → 차트 {len(files)}개 업로드 생략")
+        return None
+    return upload_files(CHARTS_CHANNEL_ID, files, comment)
+
+
 def slackout_api(message: str):
     """Send message to API channel"""
     return slackout(message, channel_tag="#C01API0001", channel="1-api")
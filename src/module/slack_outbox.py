@@ -0,0 +1,131 @@
+import atexit
+import json
+import queue
+import threading
+import sys, os
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+# 비동기 Slack 발송함: 모듈은 메시지를 넣고 바로 진행, 백그라운드 스레드가 순서대로 전송
+# 종료 시까지 보내지 못한 메시지는 스풀 파일에 저장했다가 다음 실행 시작 시 다시 보낸다.
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+SPOOL_FILE = os.path.join(
+    os.getenv("NOTITEE_CACHE_DIR", os.path.join(ROOT_DIR, ".cache")),
+    "slack_spool.jsonl",
+)
+FLUSH_TIMEOUT = 60  # 초
+
+_STOP = object()
+_lock = threading.Lock()
+_failed_lock = threading.Lock()
+_stopping = threading.Event()  # 지금 보내는 메시지까지만 끝내고 종료
+_queue = queue.Queue()
+_failed = []
+_thread = None
+
+
+def is_running():
+    return _thread is not None
+
+
+def start():
+    """Start the background sender and queue anything spooled by the previous run"""
+    global _thread
+    with _lock:
+        if _thread is not None:
+            return
+        spooled = _read_spool()
+        for item in spooled:
+            _queue.put(item)
+        if spooled:
+            print(f"📮 이전 실행에서 못 보낸 Slack 메시지 {len(spooled)}건 재전송")
+
+        _stopping.clear()
+        _thread = threading.Thread(target=_sender, name="slack-outbox", daemon=True)
+        _thread.start()
+        atexit.register(flush)
+
+
+def enqueue(channel, text, report=None):
+    """Queue a message for the background sender
+
+    report: body to record as posted (slack.remember_delivered) after Slack accepted it
+    """
+    item = {"channel": channel, "text": text}
+    if report is not None:
+        item["report"] = report
+    _queue.put(item)
+
+
+def flush(timeout=FLUSH_TIMEOUT):
+    """Wait for the queue to drain, then spool whatever is still undelivered"""
+    global _thread
+    with _lock:
+        thread = _thread
+        if thread is None:
+            return
+        _queue.put(_STOP)
+        thread.join(timeout)
+        if thread.is_alive():
+            # 시간 초과: 보내는 중인 메시지가 끝날 때까지만 기다림
+            # (중간에 스냅샷을 뜨면 같은 메시지를 스풀하고 전송하거나, 실패 기록을 놓침)
+            _stopping.set()
+            thread.join()
+        _thread = None
+
+        # 큐에 남은 메시지 + 전송 실패 메시지를 스풀에 저장
+        with _failed_lock:
+            pending = list(_failed)
+            _failed.clear()
+        while True:
+            try:
+                item = _queue.get_nowait()
+            except queue.Empty:
+                break
+            if item is not _STOP:
+                pending.append(item)
+        _write_spool(pending)
+        if pending:
+            print(f"📮 Slack 메시지 {len(pending)}건 미전송 → 다음 실행 시 재전송")
+
+
+def _sender():
+    from module.slack import post_message, remember_delivered
+
+    while not _stopping.is_set():
+        item = _queue.get()
+        if item is _STOP:
+            return
+        try:
+            data = post_message(item["channel"], item["text"])
+            if data and item.get("report") is not None:
+                remember_delivered(item["channel"], item["report"])
+        except Exception as e:
+            print(f"♦️ Slack 전송 실패 ({item['channel']}): {e}")
+            with _failed_lock:
+                _failed.append(item)
+
+
+def _read_spool():
+    try:
+        with open(SPOOL_FILE, encoding="utf-8") as f:
+            items = [json.loads(line) for line in f if line.strip()]
+        os.remove(SPOOL_FILE)
+        return items
+    except (OSError, ValueError):
+        return []
+
+
+def _write_spool(items):
+    if not items:
+        return
+    try:
+        os.makedirs(os.path.dirname(SPOOL_FILE), exist_ok=True)
+        tmp_path = f"{SPOOL_FILE}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            for item in items:
+                f.write(json.dumps(item, ensure_ascii=False) + "\n")
+        os.replace(tmp_path, SPOOL_FILE)
+    except OSError as e:
+        print(f"♦️ Slack 스풀 저장 실패: {e}")
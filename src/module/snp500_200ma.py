@@ -1,19 +1,39 @@
 from datetime import datetime, date, timedelta
-import yfinance as yf
+import pandas as pd
+
+from module import indicator_state
+from module.crossover import recent_crosses
+from module.support_resistance import support_resistance_panel
+from module.price_panel import get_history
 from module.slack import slackout_sp500
 
 import sys, os
 
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+# 크로스 이벤트 보관 기간 (일, 가격 패널 조회기간과 같음)
+CROSS_DAYS = 365
+
+# 실행 전 가격 패널에 등록할 (티커, 조회기간) 목록
+PRICE_NEEDS = [("^GSPC", CROSS_DAYS)]
+
+# 실행 간 이어서 갱신하는 지표 상태 (module.indicator_state)
+SR_LOOKBACK = 30  # 지지/저항 분석 기간 (봉)
+INDICATORS = {
+    "ma50": ("sma", 50, "Close"),
+    "ma200": ("sma", 200, "Close"),
+    "50/200": ("cross", CROSS_DAYS, ["ma50", "ma200"]),
+    "dates": ("recent", 5, "date"),
+    "closes": ("recent", SR_LOOKBACK, "Close"),
+    "ma200_recent": ("recent", SR_LOOKBACK, "ma200"),
+}
+
 
 def get_sp500_200ma(ticker="^GSPC"):
     """Get S&P500 200-day moving average"""
     try:
         # Download ~300 trading days to ensure we have 200 days
-        data = yf.download(
-            ticker, period="300d", interval="1d", progress=False, auto_adjust=True
-        )
+        data = get_history(ticker, days=300)
         if data.empty:
             raise RuntimeError("Failed to download S&P500 data")
 
@@ -63,46 +83,39 @@ def get_advanced_ma_analysis():
     """Advanced S&P500 moving average analysis with Golden/Death Cross"""
     try:
         # 더 많은 데이터 다운로드 (50MA + 200MA + 여유분)
-        data = yf.download("^GSPC", period="1y", interval="1d", progress=False, auto_adjust=True)
+        data = get_history("^GSPC", days=CROSS_DAYS)
         
         if data.empty or len(data) < 200:
             return None
         
         close_prices = data["Close"].dropna()
         
-        # 50일, 200일 이동평균 계산
-        ma_50 = close_prices.rolling(window=50).mean()
-        ma_200 = close_prices.rolling(window=200).mean()
+        # 50일, 200일 이동평균/크로스 (지난 실행 이후 새 봉만 반영)
+        state = indicator_state.latest("sp500", "^GSPC", data, INDICATORS)
         
         # 현재 값들
         current_price = float(close_prices.iloc[-1].item())
-        current_ma50 = float(ma_50.iloc[-1].item())
-        current_ma200 = float(ma_200.iloc[-1].item())
+        current_ma50 = state["ma50"].value
+        current_ma200 = state["ma200"].value
         
-        # 골든크로스/데스크로스 체크 (최근 5일 내)
-        cross_signal = None
-        for i in range(-5, 0):
-            if len(ma_50) > abs(i) and len(ma_200) > abs(i):
-                prev_50 = float(ma_50.iloc[i-1].item())
-                prev_200 = float(ma_200.iloc[i-1].item())
-                curr_50 = float(ma_50.iloc[i].item())
-                curr_200 = float(ma_200.iloc[i].item())
-                
-                # 골든 크로스 (50MA가 200MA를 상향 돌파)
-                if prev_50 <= prev_200 and curr_50 > curr_200:
-                    cross_signal = "golden"
-                    break
-                # 데스 크로스 (50MA가 200MA를 하향 돌파)  
-                elif prev_50 >= prev_200 and curr_50 < curr_200:
-                    cross_signal = "death"
-                    break
+        # 골든크로스/데스크로스: 최근 CROSS_DAYS일 이벤트 중 최근 5일 내 첫 신호
+        cross_events = indicator_state.cross_table(state, ["50/200"], "^GSPC")
+        recent = recent_crosses(cross_events, indicator_state.dates(state["dates"]), 5)
+        cross_signal = recent["direction"].iloc[0] if not recent.empty else None
+        last_cross = (
+            (cross_events.index[-1][1], cross_events["direction"].iloc[-1])
+            if not cross_events.empty
+            else None
+        )
         
         return {
             'current_price': current_price,
             'ma_50': current_ma50,
             'ma_200': current_ma200,
             'cross_signal': cross_signal,
-            'data': close_prices
+            'last_cross': last_cross,
+            'data': pd.Series(state["closes"].values),
+            'ma_recent': list(state["ma200_recent"].values),
         }
         
     except Exception as e:
@@ -110,38 +123,24 @@ def get_advanced_ma_analysis():
         return None
 
 
-def analyze_support_resistance(price, ma200, historical_data):
-    """Analyze 200MA as support/resistance level"""
+def analyze_support_resistance(
+    price, ma200, historical_data, ma_window=200, lookback=30, tolerance=0.03, ma=None
+):
+    """Analyze the rolling MA (default 200MA) as support/resistance level
+
+    ma: precomputed MA values aligned with historical_data (optional)
+    """
     try:
-        # 최근 30일간 200MA 근처에서의 반응 분석 (더 많은 데이터로 개선)
-        recent_data = historical_data.tail(30)
-        
-        # 실제 200MA와 비교 (전달받은 ma200 값 사용)
-        tolerance = 0.03  # ±3%로 관대하게 설정
-        near_ma_touches = 0
-        bounces = 0
-        
-        # 디버깅을 위한 정보
-        touch_details = []
-        
-        for i in range(len(recent_data)-1):
-            current_price = recent_data.iloc[i].item()
-            next_price = recent_data.iloc[i+1].item()
-            
-            # 200MA와의 거리 계산 (퍼센트)
-            price_diff = abs((current_price - ma200) / ma200)
-            
-            if price_diff <= tolerance:  # 200MA 근처 터치
-                near_ma_touches += 1
-                touch_details.append(f"{current_price:.2f} vs {ma200:.2f}")
-                
-                # 다음날 반등/반락 여부 확인
-                if current_price < ma200 and next_price > current_price:
-                    # 200MA 아래에서 반등
-                    bounces += 1
-                elif current_price > ma200 and next_price < current_price:
-                    # 200MA 위에서 저항받아 하락 (이것도 200MA의 영향력)
-                    bounces += 1
+        # 최근 30일간 롤링 MA 근처에서의 반응 분석 (±3% 허용)
+        stats = support_resistance_panel(
+            historical_data,
+            ma_window=ma_window,
+            lookback=lookback,
+            tolerance=tolerance,
+            ma=ma,
+        ).iloc[0]
+        near_ma_touches = int(stats['touches'])
+        bounces = int(stats['bounces'])
         
         # 지지/저항 강도 계산
         if near_ma_touches > 0:
@@ -200,7 +199,9 @@ def snp500_200ma_main():
         diff_50 = ((current_price - ma_50) / ma_50) * 100
         
         # 지지/저항 분석
-        support_analysis = analyze_support_resistance(current_price, ma_200, analysis['data'])
+        support_analysis = analyze_support_resistance(
+            current_price, ma_200, analysis['data'], lookback=SR_LOOKBACK, ma=analysis['ma_recent']
+        )
         
         # 투자 결정 로직 (Perplexity 기반)
         if cross_signal == "golden":
@@ -235,6 +236,12 @@ def snp500_200ma_main():
             cross_msg = f"\n📈 50MA가 200MA 위 ({((ma_50/ma_200-1)*100):+.1f}%)"
         else:
             cross_msg = f"\n📉 50MA가 200MA 아래 ({((ma_50/ma_200-1)*100):+.1f}%)"
+
+        # 마지막 50/200 크로스 날짜
+        if analysis['last_cross']:
+            cross_date, cross_direction = analysis['last_cross']
+            cross_name = "골든크로스" if cross_direction == "golden" else "데스크로스"
+            cross_msg += f"\n🗓️ 마지막 크로스: {cross_date:%Y-%m-%d} ({cross_name})"
         
         # 지지/저항 표시 방식 개선
         if support_analysis['touches'] > 0:
@@ -0,0 +1,50 @@
+import numpy as np
+import pandas as pd
+
+from module.indicators import sma
+import sys, os
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+# 이동평균선(롤링 MA 시리즈)을 지지/저항선으로 보고 터치/반등을 벡터 연산으로 집계
+def support_resistance_panel(closes, ma_window=200, lookback=30, tolerance=0.03, ma=None):
+    """Touches, bounces and bounce rate (%) against the rolling MA for every column
+
+    lookback: number of recent bars to study (None = full history)
+    ma: MA values aligned with closes (skips the rolling mean, e.g. from indicator_state)
+    """
+    if isinstance(closes, pd.Series):
+        closes = closes.to_frame()
+    if ma is None:
+        ma = sma(closes, ma_window)
+    ma = np.asarray(ma, dtype=float).reshape(len(closes), -1)
+    prices = closes.to_numpy(dtype=float)
+
+    if lookback is not None:
+        prices = prices[-lookback:]
+        ma = ma[-lookback:]
+
+    # 각 봉(current)과 다음 봉(next)을 같은 날의 MA와 비교
+    current, following, level = prices[:-1], prices[1:], ma[:-1]
+    valid = ~np.isnan(current) & ~np.isnan(following) & ~np.isnan(level)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        distance = np.abs((current - level) / level)
+    touch = valid & (distance <= tolerance)
+
+    # MA 아래에서 반등하거나, MA 위에서 저항받아 하락하면 MA의 영향력으로 본다
+    bounce = touch & (
+        ((current < level) & (following > current))
+        | ((current > level) & (following < current))
+    )
+
+    touches = touch.sum(axis=0)
+    bounces = bounce.sum(axis=0)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        bounce_rate = np.where(touches > 0, bounces / touches * 100, 0.0)
+
+    return pd.DataFrame(
+        {"touches": touches, "bounces": bounces, "bounce_rate": bounce_rate},
+        index=closes.columns,
+    )
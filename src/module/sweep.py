@@ -0,0 +1,217 @@
+from concurrent.futures import ProcessPoolExecutor
+from itertools import product
+from multiprocessing import shared_memory
+import numpy as np
+import pandas as pd
+
+from module import backtest
+from module.support_resistance import support_resistance_panel
+import sys, os
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+# 모듈 임계값(매직 넘버) 그리드를 프로세스 풀에서 백테스트하는 스윕 실행기
+# 가격 이력은 (날짜 x 시리즈) float64 배열 하나를 공유 메모리에 올리고,
+# 워커는 이름으로 붙기만 한다 (DataFrame을 작업마다 피클링하지 않음).
+# 첫 열은 날짜(1970-01-01 기준 일수), 나머지는 티커별 종가 (없는 날은 NaN)
+DAY_COLUMN = "day"
+
+# 신호별 기본 그리드 (현재 모듈 값 포함)
+GRIDS = {
+    "feargreed": {"buy": [20, 25, 30, 35, 40, 45], "sell": [60, 65, 70, 75, 80, 85, 90]},
+    "dollar": {"band": [2, 3, 4, 5, 6, 7, 8, 10], "window": ["180D", "365D", "730D"]},
+    "ma_stage": {"short": [3, 5, 10], "mid": [15, 20, 30], "long": [40, 60, 120]},
+    "support_resistance": {
+        "tolerance": [0.01, 0.02, 0.03, 0.04, 0.05],
+        "ma_window": [50, 100, 200],
+    },
+    "inflation": {"strong": [6, 8, 10, 12], "mild": [2, 3, 4, 5]},
+}
+# 신호별 필요 시리즈 (공유 배열의 열 이름)
+INPUTS = {
+    "feargreed": ["^GSPC", "feargreed"],
+    "dollar": ["DX=F", "USDKRW=X"],
+    "ma_stage": ["^GSPC"],
+    "support_resistance": ["^GSPC"],
+    "inflation": list(backtest.INFLATION_WEIGHTS),
+}
+# 순위 기준 (높을수록 좋음)
+RANK_BY = {"support_resistance": "bounce_rate"}
+DEFAULT_RANK = "cagr"
+
+# 워커 프로세스 전역 (initializer에서 설정)
+_shm = None
+_panel = None
+_columns = None
+_series = {}
+
+
+def combinations(signal, grid):
+    """Valid parameter dicts of the grid (ordered windows / bands only)"""
+    names = list(grid)
+    for values in product(*(grid[name] for name in names)):
+        params = dict(zip(names, values))
+        if _valid(signal, params):
+            yield params
+
+
+def share(frame):
+    """Copy a (date x series) frame into shared memory → (segment, spec for workers)"""
+    days = (frame.index.normalize() - pd.Timestamp("1970-01-01")).days
+    values = np.column_stack([np.asarray(days, dtype=float), frame.to_numpy(dtype=float)])
+    shm = shared_memory.SharedMemory(create=True, size=max(values.nbytes, 1))
+    np.ndarray(values.shape, dtype=np.float64, buffer=shm.buf)[:] = values
+    return shm, (shm.name, values.shape, [DAY_COLUMN, *frame.columns])
+
+
+def attach(spec):
+    """Worker initializer: map the shared array without copying it"""
+    global _shm, _panel, _columns, _series
+    name, shape, columns = spec
+    _shm = shared_memory.SharedMemory(name=name)
+    _panel = np.ndarray(shape, dtype=np.float64, buffer=_shm.buf)
+    _columns = {column: i for i, column in enumerate(columns)}
+    _series = {}
+
+
+def evaluate(task):
+    """(signal, params) → metrics row, reading prices from the attached array"""
+    signal, params = task
+    try:
+        row = _EVALUATORS[signal](**params)
+    except Exception as e:
+        row = {"error": str(e)}
+    return {"signal": signal, **params, **row}
+
+
+def sweep(frame, grids, workers=None, rank=None):
+    """{signal: ranked results table} for every combination of each signal's grid
+
+    frame: aligned closes (date x series) with the columns in INPUTS
+    grids: {signal: {param: [values]}}
+    rank: metric to sort by (default: cagr, bounce_rate for support_resistance)
+    """
+    tasks = [
+        (signal, params)
+        for signal, grid in grids.items()
+        if all(column in frame.columns for column in INPUTS[signal])
+        for params in combinations(signal, grid)
+    ]
+    if not tasks:
+        return {}
+
+    workers = workers or os.cpu_count() or 1
+    shm, spec = share(frame)
+    try:
+        if workers <= 1:
+            # 같은 프로세스에서 실행 (디버깅/프로파일링용)
+            attach(spec)
+            try:
+                rows = [evaluate(task) for task in tasks]
+            finally:
+                _detach()
+        else:
+            # 작업이 작으므로 묶어서 보냄 (워커당 약 8묶음)
+            chunksize = max(1, len(tasks) // (workers * 8))
+            with ProcessPoolExecutor(
+                max_workers=workers, initializer=attach, initargs=(spec,)
+            ) as executor:
+                rows = list(executor.map(evaluate, tasks, chunksize=chunksize))
+    finally:
+        shm.close()
+        shm.unlink()
+
+    results = {}
+    for signal in grids:
+        table = pd.DataFrame([row for row in rows if row["signal"] == signal])
+        if table.empty:
+            continue
+        metric = rank or RANK_BY.get(signal, DEFAULT_RANK)
+        table = table.drop(columns="signal")
+        if metric in table:
+            table = table.sort_values(metric, ascending=False, na_position="last", kind="stable")
+        table.insert(0, "rank", range(1, len(table) + 1))
+        results[signal] = table.reset_index(drop=True)
+    return results
+
+
+def _detach():
+    global _shm, _panel, _series
+    _panel, _series = None, {}
+    if _shm is not None:
+        _shm.close()
+        _shm = None
+
+
+def _get(column):
+    """Series of one column (NaN days dropped), cached per worker"""
+    if column not in _series:
+        values = _panel[:, _columns[column]]
+        mask = ~np.isnan(values)
+        index = pd.to_datetime(_panel[mask, 0], unit="D")
+        _series[column] = pd.Series(values[mask], index=index, name=column)
+    return _series[column]
+
+
+def _valid(signal, params):
+    if signal == "feargreed":
+        return params["buy"] < params["sell"]
+    if signal == "ma_stage":
+        return params["short"] < params["mid"] < params["long"]
+    if signal == "inflation":
+        return params["mild"] < params["strong"]
+    return True
+
+
+def _trade(close, signal):
+    labels, directions = signal
+    return backtest.equity(close, backtest.position(labels, directions))
+
+
+def _feargreed(buy, sell):
+    close = _get("^GSPC")
+    index = _get("feargreed").reindex(close.index)
+    return _trade(close, backtest.fear_greed_signal(index, buy=buy, sell=sell))
+
+
+def _dollar(band, window):
+    krw = _get("USDKRW=X")
+    return _trade(krw, backtest.dollar_gap_signal(_get("DX=F"), krw, band=band, window=window))
+
+
+def _ma_stage(short, mid, long):
+    close = _get("^GSPC")
+    return _trade(close, backtest.ma_stage_signal(close, windows=(short, mid, long)))
+
+
+def _support_resistance(tolerance, ma_window):
+    # 전체 기간의 MA 터치/반등 (모듈은 최근 30봉만 봄)
+    stats = support_resistance_panel(
+        _get("^GSPC"), ma_window=ma_window, lookback=None, tolerance=tolerance
+    ).iloc[0]
+    return {
+        "touches": int(stats["touches"]),
+        "bounces": int(stats["bounces"]),
+        "bounce_rate": float(stats["bounce_rate"]),
+    }
+
+
+def _inflation(strong, mild):
+    closes = {ticker: _get(ticker) for ticker in backtest.INFLATION_WEIGHTS}
+    if "inflation:change" not in _series:
+        _series["inflation:change"] = backtest.commodity_change(closes)
+        _series["inflation:basket"] = backtest.commodity_basket(closes)
+    change = _series["inflation:change"]
+    basket = _series["inflation:basket"]
+    signal = backtest.inflation_signal(change.reindex(basket.index).dropna(), strong, mild)
+    return _trade(basket, signal)
+
+
+_EVALUATORS = {
+    "feargreed": _feargreed,
+    "dollar": _dollar,
+    "ma_stage": _ma_stage,
+    "support_resistance": _support_resistance,
+    "inflation": _inflation,
+}
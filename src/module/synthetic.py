@@ -0,0 +1,182 @@
+from datetime import timedelta
+from functools import lru_cache
+import zlib
+import numpy as np
+import pandas as pd
+import sys, os
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+# 합성 OHLCV 데이터 (provider "synthetic" 모드 / 규모 테스트용)
+# - 티커별 고정 시드의 시계열 (같은 티커는 조회 구간과 상관없이 같은 가격)
+# - 종목 유형별로 실제와 비슷한 수준/변동성: 지수·주식·암호화폐는 추세가 있는 랜덤워크,
+#   환율·원자재는 기준 수준으로 돌아오는 로그 가격, 국채 수익률은 0% 위에서 평균 회귀하는 % 수준
+# - 달러 지수와 환율, 만기별 수익률은 공통 요인을 같이 써서 함께 움직인다
+# - 주말/휴장일 제외 (암호화폐 "-USD" 티커는 매일 거래)
+# - 가끔 발생하는 갭, 결측(NaN) 봉
+ANCHOR = pd.Timestamp("2015-01-02")  # 모든 시계열의 시작점
+HOLIDAYS_PER_YEAR = 9
+GAP_PROB = 0.01  # 하루에 갭이 생길 확률
+GAP_SCALE = 0.04  # 갭 크기 (표준편차, 로그 가격 / 수익률은 %p 단위로 YIELD_GAP)
+NAN_PROB = 0.003  # 봉 하나가 비어 있을 확률
+AR_BLOCK = 256  # 평균 회귀 시계열을 블록 단위로 계산 (keep ** -t 가 커지지 않게)
+
+# 유형별 (일간 변동성 범위, 일간 추세, 평균 회귀 속도, 공통 요인, 공통 요인 변동성)
+KINDS = {
+    "stock": ((0.008, 0.04), 0.0002, 0.0, None, 0.0),
+    "index": ((0.009, 0.012), 0.0003, 0.0, None, 0.0),
+    "crypto": ((0.025, 0.04), 0.0008, 0.0, None, 0.0),
+    "fx": ((0.002, 0.003), 0.0, 0.004, "dollar", 0.003),
+    "commodity": ((0.012, 0.02), 0.0001, 0.002, None, 0.0),
+}
+# 알려진 티커의 시작 수준 (평균 회귀 유형은 돌아오는 기준 수준)
+LEVELS = {
+    "^GSPC": 2050.0,
+    "DX=F": 97.0,
+    "USDKRW=X": 1180.0,
+    "GC=F": 1250.0,
+    "CL=F": 60.0,
+    "HG=F": 2.9,
+    "ZW=F": 5.5,
+    "BTC-USD": 300.0,
+    "ETH-USD": 10.0,
+    "SOL-USD": 1.0,
+}
+
+# 국채 수익률 (%): 만기별 평균 수준 + 공통 금리 요인(만기별 민감도) + 만기별 스프레드 요인
+YIELDS = {"^IRX": (2.0, 1.3), "^FVX": (2.6, 1.1), "^TNX": (3.0, 1.0), "^TYX": (3.4, 0.85)}
+RATES_VOL, RATES_KEEP = 0.05, 0.998  # 공통 요인: 일간 %p 변동, 자기 상관
+TERM_VOL, TERM_KEEP = 0.02, 0.995  # 만기별 요인
+YIELD_GAP = 0.1  # 수익률 갭 크기 (%p)
+YIELD_FLOOR = 0.01
+
+
+def is_crypto(ticker):
+    return ticker.endswith("-USD")
+
+
+def kind(ticker):
+    """Instrument type used for the synthetic level/volatility"""
+    if ticker in YIELDS:
+        return "yield"
+    if is_crypto(ticker):
+        return "crypto"
+    if ticker.endswith("=X") or ticker == "DX=F":
+        return "fx"
+    if ticker.endswith("=F"):
+        return "commodity"
+    if ticker.startswith("^"):
+        return "index"
+    return "stock"
+
+
+def generate(ticker, start, end, seed=0):
+    """OHLCV frame for [start, end) with Close/High/Low/Open/Volume columns"""
+    start = pd.Timestamp(start)
+    end = pd.Timestamp(end)
+    if end <= ANCHOR:
+        return pd.DataFrame(columns=["Close", "High", "Low", "Open", "Volume"])
+
+    days = _trading_days(ANCHOR, end - timedelta(days=1), crypto=is_crypto(ticker))
+    n = len(days)
+
+    # 항목별로 독립된 난수 스트림 → 조회 끝 날짜가 달라도 앞부분 값은 동일
+    params, ret_rng, gap_rng, jump_rng, open_rng, high_rng, low_rng, vol_rng, nan_rng = [
+        np.random.default_rng(child)
+        for child in np.random.SeedSequence([zlib.crc32(ticker.encode()), seed]).spawn(9)
+    ]
+    gaps = gap_rng.random(n) < GAP_PROB
+    jumps = np.where(gaps, jump_rng.normal(0, 1, n), 0.0)
+
+    if kind(ticker) == "yield":
+        # 수준(%)을 직접 만들고, 시가/고가/저가 잡음은 수준 대비 비율로
+        mean, loading = YIELDS[ticker]
+        rates = _ar1(_factor("rates", n, seed) * RATES_VOL, RATES_KEEP)
+        term = _ar1(ret_rng.normal(0, TERM_VOL, n) + jumps * YIELD_GAP, TERM_KEEP)
+        close = np.maximum(mean + loading * rates + term, YIELD_FLOOR)
+        price0 = close[0]
+        vol = 0.015
+    else:
+        vol_range, drift, revert, factor, factor_vol = KINDS[kind(ticker)]
+        price0 = LEVELS.get(ticker) or params.uniform(5, 500)
+        vol = params.uniform(*vol_range)
+        shocks = ret_rng.normal(0, vol, n) + jumps * GAP_SCALE
+        if factor:
+            shocks += _factor(factor, n, seed) * factor_vol
+        # 로그 가격 = 시작 수준 + 추세 + (평균 회귀하는) 누적 충격
+        close = price0 * np.exp(drift * np.arange(n) + _ar1(shocks, 1.0 - revert))
+
+    # 시가는 전일 종가 + 갭, 고가/저가는 시가/종가 바깥으로
+    open_ = np.empty(n)
+    open_[0] = price0
+    open_[1:] = close[:-1] * np.exp(open_rng.normal(0, vol / 4, n)[1:])
+    high = np.maximum(open_, close) * (1 + np.abs(high_rng.normal(0, vol / 2, n)))
+    low = np.minimum(open_, close) * (1 - np.abs(low_rng.normal(0, vol / 2, n)))
+    volume = np.round(vol_rng.lognormal(13, 1, n))
+
+    frame = pd.DataFrame(
+        {"Close": close, "High": high, "Low": low, "Open": open_, "Volume": volume},
+        index=pd.DatetimeIndex(days, name="Date"),
+    )
+    frame.loc[nan_rng.random(n) < NAN_PROB] = np.nan
+    return frame.loc[frame.index >= start]
+
+
+def download(tickers, start, end, seed=0):
+    """yf.download-shaped frame ((Price, Ticker) columns) of synthetic data"""
+    parts = []
+    for ticker in tickers:
+        frame = generate(ticker, start, end, seed)
+        frame.columns = pd.MultiIndex.from_product(
+            [frame.columns, [ticker]], names=["Price", "Ticker"]
+        )
+        parts.append(frame)
+    if not parts:
+        return pd.DataFrame()
+    return pd.concat(parts, axis=1).sort_index()
+
+
+def fear_greed_value(name, day, seed=0):
+    """Deterministic 0-100 index value for a given day"""
+    rng = np.random.default_rng(zlib.crc32(f"{name}:{day}".encode()) ^ seed)
+    return int(rng.integers(0, 101))
+
+
+def _factor(name, n, seed):
+    # 같은 요인을 쓰는 티커끼리 공유하는 표준 정규 충격 (티커와 무관한 시드)
+    return np.random.default_rng([zlib.crc32(name.encode()), seed]).normal(0, 1, n)
+
+
+def _ar1(shocks, keep):
+    # x_t = keep * x_(t-1) + shocks_t (keep=1 → 누적합), 블록마다 벡터 연산
+    if keep >= 1:
+        return np.cumsum(shocks)
+    out = np.empty(len(shocks))
+    carry = 0.0
+    for i in range(0, len(shocks), AR_BLOCK):
+        block = shocks[i : i + AR_BLOCK]
+        powers = keep ** np.arange(1, len(block) + 1)
+        out[i : i + len(block)] = powers * (carry + np.cumsum(block / powers))
+        carry = out[i + len(block) - 1]
+    return out
+
+
+@lru_cache(maxsize=64)
+def _trading_days(start, end, crypto=False):
+    days = pd.date_range(start, end, freq="D")
+    if crypto:
+        return days
+    weekdays = days[days.dayofweek < 5]
+    return weekdays[~weekdays.isin(_holidays(start.year, end.year))]
+
+
+def _holidays(first_year, last_year):
+    # 연도마다 고정된 임의 평일 휴장일
+    holidays = []
+    for year in range(first_year, last_year + 1):
+        rng = np.random.default_rng(year)
+        days = pd.date_range(f"{year}-01-01", f"{year}-12-31", freq="D")
+        weekdays = days[days.dayofweek < 5]
+        holidays.extend(rng.choice(weekdays, HOLIDAYS_PER_YEAR, replace=False))
+    return pd.DatetimeIndex(holidays)
@@ -0,0 +1,100 @@
+from contextlib import contextmanager
+from datetime import datetime
+import json
+import threading
+import time
+import uuid
+import sys, os
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+# 실행 단계별 소요시간 추적 (모듈 / yf.download / HTTP 호출 / Slack 전송)
+# NOTITEE_TRACE_FILE: span을 JSON lines로 추가 기록할 파일
+# NOTITEE_TIMING_FOOTER=1: 요약 메시지 끝에 한 줄 소요시간 표시
+TRACE_FILE = os.getenv("NOTITEE_TRACE_FILE")
+TIMING_FOOTER = os.getenv("NOTITEE_TIMING_FOOTER") == "1"
+
+_lock = threading.Lock()
+_local = threading.local()
+_spans = []
+_run_id = uuid.uuid4().hex[:12]
+
+
+@contextmanager
+def span(name, kind="internal", **attrs):
+    """Time a block; the yielded dict can be filled with extra fields (rows, bytes, ...)"""
+    stack = getattr(_local, "stack", None)
+    if stack is None:
+        stack = _local.stack = []
+
+    record = {
+        "name": name,
+        "kind": kind,
+        "parent": stack[-1]["name"] if stack else None,
+        "thread": threading.current_thread().name,
+        "start": datetime.now().isoformat(timespec="milliseconds"),
+        **attrs,
+    }
+    stack.append(record)
+    started = time.perf_counter()
+    try:
+        yield record
+    except BaseException as e:
+        record["error"] = f"{type(e).__name__}: {e}"
+        raise
+    finally:
+        record["duration_ms"] = round((time.perf_counter() - started) * 1000, 2)
+        stack.pop()
+        with _lock:
+            _spans.append(record)
+
+
+def spans():
+    """Copy of every finished span in this run"""
+    with _lock:
+        return list(_spans)
+
+
+def reset():
+    global _run_id
+    with _lock:
+        _spans.clear()
+        _run_id = uuid.uuid4().hex[:12]
+
+
+def export_jsonl(path=None):
+    """Append this run's spans to a JSON lines file"""
+    path = path or TRACE_FILE
+    if not path:
+        return
+    try:
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        with open(path, "a", encoding="utf-8") as f:
+            for record in spans():
+                f.write(json.dumps({"run_id": _run_id, **record}, ensure_ascii=False))
+                f.write("\n")
+    except OSError as e:
+        print(f"♦️ 트레이스 저장 실패: {e}")
+
+
+def total_ms(kind):
+    """Sum of span durations of one kind"""
+    return sum(record["duration_ms"] for record in spans() if record["kind"] == kind)
+
+
+def timing_footer(total_seconds):
+    """One-line timing summary for the Slack summary message"""
+    modules = sorted(
+        (record for record in spans() if record["kind"] == "module"),
+        key=lambda record: record["duration_ms"],
+        reverse=True,
+    )
+    slowest = ", ".join(
+        f"{record['name']} {record['duration_ms'] / 1000:.1f}s" for record in modules[:3]
+    )
+    return (
+        f"⏱️ 총 {total_seconds:.1f}s | 다운로드 {total_ms('download') / 1000:.1f}s"
+        f" | HTTP {total_ms('http') / 1000:.1f}s | Slack {total_ms('slack') / 1000:.1f}s"
+        + (f" | 느린 모듈: {slowest}" if slowest else "")
+    )
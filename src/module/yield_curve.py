@@ -0,0 +1,119 @@
+from itertools import combinations
+import numpy as np
+import pandas as pd
+
+from module.price_panel import get_closes
+import sys, os
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+# 국채 수익률 곡선 엔진
+# 만기별 수익률을 날짜로 정렬한 (날짜 x 만기) 행렬 하나로 올리고,
+# 모든 만기 쌍의 스프레드를 전체 기간에 대해 한 번의 배열 연산으로 계산한다.
+# 스프레드 단위는 bp (수익률 % 차이 x 100), 이름은 "장기-단기" (예: "10Y-3M")
+TENORS = [
+    ("^IRX", "3M"),
+    ("^FVX", "5Y"),
+    ("^TNX", "10Y"),
+    ("^TYX", "30Y"),
+]
+HISTORY_DAYS = 365 * 30  # 백분위/역전 이력용 조회기간
+
+
+def matrix(tickers=None, days=HISTORY_DAYS):
+    """Date-aligned (date x ticker) frame of yields (%) loaded from the price panel once"""
+    tickers = tickers or [ticker for ticker, _ in TENORS]
+    return get_closes(tickers, days=days).dropna(how="all")
+
+
+def tenors(yields):
+    """The TENORS columns of a yield matrix, renamed to their labels (short tenor first)"""
+    present = [(ticker, label) for ticker, label in TENORS if ticker in yields.columns]
+    curve = yields[[ticker for ticker, _ in present]]
+    curve.columns = [label for _, label in present]
+    return curve.dropna(how="all")
+
+
+def spreads(curve):
+    """(date x "long-short") frame of every tenor-pair spread in bp (curve: tenors())"""
+    pairs = list(combinations(range(curve.shape[1]), 2))
+    short = [i for i, _ in pairs]
+    long = [j for _, j in pairs]
+    values = curve.to_numpy(dtype=float)
+    # 모든 쌍을 한 번에: (날짜 x 쌍) = 장기 열 - 단기 열
+    diff = (values[:, long] - values[:, short]) * 100
+    names = [f"{curve.columns[j]}-{curve.columns[i]}" for i, j in pairs]
+    return pd.DataFrame(diff, index=curve.index, columns=names)
+
+
+def percentiles(table):
+    """Where each column's latest value ranks in its own history (%, higher = wider)"""
+    values = table.to_numpy(dtype=float)
+    valid = ~np.isnan(values)
+    latest = table.ffill().iloc[-1].to_numpy(dtype=float)
+    with np.errstate(invalid="ignore"):
+        at_or_below = ((values <= latest) & valid).sum(axis=0)
+        counts = valid.sum(axis=0)
+        ranks = np.where(counts > 0, at_or_below / np.maximum(counts, 1) * 100, np.nan)
+    return pd.Series(ranks, index=table.columns)
+
+
+def inversions(spread):
+    """Inversion (spread < 0) episodes of one spread series → stats dict
+
+    inverted/since/days: the current streak (calendar days since it started)
+    episodes, longest_days/longest_start, last_end: history of past episodes
+    """
+    spread = spread.dropna()
+    if spread.empty:
+        return None
+    inverted = (spread.to_numpy() < 0).astype(np.int8)
+    dates = spread.index
+
+    # 연속 구간 경계: 시작 = 0→1, 끝 = 1→0 (끝 인덱스는 구간의 마지막 봉)
+    starts = np.flatnonzero(np.diff(np.r_[0, inverted]) == 1)
+    ends = np.flatnonzero(np.diff(np.r_[inverted, 0]) == -1)
+    lengths = (dates[ends] - dates[starts]).days + 1 if len(starts) else np.array([], int)
+
+    stats = {
+        "inverted": bool(inverted[-1]),
+        "since": None,
+        "days": 0,
+        "episodes": int(len(starts)),
+        "longest_days": 0,
+        "longest_start": None,
+        "last_end": None,
+        "history_start": dates[0].date(),
+    }
+    if len(starts):
+        longest = int(np.argmax(lengths))
+        stats["longest_days"] = int(lengths[longest])
+        stats["longest_start"] = dates[starts[longest]].date()
+        if inverted[-1]:
+            stats["since"] = dates[starts[-1]].date()
+            stats["days"] = int((dates[-1] - dates[starts[-1]]).days + 1)
+            past = ends[:-1]
+        else:
+            past = ends
+        if len(past):
+            stats["last_end"] = dates[past[-1]].date()
+    return stats
+
+
+def analyze(yields=None):
+    """Latest spreads with their historical percentile and inversion state, per pair"""
+    table = spreads(tenors(matrix() if yields is None else yields))
+    if table.empty:
+        return {}
+    ranks = percentiles(table)
+    latest = table.ffill().iloc[-1]
+    return {
+        name: {
+            "spread_bp": float(latest[name]),
+            "percentile": float(ranks[name]),
+            **(inversions(table[name]) or {}),
+        }
+        for name in table.columns
+        if not np.isnan(latest[name])
+    }
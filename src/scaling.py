@@ -0,0 +1,215 @@
+"""Scaling harness: run analyses on N synthetic tickers and record wall time / peak memory"""
+
+import argparse
+import contextlib
+import gc
+import json
+import math
+import sys, os
+import time
+import tracemalloc
+from datetime import datetime
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from module import provider
+
+SIZES = [10, 100, 1000, 5000]
+SUPERLINEAR = 1.15  # 크기가 늘어날 때 시간 증가 지수가 이보다 크면 초선형으로 표시
+
+
+def _crypto(n):
+    from module import crypto_analysis as module
+
+    tickers = [f"SYN{i:05d}-USD" for i in range(n)]
+    patch = {"CRYPTOS": [(t, f"Synthetic {i}", "◎") for i, t in enumerate(tickers)]}
+    return module, patch, tickers, module.crypto_analysis_main
+
+
+def _commodities(n):
+    from module import commodities as module
+
+    tickers = [f"SYN{i:05d}=F" for i in range(n)]
+    patch = {"COMMODITIES": [(t, f"Synthetic {i}", "🔶", "$") for i, t in enumerate(tickers)]}
+    return module, patch, tickers, module.commodities_main
+
+
+def _bonds(n):
+    from module import bond_yields as module
+
+    tickers = [f"^SYN{i:05d}" for i in range(n)]
+    patch = {"BONDS": [(t, f"Synthetic {i}", "🇺🇸") for i, t in enumerate(tickers)]}
+    return module, patch, tickers, module.bond_yields_main
+
+
+def _ma_stage(n):
+    from module import ma_stage_analysis as module
+
+    tickers = [f"SYN{i:05d}" for i in range(n)]
+
+    def run():
+        for ticker in tickers:
+            module.analyze_ma_stage(ticker)
+
+    return module, {}, tickers, run
+
+
+TARGETS = {
+    "crypto": _crypto,
+    "commodities": _commodities,
+    "bonds": _bonds,
+    "ma_stage": _ma_stage,
+}
+
+
+@contextlib.contextmanager
+def _patched(module, attrs):
+    saved = {name: getattr(module, name) for name in attrs}
+    try:
+        for name, value in attrs.items():
+            setattr(module, name, value)
+        yield
+    finally:
+        for name, value in saved.items():
+            setattr(module, name, value)
+
+
+def run_once(target, n, seed=0, memory=False):
+    """Prefetch + analyse n synthetic tickers; returns seconds per phase (and peak MB)"""
+    from module import indicator_state, price_panel
+
+    module, patch, tickers, entry = TARGETS[target](n)
+    provider.configure("synthetic", seed=seed)
+    price_panel.reset()
+    indicator_state.reset()  # 지표 상태를 처음부터 만드는 비용까지 측정
+    gc.collect()
+
+    if memory:
+        tracemalloc.start()
+    try:
+        with _patched(module, patch), open(os.devnull, "w") as devnull:
+            with contextlib.redirect_stdout(devnull):
+                started = time.perf_counter()
+                days = getattr(module, "HISTORY_DAYS", 365)  # 모듈이 실제로 읽는 기간
+                price_panel.register(
+                    [(ticker, days) for ticker in tickers] + getattr(module, "PRICE_NEEDS", [])
+                )
+                price_panel.prefetch()
+                fetched = time.perf_counter()
+                entry()
+                finished = time.perf_counter()
+        result = {
+            "fetch_s": round(fetched - started, 4),
+            "analysis_s": round(finished - fetched, 4),
+            "total_s": round(finished - started, 4),
+        }
+        if memory:
+            result["peak_mb"] = round(tracemalloc.get_traced_memory()[1] / 2**20, 2)
+        return result
+    finally:
+        if memory:
+            tracemalloc.stop()
+        price_panel.reset()
+
+
+def run(targets, sizes, seed=0, memory=True):
+    """Time (and separately trace memory of) every target at every size"""
+    results = {}
+    for target in targets:
+        results[target] = {}
+        for n in sizes:
+            # tracemalloc은 실행을 느리게 하므로 시간과 메모리는 따로 측정
+            point = run_once(target, n, seed)
+            if memory:
+                point["peak_mb"] = run_once(target, n, seed, memory=True)["peak_mb"]
+            results[target][n] = point
+            print(
+                f"  {target:<12} n={n:>5}  {point['total_s']:8.2f}s"
+                f" (fetch {point['fetch_s']:.2f}s, 분석 {point['analysis_s']:.2f}s)"
+                + (f"  peak {point['peak_mb']:.1f}MB" if memory else "")
+            )
+    return results
+
+
+def exponents(points, key="analysis_s"):
+    """Local scaling exponent log(t2/t1) / log(n2/n1) between consecutive sizes"""
+    sizes = sorted(points)
+    slopes = []
+    for small, large in zip(sizes, sizes[1:]):
+        before, after = points[small][key], points[large][key]
+        if before <= 0 or after <= 0:
+            continue
+        slopes.append((small, large, math.log(after / before) / math.log(large / small)))
+    return slopes
+
+
+def report(results):
+    print("\n📈 규모 증가 지수 (분석 시간 기준, 1.0 = 선형)")
+    for target, points in results.items():
+        for small, large, slope in exponents(points):
+            flag = " ♦️ 초선형" if slope > SUPERLINEAR else ""
+            print(f"  {target:<12} {small:>5} → {large:<5} {slope:5.2f}{flag}")
+
+
+def plot(results, path):
+    """Log-log scaling curves (time and peak memory) as a PNG"""
+    import matplotlib
+
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+
+    has_memory = any("peak_mb" in p for points in results.values() for p in points.values())
+    fig, axes = plt.subplots(1, 2 if has_memory else 1, figsize=(12 if has_memory else 6, 4.5))
+    axes = axes if has_memory else [axes]
+    for target, points in results.items():
+        sizes = sorted(points)
+        axes[0].plot(sizes, [points[n]["total_s"] for n in sizes], marker="o", label=target)
+        if has_memory:
+            axes[1].plot(sizes, [points[n]["peak_mb"] for n in sizes], marker="o", label=target)
+    axes[0].set_ylabel("wall time (s)")
+    if has_memory:
+        axes[1].set_ylabel("peak memory (MB)")
+    for ax in axes:
+        ax.set_xscale("log")
+        ax.set_yscale("log")
+        ax.set_xlabel("tickers")
+        ax.grid(True, which="both", alpha=0.3)
+        ax.legend()
+    fig.tight_layout()
+    fig.savefig(path, dpi=120)
+    plt.close(fig)
+    print(f"📄 그래프 저장: {path}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--targets", nargs="+", choices=list(TARGETS), default=list(TARGETS))
+    parser.add_argument("--sizes", nargs="+", type=int, default=SIZES)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--no-memory", action="store_true", help="skip the tracemalloc pass")
+    parser.add_argument("--out", default="scaling.json", help="where to save the results")
+    parser.add_argument("--plot", help="also save log-log scaling curves to this PNG")
+    args = parser.parse_args(argv)
+
+    print(f"⏱️ 합성 데이터 규모 테스트 (seed {args.seed})")
+    results = run(args.targets, sorted(args.sizes), args.seed, memory=not args.no_memory)
+    report(results)
+
+    with open(args.out, "w", encoding="utf-8") as f:
+        json.dump(
+            {
+                "created": datetime.now().isoformat(timespec="seconds"),
+                "seed": args.seed,
+                "results": results,
+            },
+            f,
+            ensure_ascii=False,
+            indent=2,
+        )
+    print(f"\n📄 결과 저장: {args.out}")
+    if args.plot:
+        plot(results, args.plot)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""Cold-start import time report based on python -X importtime"""
+
+import argparse
+import subprocess
+import sys, os
+import time
+
+SRC_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def measure(only=None):
+    """Import fetcher plus the selected analysis modules in a fresh interpreter"""
+    code = (
+        "import fetcher\n"
+        "from module import registry\n"
+        f"for analysis in registry.select({only!r}):\n"
+        "    registry.load(analysis)\n"
+    )
+    env = {**os.environ, "PYTHONPATH": SRC_DIR}
+
+    started = time.perf_counter()
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=SRC_DIR,
+        env=env,
+        capture_output=True,
+        text=True,
+    )
+    wall = time.perf_counter() - started
+    if result.returncode != 0:
+        raise RuntimeError(result.stderr.strip().splitlines()[-1])
+
+    imports = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        # "import time: self | cumulative | <들여쓰기>name"
+        parts = line.split("|")
+        depth = (len(parts[2]) - len(parts[2].lstrip()) - 1) // 2
+        imports.append(
+            {
+                "name": parts[2].strip(),
+                "self_us": int(parts[0].split(":")[1]),
+                "cumulative_us": int(parts[1]),
+                "depth": depth,
+            }
+        )
+    return wall, imports
+
+
+def report(label, wall, imports, top=10):
+    total_us = sum(item["cumulative_us"] for item in imports if item["depth"] == 0)
+    print(f"\n⏱️ {label}: 인터프리터 {wall * 1000:.0f}ms | import 합계 {total_us / 1000:.0f}ms")
+
+    print(f"  최상위 import (누적 기준 상위 {top})")
+    top_level = [item for item in imports if item["depth"] == 0]
+    for item in sorted(top_level, key=lambda item: item["cumulative_us"], reverse=True)[:top]:
+        print(f"    {item['cumulative_us'] / 1000:8.1f}ms  {item['name']}")
+
+    print(f"  개별 모듈 (자체 시간 기준 상위 {top})")
+    for item in sorted(imports, key=lambda item: item["self_us"], reverse=True)[:top]:
+        print(f"    {item['self_us'] / 1000:8.1f}ms  {item['name']}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--only", nargs="+", help="measure only these modules")
+    parser.add_argument("--top", type=int, default=10)
+    args = parser.parse_args()
+
+    wall, imports = measure()
+    report("전체 모듈", wall, imports, args.top)
+
+    if args.only:
+        wall, imports = measure(args.only)
+        report(f"선택 모듈 ({', '.join(args.only)})", wall, imports, args.top)
+
+
+if __name__ == "__main__":
+    main()
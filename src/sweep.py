@@ -0,0 +1,129 @@
+"""Parameter sweep: backtest grids of the modules' thresholds on a process pool"""
+
+import argparse
+import json
+import sys, os
+import time
+from datetime import datetime, timedelta
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from module import provider
+from backtest import DEFAULT_START, load_closes, load_fear_greed
+
+
+def parse_values(text):
+    """"20,25,30" or inclusive range "20:40:5" → list (ints when possible)"""
+    if ":" in text:
+        start, stop, step = (float(part) for part in text.split(":"))
+        count = int(round((stop - start) / step)) + 1
+        values = [round(start + i * step, 10) for i in range(count)]
+    else:
+        values = []
+        for part in text.split(","):
+            try:
+                values.append(float(part))
+            except ValueError:
+                values.append(part)  # 예: 롤링 창 "365D"
+    return [int(v) if isinstance(v, float) and v.is_integer() else v for v in values]
+
+
+def build_grids(signals, overrides):
+    """Default grids with "signal.param=values" overrides applied"""
+    from module.sweep import GRIDS
+
+    grids = {signal: dict(GRIDS[signal]) for signal in signals}
+    for override in overrides:
+        target, _, values = override.partition("=")
+        signal, _, param = target.partition(".")
+        if signal not in GRIDS or param not in GRIDS[signal]:
+            raise SystemExit(f"알 수 없는 파라미터: {target}")
+        if signal in grids:
+            grids[signal][param] = parse_values(values)
+    return grids
+
+
+def load_frame(signals, start, end, fear_greed_csv=None):
+    """Aligned (date x series) closes for the selected signals"""
+    import pandas as pd
+    from module.sweep import INPUTS
+
+    columns = {column for signal in signals for column in INPUTS[signal]}
+    series = load_closes(sorted(columns - {"feargreed"}), start, end)
+    if "feargreed" in columns:
+        index = load_fear_greed(fear_greed_csv, start, end)
+        if index is None:
+            print("♦️ 공포탐욕 이력 없음 (--fear-greed CSV로 지정 가능) → feargreed 제외")
+        else:
+            series["feargreed"] = index
+    return pd.concat(series, axis=1, sort=True)
+
+
+def report(results, top):
+    for signal, table in results.items():
+        print(f"\n🏁 {signal} ({len(table)}개 조합, 상위 {min(top, len(table))})")
+        print(table.head(top).to_string(index=False, float_format=lambda v: f"{v:.4g}"))
+
+
+def main(argv=None):
+    from module.sweep import GRIDS, sweep
+
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--signals", nargs="+", choices=list(GRIDS), default=list(GRIDS))
+    parser.add_argument(
+        "--param",
+        action="append",
+        default=[],
+        metavar="SIGNAL.NAME=VALUES",
+        help='grid override, e.g. feargreed.buy=20:45:1 or dollar.window=180D,365D',
+    )
+    parser.add_argument("--start", default=DEFAULT_START)
+    parser.add_argument("--end", default=None, help="exclusive end date (default: tomorrow)")
+    parser.add_argument("--fear-greed", help="CSV with date,value columns of CNN Fear & Greed")
+    parser.add_argument("--workers", type=int, default=None, help="default: CPU count")
+    parser.add_argument("--rank", help="metric to rank by (default: cagr / bounce_rate)")
+    parser.add_argument("--top", type=int, default=10)
+    parser.add_argument("--synthetic", type=int, metavar="SEED", help="use generated prices")
+    parser.add_argument("--out", help="also save the full ranked tables as JSON")
+    args = parser.parse_args(argv)
+
+    if args.synthetic is not None:
+        provider.configure("synthetic", seed=args.synthetic)
+    end = args.end or str(provider.today() + timedelta(days=1))
+    grids = build_grids(args.signals, args.param)
+
+    frame = load_frame(args.signals, args.start, end, args.fear_greed)
+    started = time.perf_counter()
+    results = sweep(frame, grids, args.workers, args.rank)
+    elapsed = time.perf_counter() - started
+    report(results, args.top)
+
+    total = sum(len(table) for table in results.values())
+    print(
+        f"\n⏱️ {total}개 조합 {elapsed:.2f}s ({total / max(elapsed, 1e-9):.0f}/s,"
+        f" 워커 {args.workers or os.cpu_count()})"
+    )
+
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as f:
+            json.dump(
+                {
+                    "created": datetime.now().isoformat(timespec="seconds"),
+                    "start": args.start,
+                    "end": end,
+                    "grids": grids,
+                    "results": {
+                        signal: table.to_dict(orient="records")
+                        for signal, table in results.items()
+                    },
+                },
+                f,
+                ensure_ascii=False,
+                indent=2,
+                default=float,
+            )
+        print(f"📄 결과 저장: {args.out}")
+
+
+if __name__ == "__main__":
+    main()
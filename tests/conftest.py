@@ -0,0 +1,4 @@
+import sys, os
+
+# src/ 아래 스크립트와 같이 `from module import ...`로 불러옴
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
@@ -0,0 +1,41 @@
+from datetime import timedelta
+
+import pandas as pd
+import pytest
+
+import bench
+from module import provider, sentiment, synthetic
+
+
+@pytest.fixture
+def bundle(tmp_path):
+    """Small fixture bundle (S&P500 prices + CNN history) written the way --record does"""
+    path = tmp_path / "bundle"
+    provider.configure("record", str(path))
+    end = pd.Timestamp(provider.today() + timedelta(days=1))
+    prices = synthetic.download(["^GSPC"], end - pd.Timedelta(days=800), end, seed=7)
+    provider._record_prices(prices)
+    url = f"{sentiment.CNN_URL}/{sentiment.CNN_HISTORY_START}"
+    provider._record_response(f"cnn {url}", provider._synthetic_fear_greed("cnn", url, None, url))
+    provider.save()
+    yield str(path)
+    provider.configure("live")
+
+
+def test_bench_run_and_compare(bundle, tmp_path):
+    only = ["sp500", "ma_stage", "feargreed"]
+    result = bench.run(bundle, only=only, repeat=2, warmup=0)
+
+    for section in ("results", "warm"):
+        assert sorted(result[section]) == sorted(only)
+        for phases in result[section].values():
+            assert set(phases) == set(bench.PHASES)
+            assert phases["total"] > 0
+    # 재생 모드에서 Slack 요청은 보내지 않고 기록만 됨
+    assert provider.slack_requests()
+    assert bench.compare(result, result) == []
+
+    out = tmp_path / "bench.json"
+    assert bench.main(["run", "--bundle", bundle, "--only", "sp500", "--repeat", "1",
+                       "--out", str(out)]) == 0
+    assert bench.main(["compare", str(out), str(out)]) == 0
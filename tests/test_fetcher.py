@@ -0,0 +1,80 @@
+import threading
+
+import pytest
+
+import fetcher
+from module import provider
+
+
+def _analysis(key, weight):
+    return {
+        "key": key,
+        "label": key,
+        "weight": weight,
+        "budget": 5,
+        "error_summary": f"{key}: 분석 오류",
+    }
+
+
+@pytest.fixture
+def modules(monkeypatch):
+    """Fake analyses: "slow" blocks until released, "quick" returns at once"""
+    provider.configure("synthetic")
+    release = threading.Event()
+    calls, recorded = [], []
+
+    def entry(key):
+        def run():
+            calls.append(key)
+            if key == "slow":
+                release.wait(5)
+            return f"{key}: 완료"
+
+        return run
+
+    monkeypatch.setattr(fetcher.registry, "entry_point", lambda analysis: entry(analysis["key"]))
+    monkeypatch.setattr(fetcher.freshness, "latest_bar", lambda analysis: None)
+    monkeypatch.setattr(fetcher.freshness, "observed", lambda analysis, bar: bar)
+    monkeypatch.setattr(
+        fetcher.freshness, "record", lambda analysis, bar, summary: recorded.append(analysis["key"])
+    )
+    monkeypatch.setattr(fetcher.deadline, "collect_timeout", lambda: 0.3)
+    yield calls, recorded, release
+    release.set()
+    _join_workers()
+    provider.configure("live")
+
+
+def _join_workers():
+    for thread in threading.enumerate():
+        if thread.name.startswith("analysis-"):
+            assert thread.daemon
+            thread.join(5)
+
+
+def test_late_analysis_is_timed_out_and_not_recorded(modules):
+    calls, recorded, release = modules
+    analyses = [_analysis("quick", 1), _analysis("slow", 2)]
+
+    summaries = fetcher.run_analyses(analyses, workers=2)
+
+    assert summaries == {"quick": "quick: 완료", "slow": "⏰ slow: 시간 초과"}
+    # 마감 후에 끝난 분석은 요약이 "시간 초과"로 나갔으므로 기록하지 않음
+    release.set()
+    _join_workers()
+    assert sorted(calls) == ["quick", "slow"]
+    assert recorded == ["quick"]
+
+
+def test_analysis_not_started_by_the_deadline_is_skipped(modules):
+    calls, recorded, release = modules
+    analyses = [_analysis("quick", 1), _analysis("slow", 2)]
+
+    # 워커 하나: 무거운 slow가 먼저 실행되고 quick은 마감까지 시작하지 못함
+    summaries = fetcher.run_concurrently(analyses, workers=1)
+
+    assert summaries == ["⏰ quick: 시간 초과", "⏰ slow: 시간 초과"]
+    release.set()
+    _join_workers()
+    assert calls == ["slow"]
+    assert recorded == []
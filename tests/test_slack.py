@@ -0,0 +1,110 @@
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+import requests
+
+from module import provider, rate_limit, result_cache, slack
+
+
+class SlackStub(BaseHTTPRequestHandler):
+    """Local Slack Web API stand-in answering with the server's scripted responses"""
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        self.server.requests.append(
+            {
+                "path": self.path,
+                "headers": dict(self.headers),
+                "body": json.loads(body or b"{}"),
+                "at": time.monotonic(),
+            }
+        )
+        status, headers, payload = self.server.responses.pop(0)
+        data = json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server(monkeypatch, tmp_path):
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), SlackStub)
+    httpd.requests = []
+    httpd.responses = []
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+
+    provider.configure("live")
+    monkeypatch.setenv("SLACK_TOKEN", "xoxb-test")
+    monkeypatch.setenv("SLACK_USER_ID", "U000")
+    monkeypatch.setattr(slack, "SLACK_API_URL", f"http://127.0.0.1:{httpd.server_port}/api/")
+    monkeypatch.setattr(slack, "_send_enabled", True)
+    # 호스트별 토큰 버킷/회로 차단기와 결과 캐시를 테스트마다 새로
+    monkeypatch.setattr(rate_limit, "_buckets", {})
+    monkeypatch.setattr(rate_limit, "_breakers", {})
+    monkeypatch.setattr(rate_limit, "BACKOFF_BASE", 0.01)
+    monkeypatch.setattr(result_cache, "STATE_FILE", str(tmp_path / "results.json"))
+    monkeypatch.setattr(result_cache, "_state", None)
+    yield httpd
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def _posted(channel):
+    return result_cache._load()["channels"].get(channel)
+
+
+def test_post_ok_records_report(server):
+    server.responses = [(200, {}, {"ok": True, "ts": "1.0"})]
+
+    data = slack.slackout("리포트 본문", channel_tag="#C000", channel="0-test")
+
+    assert data["ok"]
+    (request,) = server.requests
+    assert request["path"] == "/api/chat.postMessage"
+    assert request["headers"]["Authorization"] == "Bearer xoxb-test"
+    assert request["body"]["channel"] == "0-test"
+    assert request["body"]["text"].endswith("리포트 본문")
+    assert _posted("0-test") == result_cache._hash("리포트 본문")
+
+
+def test_rate_limited_post_waits_for_retry_after(server):
+    server.responses = [
+        (429, {"Retry-After": "1"}, {"ok": False, "error": "ratelimited"}),
+        (200, {}, {"ok": True}),
+    ]
+
+    data = slack.slackout("리포트 본문", channel_tag="#C000", channel="0-test")
+
+    assert data["ok"]
+    first, second = server.requests
+    assert second["at"] - first["at"] >= 0.9
+    assert _posted("0-test") == result_cache._hash("리포트 본문")
+
+
+def test_server_error_is_retried(server):
+    server.responses = [(503, {}, {"ok": False}), (200, {}, {"ok": True})]
+
+    assert slack.slackout("리포트 본문", channel_tag="#C000", channel="0-test")["ok"]
+    assert len(server.requests) == 2
+
+
+def test_failed_post_is_not_recorded(server):
+    server.responses = [(500, {}, {"ok": False})] * (rate_limit.MAX_RETRIES + 1)
+
+    with pytest.raises(requests.HTTPError):
+        slack.slackout("리포트 본문", channel_tag="#C000", channel="0-test")
+
+    assert len(server.requests) == rate_limit.MAX_RETRIES + 1
+    # 보내지 못한 리포트는 "보낸 것"으로 남지 않아야 다음 실행에서 다시 전송됨
+    assert _posted("0-test") is None